@@ -19,6 +19,14 @@ class Config:
     # Classification defaults
     CLASSIFICATION_TOP_N: int = int(os.getenv("CLASSIFICATION_TOP_N", "3"))
     CLASSIFICATION_THRESHOLD: float = float(os.getenv("CLASSIFICATION_THRESHOLD", "0.5"))
+    # pydantic-ai model identifier used for LLM classification
+    LLM_MODEL: str = os.getenv("LLM_MODEL", "openai:gpt-4o-mini")
+    # Maximum number of LLM classification requests in flight at once
+    CLASSIFICATION_CONCURRENCY: int = int(os.getenv("CLASSIFICATION_CONCURRENCY", "4"))
+    # Minimum cosine similarity for reusing a cached classification of a similar message
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    # How long exact-match LLM responses are reused
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
 
     # OpenAI / Embedding
     OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
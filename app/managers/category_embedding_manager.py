@@ -0,0 +1,37 @@
+"""
+Category embedding manager for CRUD operations on CategoryEmbeddingEntry entities.
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+
+from models import CategoryEmbeddingEntry
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryEmbeddingManager:
+    """Manages CRUD operations for CategoryEmbeddingEntry entities."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, provider: str, model: str, content_hash: str) -> CategoryEmbeddingEntry | None:
+        """Get the cached embedding for a provider, model and content hash."""
+        return self.session.get(CategoryEmbeddingEntry, (provider, model, content_hash))
+
+    def upsert(
+        self, provider: str, model: str, content_hash: str, vector: bytes
+    ) -> CategoryEmbeddingEntry:
+        """Create or replace the cached embedding for a provider, model and content hash."""
+        entry = self.get(provider, model, content_hash)
+        if entry is None:
+            entry = CategoryEmbeddingEntry(
+                provider=provider, model=model, content_hash=content_hash
+            )
+            self.session.add(entry)
+        entry.vector = vector
+        self.session.flush()
+        logger.debug(f"CategoryEmbeddingManager: Cached embedding {content_hash[:12]}")
+        return entry
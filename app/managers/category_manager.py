@@ -26,6 +26,13 @@ class CategoryManager:
         logger.debug(f"CategoryManager: Category '{name}' created with id={category.id}")
         return category
 
+    def bulk_create(self, categories: list[Category]) -> list[Category]:
+        """Add several categories with a single flush."""
+        logger.debug(f"CategoryManager: Bulk creating {len(categories)} categories")
+        self.session.add_all(categories)
+        self.session.flush()  # Flush to catch IntegrityError before commit
+        return categories
+
     def get_by_id(self, category_id: int) -> Category | None:
         """Get a category by ID."""
         return self.session.query(Category).filter(Category.id == category_id).first()
@@ -0,0 +1,45 @@
+"""
+Classification cache manager for CRUD operations on ClassificationCacheEntry entities.
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+
+from models import ClassificationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class ClassificationCacheManager:
+    """Manages CRUD operations for ClassificationCacheEntry entities."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create(
+        self, signature: str, embedding: list[float], matches: list[tuple[int, float, str]]
+    ) -> ClassificationCacheEntry:
+        """Create a new cache entry."""
+        entry = ClassificationCacheEntry(
+            signature=signature, embedding=embedding, matches=[list(match) for match in matches]
+        )
+        self.session.add(entry)
+        self.session.flush()
+        logger.debug(f"ClassificationCacheManager: Cached entry {entry.id}")
+        return entry
+
+    def get_by_signature(self, signature: str) -> list[ClassificationCacheEntry]:
+        """Get all cache entries computed for a signature."""
+        return (
+            self.session.query(ClassificationCacheEntry)
+            .filter(ClassificationCacheEntry.signature == signature)
+            .order_by(ClassificationCacheEntry.id)
+            .all()
+        )
+
+    def delete_all(self) -> int:
+        """Delete every cache entry, returning how many were removed."""
+        count = self.session.query(ClassificationCacheEntry).delete()
+        self.session.flush()
+        return count
@@ -0,0 +1,59 @@
+"""
+LLM cache manager for CRUD operations on LLMCacheEntry entities.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheManager:
+    """Manages CRUD operations for LLMCacheEntry entities."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, key: str, created_after: datetime | None = None) -> LLMCacheEntry | None:
+        """Get an entry by key, ignoring entries created before created_after."""
+        query = self.session.query(LLMCacheEntry).filter(LLMCacheEntry.key == key)
+        if created_after is not None:
+            query = query.filter(LLMCacheEntry.created_at >= created_after)
+        return query.first()
+
+    def upsert(self, key: str, response: dict) -> LLMCacheEntry:
+        """Create or replace the entry for a key, resetting its age and hit count."""
+        entry = self.session.get(LLMCacheEntry, key)
+        if entry is None:
+            entry = LLMCacheEntry(key=key)
+            self.session.add(entry)
+        entry.response = response
+        entry.hits = 0
+        entry.created_at = datetime.now(UTC)
+        self.session.flush()
+        logger.debug(f"LLMCacheManager: Cached response {key[:12]}")
+        return entry
+
+    def stats(self, created_after: datetime | None = None) -> tuple[int, int, int]:
+        """
+        Summarize the cache.
+
+        Returns:
+            Tuple of (total entries, entries created before created_after, total hits)
+        """
+        total, hits = self.session.query(
+            func.count(LLMCacheEntry.key), func.coalesce(func.sum(LLMCacheEntry.hits), 0)
+        ).one()
+        expired = 0
+        if created_after is not None:
+            expired = (
+                self.session.query(LLMCacheEntry)
+                .filter(LLMCacheEntry.created_at < created_after)
+                .count()
+            )
+        return total, expired, hits
@@ -3,14 +3,23 @@ Message manager for CRUD operations on Message entities.
 """
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from models import Message
 
 logger = logging.getLogger(__name__)
 
+# Built once and reused, so every bulk insert hits SQLAlchemy's compiled-statement cache
+# without rebuilding the statement or the attribute-to-column mapping
+_MESSAGE_INSERT = insert(Message.__table__)
+# (attribute name, column key) pairs; "sender" is stored in the "from" column
+_MESSAGE_COLUMNS = tuple(
+    (attr.key, attr.columns[0].key) for attr in Message.__mapper__.column_attrs
+)
+
 
 class MessageManager:
     """Manages CRUD operations for Message entities."""
@@ -55,12 +64,65 @@ class MessageManager:
         )
 
     def bulk_create(self, messages: list[Message]) -> None:
-        """Bulk insert messages into the database."""
+        """
+        Bulk insert messages into the database.
+
+        Rows go through a single Core INSERT executed with executemany, bypassing the ORM
+        unit of work. The Message objects are not added to the session.
+        """
         logger.debug(f"MessageManager: Bulk creating {len(messages)} messages")
-        self.session.add_all(messages)
-        self.session.flush()  # Flush to ensure messages are staged
+        if not messages:
+            return
+        rows = [
+            {column_key: getattr(message, attr_key) for attr_key, column_key in _MESSAGE_COLUMNS}
+            for message in messages
+        ]
+        self.session.execute(_MESSAGE_INSERT, rows)
         logger.debug(f"MessageManager: Bulk creation of {len(messages)} messages completed")
 
+    def replace_categories(
+        self, assignments: list[tuple[Message, list[tuple[int, float, str]]]]
+    ) -> None:
+        """
+        Replace the category assignments of several messages with two Core statements.
+
+        Old rows are removed with one DELETE and new rows written with one executemany
+        INSERT. The messages' loaded assignments are dropped from the session so they
+        reload on next access.
+
+        Args:
+            assignments: Pairs of (message, [(category_id, score, explanation), ...])
+        """
+        if not assignments:
+            return
+        from models import MessageCategory
+
+        table = MessageCategory.__table__
+        message_ids = [message.id for message, _ in assignments]
+        self.session.execute(delete(table).where(table.c.message_id.in_(message_ids)))
+
+        classified_at = datetime.now(UTC)
+        rows = [
+            {
+                "message_id": message.id,
+                "category_id": category_id,
+                "score": score,
+                "explanation": explanation,
+                "classified_at": classified_at,
+            }
+            for message, classifications in assignments
+            for category_id, score, explanation in classifications
+        ]
+        if rows:
+            self.session.execute(insert(table), rows)
+
+        for message, _ in assignments:
+            stale = list(message.message_categories)
+            self.session.expire(message, ["message_categories"])
+            for message_category in stale:
+                self.session.expunge(message_category)
+        logger.debug(f"MessageManager: Replaced categories for {len(message_ids)} messages")
+
     def get_by_id(self, message_id: str) -> Message | None:
         """Get a message by ID."""
         logger.debug(f"MessageManager: Retrieving message '{message_id[:30]}...'")
@@ -73,13 +135,32 @@ class MessageManager:
             .first()
         )
 
+    def get_by_ids(self, message_ids: list[str]) -> list[Message]:
+        """Get messages by ID in one query, in the order the IDs were given."""
+        logger.debug(f"MessageManager: Retrieving {len(message_ids)} messages by ID")
+        from models import MessageCategory
+
+        messages = (
+            self.session.query(Message)
+            .options(joinedload(Message.message_categories).joinedload(MessageCategory.category))
+            .filter(Message.id.in_(message_ids))
+            .all()
+        )
+        by_id = {message.id: message for message in messages}
+        return [by_id[message_id] for message_id in message_ids if message_id in by_id]
+
     def get_all(self, limit: int | None = None, offset: int | None = None) -> list[Message]:
-        """Get all messages with optional pagination."""
+        """
+        Get all messages with optional pagination.
+
+        Categories are loaded with one extra SELECT for the whole page, so LIMIT/OFFSET
+        apply to messages directly instead of to a joined row per category.
+        """
         from models import MessageCategory
 
         query = (
             self.session.query(Message)
-            .options(joinedload(Message.message_categories).joinedload(MessageCategory.category))
+            .options(selectinload(Message.message_categories).joinedload(MessageCategory.category))
             .order_by(Message.date.desc().nullslast())
         )
         if offset is not None:
@@ -94,7 +175,7 @@ class MessageManager:
 
         return (
             self.session.query(Message)
-            .options(joinedload(Message.message_categories).joinedload(MessageCategory.category))
+            .options(selectinload(Message.message_categories).joinedload(MessageCategory.category))
             .limit(n)
             .all()
         )
@@ -2,18 +2,24 @@
 Bootstrap service for initializing the system with sample data.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from app.services.categories_service import CategoriesService
-from app.services.messages_service import ClassificationOptions, MessagesService
+from app.services.messages_service import PREVIEW_SIZE, ClassificationOptions, MessagesService
 from app.stores.sqlite_store import SQLiteStore
 from app.utils.jsonl_parser import parse_iso_date
 from models import Category, Message
 
+if TYPE_CHECKING:
+    from app.services.classification import ClassificationService
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,10 +42,12 @@ class BootstrapService:
         store: SQLiteStore,
         messages_service: MessagesService,
         categories_service: CategoriesService,
+        classification_service: ClassificationService | None = None,
     ):
         self.store = store
         self.messages_service = messages_service
         self.categories_service = categories_service
+        self.classification_service = classification_service  # Only needed for auto-classify
 
     def bootstrap(
         self,
@@ -83,11 +91,12 @@ class BootstrapService:
             logger.warning(f"Categories file not found or not specified: {categories_file}")
 
         # Bootstrap messages
-        messages = []
+        message_ids: list[str] = []
+        preview_messages: list[Message] = []
         if messages_file and messages_file.exists():
             logger.info(f"Bootstrapping messages from {messages_file}")
-            messages = self._bootstrap_messages(messages_file)
-            logger.info(f"Loaded {len(messages)} messages")
+            message_ids, preview_messages = self._bootstrap_messages(messages_file)
+            logger.info(f"Loaded {len(message_ids)} messages")
         else:
             logger.warning(f"Messages file not found or not specified: {messages_file}")
 
@@ -97,41 +106,35 @@ class BootstrapService:
             classification_options
             and classification_options.auto_classify
             and categories
-            and messages
+            and message_ids
         ):
             logger.info(
                 f"Starting classification with top_n={classification_options.top_n}, "
                 f"threshold={classification_options.threshold}"
             )
             total_classified = asyncio.run(
-                self._classify_messages([msg.id for msg in messages], classification_options)
+                self._classify_messages(message_ids, classification_options)
             )
             logger.info(f"Classified {total_classified} messages")
 
         # Re-fetch preview messages to get updated categories
-        preview_messages = messages[:5]
         if total_classified > 0 and preview_messages:
             logger.debug("Refreshing preview messages from database")
-            # Refresh messages from database to get categories
             from app.managers.message_manager import MessageManager
 
-            session = self.store.create_session()
-            try:
-                manager = MessageManager(session)
-                # Get the first N messages with categories
-                preview_messages = manager.get_first_n(5)
-            finally:
-                session.close()
+            # Classification committed on the same session, so the reload sees its assignments
+            manager = MessageManager(self.messages_service.db_session)
+            preview_messages = manager.get_first_n(PREVIEW_SIZE)
 
         total_time = time.time() - start_time
         logger.info(
             f"Bootstrap completed in {total_time:.2f}s: "
-            f"{len(categories)} categories, {len(messages)} messages, {total_classified} classified"
+            f"{len(categories)} categories, {len(message_ids)} messages, {total_classified} classified"
         )
 
         return BootstrapResult(
             total_categories=len(categories),
-            total_messages=len(messages),
+            total_messages=len(message_ids),
             total_classified=total_classified,
             preview_messages=preview_messages,
             preview_categories=categories[:5],
@@ -146,25 +149,28 @@ class BootstrapService:
         start_time = time.time()
         from app.utils.jsonl_parser import parse_jsonl
 
-        def parse_category(data: dict) -> Category:
-            logger.debug(f"Creating category: {data.get('name', 'unknown')}")
-            result = self.categories_service.create_category(
-                name=data["name"], description=data["description"]
-            )
-            return result.category
+        def parse_category(data: dict) -> tuple[str, str]:
+            return data["name"], data["description"]
 
-        categories = parse_jsonl(file_path, parse_category)
+        # Create them all in one transaction rather than committing each category
+        categories = self.categories_service.create_categories(
+            parse_jsonl(file_path, parse_category)
+        )
         logger.info(f"Categories bootstrap took {time.time() - start_time:.2f}s")
         return categories
 
-    def _bootstrap_messages(self, file_path: Path) -> list[Message]:
+    def _bootstrap_messages(self, file_path: Path) -> tuple[list[str], list[Message]]:
         """
         Bootstrap messages from JSONL file.
 
-        Each line should have Gmail-style message format.
+        Each line should have Gmail-style message format. The file is streamed in
+        batches and only the first few messages are kept, for the preview.
+
+        Returns:
+            Tuple of (IDs of all created messages, preview messages)
         """
         start_time = time.time()
-        from app.utils.jsonl_parser import parse_jsonl
+        from app.utils.jsonl_parser import iter_jsonl_batches
 
         message_count = [0]  # Use list to allow mutation in nested function
 
@@ -190,64 +196,45 @@ class BootstrapService:
             )
             return result.message
 
-        messages = parse_jsonl(file_path, parse_message)
+        message_ids: list[str] = []
+        preview: list[Message] = []
+        for messages in iter_jsonl_batches(file_path, parse_message):
+            message_ids.extend(message.id for message in messages)
+            preview.extend(messages[: PREVIEW_SIZE - len(preview)])
         logger.info(f"Messages bootstrap took {time.time() - start_time:.2f}s")
-        return messages
+        return message_ids, preview
 
     async def _classify_messages(
         self, message_ids: list[str], classification_options: ClassificationOptions
     ) -> int:
         """
-        Classify a batch of messages.
+        Classify messages in batches, one LLM request per batch.
+
+        Uses the injected classification service, so its strategy (and any caches in
+        front of it) and its top_n and threshold settings apply.
 
         Returns the number of successfully classified messages.
+
+        Raises:
+            ValueError: If no classification service was injected
         """
-        start_time = time.time()
-        from app.services.classification import ClassificationService, LLMClassificationStrategy
+        if self.classification_service is None:
+            raise ValueError(
+                "Classification service must be injected to use auto-classification. "
+                "Pass a ClassificationService instance during BootstrapService initialization."
+            )
 
+        start_time = time.time()
         batch_size = 20
-        logger.info(
-            f"Classifying {len(message_ids)} messages using LLM strategy (batches of {batch_size})"
+        logger.info(f"Classifying {len(message_ids)} messages (batches of {batch_size})")
+        classified_count = await self.classification_service.classify_in_batches(
+            message_ids,
+            batch_size=batch_size,
+            max_concurrency=classification_options.max_concurrency,
         )
-        # Create a new session for classification batch operation
-        session = self.store.create_session()
-        try:
-            # Use LLM strategy for classification
-            llm_strategy = LLMClassificationStrategy(model="openai:gpt-4o-mini")
-            classification_service = ClassificationService(
-                session,
-                strategy=llm_strategy,
-                top_n=classification_options.top_n,
-                threshold=classification_options.threshold,
-            )
-
-            classified_count = 0
-            total_messages = len(message_ids)
-
-            # Process messages in batches of 20
-            for batch_idx in range(0, total_messages, batch_size):
-                batch = message_ids[batch_idx : batch_idx + batch_size]
-                batch_num = (batch_idx // batch_size) + 1
-                total_batches = (total_messages + batch_size - 1) // batch_size
-
-                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} messages)")
-
-                # Classify all messages in this batch concurrently
-                async def classify_one(msg_id: str) -> bool:
-                    try:
-                        await classification_service.classify_message_by_id(msg_id)
-                        return True
-                    except ValueError as e:
-                        logger.warning(f"Failed to classify message {msg_id}: {e}")
-                        return False
 
-                results = await asyncio.gather(*[classify_one(msg_id) for msg_id in batch])
-                classified_count += sum(results)
-
-            elapsed = time.time() - start_time
-            logger.info(
-                f"Classification completed in {elapsed:.2f}s ({elapsed / len(message_ids):.2f}s per message)"
-            )
-            return classified_count
-        finally:
-            session.close()
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Classification completed in {elapsed:.2f}s ({elapsed / len(message_ids):.2f}s per message)"
+        )
+        return classified_count
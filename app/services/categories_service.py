@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.managers.category_manager import CategoryManager
+from app.services.embedding_cache import CategoryEmbeddingCache
 from app.services.embedding_service import EmbeddingService
 from models import Category
 
@@ -28,7 +29,9 @@ class CategoriesService:
 
     def __init__(self, db_session: Session, embedding_service: EmbeddingService | None = None):
         self.db_session = db_session
-        self.embedding_service = embedding_service or EmbeddingService()
+        self.embedding_service = embedding_service or EmbeddingService(
+            category_cache=CategoryEmbeddingCache(db_session)
+        )
 
     def create_category(self, name: str, description: str) -> CategoryResult:
         """
@@ -66,6 +69,45 @@ class CategoriesService:
             logger.error(f"Failed to create category {name}: {e}")
             raise
 
+    def create_categories(self, categories: list[tuple[str, str]]) -> list[Category]:
+        """
+        Create several categories in a single transaction.
+
+        Args:
+            categories: (name, description) pairs
+
+        Returns:
+            The created categories, in input order
+
+        Raises:
+            ValueError: If any category name already exists (nothing is created)
+        """
+        start_time = time.time()
+        logger.debug(f"Creating {len(categories)} categories")
+
+        new_categories = []
+        for name, description in categories:
+            category = Category(name=name, description=description)
+            category.embedding = self.embedding_service.embed_category(category)
+            new_categories.append(category)
+
+        manager = CategoryManager(self.db_session)
+        try:
+            manager.bulk_create(new_categories)
+            self.db_session.commit()
+            logger.debug(
+                f"{len(new_categories)} categories created in {time.time() - start_time:.3f}s"
+            )
+            return new_categories
+        except IntegrityError as e:
+            self.db_session.rollback()
+            logger.error("Category names must be unique")
+            raise ValueError("One or more categories already exist") from e
+        except Exception as e:
+            self.db_session.rollback()
+            logger.error(f"Failed to create categories: {e}")
+            raise
+
     def get_category(self, category_id: int) -> CategoryResult | None:
         """
         Get a category by ID.
@@ -4,6 +4,8 @@ from app.services.classification.classification_service import (
     ClassificationResult,
     ClassificationService,
 )
+from app.services.classification.llm_cache import LLMResponseCache
+from app.services.classification.semantic_cache import SemanticCacheStrategy
 from app.services.classification.strategies import (
     ClassificationStrategy,
     EmbeddingSimilarityStrategy,
@@ -16,4 +18,6 @@ __all__ = [
     "ClassificationStrategy",
     "EmbeddingSimilarityStrategy",
     "LLMClassificationStrategy",
+    "LLMResponseCache",
+    "SemanticCacheStrategy",
 ]
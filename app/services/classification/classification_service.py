@@ -7,6 +7,7 @@ This service orchestrates the classification process:
 3. Persisting category assignments
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
@@ -17,6 +18,7 @@ from sqlalchemy.orm import Session
 from app.managers.category_manager import CategoryManager
 from app.managers.message_manager import MessageManager
 from app.services.classification.strategies import (
+    ClassificationMatch,
     ClassificationStrategy,
     LLMClassificationStrategy,
 )
@@ -165,6 +167,160 @@ class ClassificationService:
         # Classify using the main method
         return await self.classify_message(message=message, categories=categories, assign=assign)
 
+    async def classify_messages_by_ids(
+        self, message_ids: list[str], assign: bool = True
+    ) -> list[ClassificationResult]:
+        """
+        Classify several messages with one strategy call (fetches them and categories once).
+
+        Messages that don't exist or have no embedding are skipped with a warning.
+
+        Args:
+            message_ids: IDs of the messages to classify
+            assign: Whether to persist category assignments to the database
+
+        Returns:
+            One ClassificationResult per classified message, in input order
+
+        Raises:
+            ValueError: If no categories have embeddings
+        """
+        start_time = time.time()
+        messages = self._get_classifiable_messages(message_ids)
+        categories = self._get_classifiable_categories()
+
+        matches_per_message = await self.strategy.classify_batch_async(
+            messages=messages,
+            categories=categories,
+            top_n=self.top_n,
+            threshold=self.threshold,
+        )
+        results = self._apply_batch_matches(messages, matches_per_message, assign=assign)
+
+        logger.debug(f"Batch classified {len(results)} messages in {time.time() - start_time:.3f}s")
+        return results
+
+    async def classify_in_batches(
+        self, message_ids: list[str], batch_size: int = 20, max_concurrency: int = 4
+    ) -> int:
+        """
+        Classify and assign many messages, running several batches concurrently.
+
+        Only the strategy calls overlap. Category assignments are written and committed
+        one batch at a time afterwards, so concurrent batches never share an open
+        transaction on the session. Batches that fail with a ValueError are skipped.
+
+        Args:
+            message_ids: IDs of the messages to classify
+            batch_size: Number of messages per strategy call
+            max_concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Number of messages that were classified
+        """
+        try:
+            categories = self._get_classifiable_categories()
+        except ValueError as e:
+            logger.warning(f"Failed to classify {len(message_ids)} messages: {e}")
+            return 0
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def classify_batch(
+            batch: list[str],
+        ) -> tuple[list[Message], list[list[ClassificationMatch]]] | None:
+            async with semaphore:
+                messages = self._get_classifiable_messages(batch)
+                try:
+                    matches = await self.strategy.classify_batch_async(
+                        messages=messages,
+                        categories=categories,
+                        top_n=self.top_n,
+                        threshold=self.threshold,
+                    )
+                except ValueError as e:
+                    logger.warning(f"Failed to classify batch of {len(batch)} messages: {e}")
+                    return None
+                return messages, matches
+
+        batches = [
+            message_ids[start : start + batch_size]
+            for start in range(0, len(message_ids), batch_size)
+        ]
+        outcomes = await asyncio.gather(*[classify_batch(batch) for batch in batches])
+
+        classified = 0
+        for outcome in outcomes:
+            if outcome is not None:
+                classified += len(self._apply_batch_matches(*outcome, assign=True))
+        return classified
+
+    def _get_classifiable_messages(self, message_ids: list[str]) -> list[Message]:
+        """Fetch messages by ID, skipping (with a warning) missing ones and ones without embeddings."""
+        messages = MessageManager(self.db_session).get_by_ids(message_ids)
+        if len(messages) < len(message_ids):
+            logger.warning(f"{len(message_ids) - len(messages)} messages not found")
+
+        classifiable = []
+        for message in messages:
+            if message.embedding:
+                classifiable.append(message)
+            else:
+                logger.warning(f"Message {message.id} has no embedding")
+        return classifiable
+
+    def _get_classifiable_categories(self) -> list[Category]:
+        """
+        Fetch the categories that have embeddings.
+
+        Raises:
+            ValueError: If no categories have embeddings
+        """
+        categories = [cat for cat in CategoryManager(self.db_session).get_all() if cat.embedding]
+        if not categories:
+            logger.warning("No categories with embeddings found")
+            raise ValueError("No categories with embeddings found")
+        return categories
+
+    def _apply_batch_matches(
+        self,
+        messages: list[Message],
+        matches_per_message: list[list[ClassificationMatch]],
+        assign: bool,
+    ) -> list[ClassificationResult]:
+        """
+        Build results for a classified batch and optionally persist its assignments.
+
+        Args:
+            messages: Messages that were classified
+            matches_per_message: Strategy matches for each message, in the same order
+            assign: Whether to persist category assignments to the database
+
+        Returns:
+            One ClassificationResult per message
+        """
+        results = []
+        assignments = []
+        for message, matches in zip(messages, matches_per_message, strict=True):
+            results.append(
+                ClassificationResult(
+                    message=message,
+                    matched_categories=[match.category for match in matches],
+                    scores=[match.score for match in matches],
+                    explanations=[match.explanation for match in matches],
+                )
+            )
+            classifications = [
+                (match.category.id, match.score, match.explanation) for match in matches
+            ]
+            assignments.append((message, classifications))
+
+        if assign:
+            # One DELETE and one executemany INSERT for the whole batch
+            MessageManager(self.db_session).replace_categories(assignments)
+            self.db_session.commit()
+        return results
+
     def _assign_categories(
         self, message_id: str, classifications: list[tuple[int, float, str]]
     ) -> None:
@@ -175,27 +331,38 @@ class ClassificationService:
             message_id: Message ID
             classifications: List of tuples (category_id, score, explanation)
         """
-        from datetime import datetime
-
-        from models import MessageCategory
-
         message_manager = MessageManager(self.db_session)
 
         message = message_manager.get_by_id(message_id)
         if message:
-            # Clear existing message_categories associations
-            for mc in message.message_categories:
-                self.db_session.delete(mc)
-
-            # Create new associations with metadata
-            for category_id, score, explanation in classifications:
-                message_category = MessageCategory(
-                    message_id=message_id,
-                    category_id=category_id,
-                    score=score,
-                    explanation=explanation,
-                    classified_at=datetime.now(UTC),
-                )
-                self.db_session.add(message_category)
-
+            self._replace_categories(message, classifications)
             self.db_session.commit()
+
+    def _replace_categories(
+        self, message: Message, classifications: list[tuple[int, float, str]]
+    ) -> None:
+        """
+        Replace a message's category assignments (caller commits).
+
+        Args:
+            message: Message whose assignments are replaced
+            classifications: List of tuples (category_id, score, explanation)
+        """
+        from datetime import datetime
+
+        from models import MessageCategory
+
+        # Clear existing message_categories associations
+        for mc in message.message_categories:
+            self.db_session.delete(mc)
+
+        # Create new associations with metadata
+        for category_id, score, explanation in classifications:
+            message_category = MessageCategory(
+                message_id=message.id,
+                category_id=category_id,
+                score=score,
+                explanation=explanation,
+                classified_at=datetime.now(UTC),
+            )
+            self.db_session.add(message_category)
@@ -0,0 +1,76 @@
+"""
+Exact-match cache for LLM responses.
+
+Classification prompts are deterministic for a given message and category set, so a
+response can be reused whenever the exact same request is made again. Keys are a
+SHA-256 hash of the full request; entries expire after a TTL.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.managers.llm_cache_manager import LLMCacheManager
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Persistent exact-match cache for structured LLM responses."""
+
+    def __init__(self, session: Session, ttl_seconds: int = 24 * 60 * 60):
+        """
+        Initialize the response cache.
+
+        Args:
+            session: Database session for reading and writing cache entries
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.session = session
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """Hash a request payload (model, instructions, prompt, output schema)."""
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """
+        Return the cached response for a key, or None if missing or expired.
+
+        The entry's hit count is updated on the session but not committed; it is
+        persisted with the caller's next commit, so a hit costs no write of its own.
+        """
+        entry = LLMCacheManager(self.session).get(key, created_after=self._cutoff())
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry.hits += 1
+        response = entry.response
+        logger.debug(f"LLM response cache hit for {key[:12]}")
+        return response
+
+    def set(self, key: str, value: dict) -> None:
+        """Store a response, replacing any existing (e.g., expired) entry for the key."""
+        LLMCacheManager(self.session).upsert(key, value)
+        self.session.commit()
+
+    def stats(self) -> tuple[int, int, int]:
+        """
+        Summarize the persisted cache.
+
+        Returns:
+            Tuple of (total entries, expired entries, total hits)
+        """
+        return LLMCacheManager(self.session).stats(created_after=self._cutoff())
+
+    def _cutoff(self) -> datetime:
+        """Oldest creation time that is still within the TTL."""
+        return datetime.now(UTC) - self.ttl
@@ -0,0 +1,194 @@
+"""
+Semantic cache for classification strategies.
+
+Wraps another strategy and reuses a previous classification when a new message's
+embedding is close enough to one that was already classified against the same
+categories. Entries are persisted, so the cache survives across CLI invocations.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.managers.classification_cache_manager import ClassificationCacheManager
+from app.services.classification.strategies import ClassificationMatch, ClassificationStrategy
+from models import Category, Message
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CacheIndex:
+    """In-memory index of the cache entries for one signature."""
+
+    vectors: np.ndarray  # Normalized embeddings, one row per entry
+    matches: list[list[list]] = field(default_factory=list)  # Cached matches per row
+
+
+class SemanticCacheStrategy(ClassificationStrategy):
+    """
+    Classification strategy that serves semantically similar messages from a cache.
+
+    A cache hit requires the message embedding's cosine similarity to a cached
+    message to reach similarity_threshold, with the same categories, top_n,
+    threshold and wrapped strategy. Misses are classified by the wrapped strategy
+    and stored.
+    """
+
+    def __init__(
+        self,
+        strategy: ClassificationStrategy,
+        session: Session,
+        similarity_threshold: float = 0.92,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            strategy: Strategy used on cache misses
+            session: Database session for reading and writing cache entries
+            similarity_threshold: Minimum cosine similarity for a cache hit (0-1)
+        """
+        self.strategy = strategy
+        self.session = session
+        self.similarity_threshold = similarity_threshold
+        self.hits = 0
+        self.misses = 0
+        self._indexes: dict[str, _CacheIndex] = {}
+
+    def classify(
+        self, message: Message, categories: list[Category], top_n: int, threshold: float
+    ) -> list[ClassificationMatch]:
+        """Classify from the cache, falling back to the wrapped strategy."""
+        signature = self._signature(categories, top_n, threshold)
+        cached = self._lookup(message, categories, signature)
+        if cached is not None:
+            return cached
+        matches = self.strategy.classify(message, categories, top_n, threshold)
+        self._store(message, signature, matches)
+        return matches
+
+    async def classify_async(
+        self, message: Message, categories: list[Category], top_n: int, threshold: float
+    ) -> list[ClassificationMatch]:
+        """Classify from the cache, falling back to the wrapped strategy (async version)."""
+        signature = self._signature(categories, top_n, threshold)
+        cached = self._lookup(message, categories, signature)
+        if cached is not None:
+            return cached
+        matches = await self.strategy.classify_async(message, categories, top_n, threshold)
+        self._store(message, signature, matches)
+        return matches
+
+    async def classify_batch_async(
+        self, messages: list[Message], categories: list[Category], top_n: int, threshold: float
+    ) -> list[list[ClassificationMatch]]:
+        """Serve cache hits directly and send only the misses to the wrapped strategy."""
+        signature = self._signature(categories, top_n, threshold)
+        results = [self._lookup(message, categories, signature) for message in messages]
+        missed = [index for index, result in enumerate(results) if result is None]
+
+        if missed:
+            computed = await self.strategy.classify_batch_async(
+                [messages[index] for index in missed], categories, top_n, threshold
+            )
+            for index, matches in zip(missed, computed, strict=True):
+                self._store(messages[index], signature, matches)
+                results[index] = matches
+
+        return [result or [] for result in results]
+
+    def _signature(self, categories: list[Category], top_n: int, threshold: float) -> str:
+        """Hash everything a cached result depends on besides the message itself."""
+        payload = {
+            "strategy": type(self.strategy).__name__,
+            "model": getattr(self.strategy, "model", None),
+            "categories": sorted((cat.id, cat.name, cat.description) for cat in categories),
+            "top_n": top_n,
+            "threshold": threshold,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _get_index(self, signature: str) -> _CacheIndex:
+        """Load the index for a signature from the database on first use."""
+        index = self._indexes.get(signature)
+        if index is None:
+            entries = ClassificationCacheManager(self.session).get_by_signature(signature)
+            vectors = [_normalize(entry.embedding) for entry in entries]
+            index = _CacheIndex(
+                vectors=np.array([v for v in vectors if v is not None]),
+                matches=[
+                    entry.matches
+                    for entry, v in zip(entries, vectors, strict=True)
+                    if v is not None
+                ],
+            )
+            self._indexes[signature] = index
+        return index
+
+    def _lookup(
+        self, message: Message, categories: list[Category], signature: str
+    ) -> list[ClassificationMatch] | None:
+        """Return cached matches for a similar message, or None on a miss."""
+        query = _normalize(message.embedding)
+        if query is None:
+            return None
+
+        index = self._get_index(signature)
+        if not index.matches:
+            self.misses += 1
+            return None
+
+        similarities = index.vectors @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(
+            f"Semantic cache hit for message {message.id} (similarity {similarities[best]:.4f})"
+        )
+        categories_by_id = {cat.id: cat for cat in categories}
+        return [
+            ClassificationMatch(
+                category=categories_by_id[category_id], score=score, explanation=explanation
+            )
+            for category_id, score, explanation in index.matches[best]
+            if category_id in categories_by_id
+        ]
+
+    def _store(self, message: Message, signature: str, matches: list[ClassificationMatch]) -> None:
+        """Persist a freshly computed classification and add it to the in-memory index."""
+        vector = _normalize(message.embedding)
+        if vector is None:
+            return
+
+        index = self._get_index(signature)  # Load before inserting so the entry isn't read twice
+
+        cached_matches = [[match.category.id, match.score, match.explanation] for match in matches]
+        ClassificationCacheManager(self.session).create(
+            signature, list(message.embedding), cached_matches
+        )
+        self.session.commit()
+
+        if index.matches:
+            index.vectors = np.vstack([index.vectors, vector])
+        else:
+            index.vectors = vector[np.newaxis, :]
+        index.matches.append(cached_matches)
+
+
+def _normalize(embedding: list[float] | None) -> np.ndarray | None:
+    """Return the unit-length vector for an embedding, or None if it can't be used."""
+    if not embedding:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return None
+    return vector / norm
@@ -4,15 +4,47 @@ Classification strategies for categorizing messages.
 This module contains pure classification logic that doesn't know about persistence.
 """
 
+import asyncio
+import functools
+import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 import numpy as np
 from pydantic import BaseModel
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.models import Model, infer_model
 
+from app.config import config
+from app.services.classification.llm_cache import LLMResponseCache
 from models import Category, Message
 
+logger = logging.getLogger(__name__)
+
+# Rate-limit and server errors are retried with exponential backoff (1s, 2s, 4s)
+LLM_MAX_RETRIES = 3
+LLM_RETRY_BASE_DELAY = 1.0
+
+
+@functools.cache
+def _shared_model(model: str) -> Model:
+    """
+    Resolve a model identifier once per process.
+
+    Every LLMClassificationStrategy for the same model shares the resolved model and
+    its provider client (connection pool included). Model objects hold no per-run
+    state, so concurrent runs can share one.
+    """
+    return infer_model(model)
+
+
+@functools.cache
+def _output_schema(output_type: type[BaseModel]) -> dict:
+    """JSON schema of an LLM output model, generated once per model class."""
+    return output_type.model_json_schema()
+
 
 @dataclass
 class ClassificationMatch:
@@ -62,10 +94,37 @@ class ClassificationStrategy(ABC):
         """
         return self.classify(message, categories, top_n, threshold)
 
+    async def classify_batch_async(
+        self, messages: list[Message], categories: list[Category], top_n: int, threshold: float
+    ) -> list[list[ClassificationMatch]]:
+        """
+        Classify several messages against the same categories.
+
+        Default implementation classifies one message at a time. Override this in
+        strategies that can evaluate many messages in a single call.
+
+        Args:
+            messages: Messages to classify
+            categories: List of categories to match against
+            top_n: Maximum number of matches to return per message
+            threshold: Minimum score threshold
+
+        Returns:
+            One list of ClassificationMatch objects per message, in input order
+        """
+        return [
+            await self.classify_async(message, categories, top_n, threshold) for message in messages
+        ]
+
 
 class EmbeddingSimilarityStrategy(ClassificationStrategy):
     """Classification strategy using cosine similarity of embeddings."""
 
+    def __init__(self):
+        # Normalized category matrix, rebuilt only when the categories change
+        self._matrix_key: tuple | None = None
+        self._matrix: np.ndarray | None = None
+
     def classify(
         self, message: Message, categories: list[Category], top_n: int, threshold: float
     ) -> list[ClassificationMatch]:
@@ -92,38 +151,74 @@ class EmbeddingSimilarityStrategy(ClassificationStrategy):
         if not categories_with_embeddings:
             return []
 
-        # Convert message embedding to numpy array
-        message_vec = np.array(message.embedding)
+        # Cosine similarity of unit vectors is a plain dot product
+        message_vec = np.asarray(message.embedding, dtype=np.float32)
+        message_norm = message_vec / np.linalg.norm(message_vec)
+        similarities = self._category_matrix(categories_with_embeddings) @ message_norm
 
-        # Build category embedding matrix
-        category_vecs = np.array([cat.embedding for cat in categories_with_embeddings])
+        return self._top_matches(
+            message, categories_with_embeddings, similarities, top_n, threshold
+        )
 
-        # Compute cosine similarity using matrix multiplication
-        # cosine_sim = (A · B) / (||A|| * ||B||)
-        # We normalize the vectors first, then dot product
-        message_norm = message_vec / np.linalg.norm(message_vec)
-        category_norms = category_vecs / np.linalg.norm(category_vecs, axis=1, keepdims=True)
+    async def classify_batch_async(
+        self, messages: list[Message], categories: list[Category], top_n: int, threshold: float
+    ) -> list[list[ClassificationMatch]]:
+        """Score every message against every category with a single matrix product."""
+        for message in messages:
+            if not message.embedding:
+                raise ValueError(f"Message {message.id} has no embedding")
 
-        # Compute similarities via matrix multiplication
-        similarities = category_norms @ message_norm
+        categories_with_embeddings = [cat for cat in categories if cat.embedding]
+        if not messages or not categories_with_embeddings:
+            return [[] for _ in messages]
+
+        message_vecs = np.array([message.embedding for message in messages], dtype=np.float32)
+        message_norms = message_vecs / np.linalg.norm(message_vecs, axis=1, keepdims=True)
+        similarities = message_norms @ self._category_matrix(categories_with_embeddings).T
+
+        return [
+            self._top_matches(message, categories_with_embeddings, row, top_n, threshold)
+            for message, row in zip(messages, similarities, strict=True)
+        ]
+
+    def _category_matrix(self, categories: list[Category]) -> np.ndarray:
+        """Return the (C, D) float32 matrix of normalized category embeddings."""
+        key = tuple((cat.id, cat.name, cat.description) for cat in categories)
+        if self._matrix is None or key != self._matrix_key:
+            category_vecs = np.array([cat.embedding for cat in categories], dtype=np.float32)
+            self._matrix = category_vecs / np.linalg.norm(category_vecs, axis=1, keepdims=True)
+            self._matrix_key = key
+        return self._matrix
+
+    def _top_matches(
+        self,
+        message: Message,
+        categories: list[Category],
+        similarities: np.ndarray,
+        top_n: int,
+        threshold: float,
+    ) -> list[ClassificationMatch]:
+        """Turn one message's similarity scores into its best matches above threshold."""
+        k = min(top_n, len(similarities))
+        if k <= 0:
+            return []
 
-        # Get indices sorted by similarity (descending)
-        sorted_indices = np.argsort(similarities)[::-1]
+        # Select the top k without sorting every score, then order just that slice
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        top = top[similarities[top] >= threshold]
 
-        # Filter by threshold and top_n
         matches: list[ClassificationMatch] = []
-
-        for idx in sorted_indices:
-            if similarities[idx] >= threshold and len(matches) < top_n:
-                category = categories_with_embeddings[idx]
-                score = float(similarities[idx])
-                explanation = (
-                    f"Message {message.id} embeddings exceed {threshold:.2f} "
-                    f"similarity threshold for category '{category.name}' with score {score:.4f}"
-                )
-                matches.append(
-                    ClassificationMatch(category=category, score=score, explanation=explanation)
-                )
+        for idx in top:
+            category = categories[idx]
+            score = float(similarities[idx])
+            explanation = (
+                f"Message {message.id} embeddings exceed {threshold:.2f} "
+                f"similarity threshold for category '{category.name}' with score {score:.4f}"
+            )
+            matches.append(
+                ClassificationMatch(category=category, score=score, explanation=explanation)
+            )
 
         return matches
 
@@ -143,6 +238,38 @@ class MultiCategoryMatchOutput(BaseModel):
     matches: list[CategoryMatchOutput]
 
 
+class MessageMatchOutput(BaseModel):
+    """Output schema for the category matches of one message in a batch."""
+
+    message_index: int  # 0-based index of the message in the provided list
+    matches: list[CategoryMatchOutput]
+
+
+class BatchCategoryMatchOutput(BaseModel):
+    """Output schema for LLM classification of multiple messages at once."""
+
+    results: list[MessageMatchOutput]
+
+
+SINGLE_MESSAGE_INSTRUCTIONS = (
+    "You are an email classification assistant. "
+    "Given an email message and a list of category descriptions, determine which "
+    "categories the email belongs in. For each category, provide a boolean match, "
+    "a confidence score (0.0 to 1.0), and an explanation. Be precise and consider "
+    "the semantic meaning of both the category descriptions and the email content. "
+    "You must evaluate ALL categories provided and return a match result for each one."
+)
+
+BATCH_INSTRUCTIONS = (
+    "You are an email classification assistant. "
+    "Given several numbered email messages and a list of category descriptions, "
+    "determine which categories each email belongs in. For every email and every "
+    "category, provide a boolean match, a confidence score (0.0 to 1.0), and an "
+    "explanation. Classify each email independently of the others. "
+    "You must return one result per email, each evaluating ALL categories provided."
+)
+
+
 class LLMClassificationStrategy(ClassificationStrategy):
     """
     Classification strategy using an LLM (Language Model) via pydantic-ai.
@@ -159,25 +286,27 @@ class LLMClassificationStrategy(ClassificationStrategy):
     for a message in a single LLM call.
     """
 
-    def __init__(self, model: str = "openai:gpt-4o-mini"):
+    def __init__(
+        self, model: str = config.LLM_MODEL, response_cache: LLMResponseCache | None = None
+    ):
         """
         Initialize the LLM classification strategy.
 
         Args:
             model: Model identifier for pydantic-ai (e.g., "openai:gpt-4o-mini")
+            response_cache: Optional exact-match cache consulted before calling the LLM
         """
         self.model = model
+        self.response_cache = response_cache
         self._agent = Agent(
-            model=self.model,
+            model=_shared_model(self.model),
             output_type=MultiCategoryMatchOutput,
-            instructions=(
-                "You are an email classification assistant. "
-                "Given an email message and a list of category descriptions, determine which "
-                "categories the email belongs in. For each category, provide a boolean match, "
-                "a confidence score (0.0 to 1.0), and an explanation. Be precise and consider "
-                "the semantic meaning of both the category descriptions and the email content. "
-                "You must evaluate ALL categories provided and return a match result for each one."
-            ),
+            instructions=SINGLE_MESSAGE_INSTRUCTIONS,
+        )
+        self._batch_agent = Agent(
+            model=_shared_model(self.model),
+            output_type=BatchCategoryMatchOutput,
+            instructions=BATCH_INSTRUCTIONS,
         )
 
     def classify(
@@ -217,8 +346,13 @@ class LLMClassificationStrategy(ClassificationStrategy):
         prompt = self._build_multi_category_prompt(message_text, categories)
 
         # Call the LLM agent once with all categories (sync version)
-        result = self._agent.run_sync(prompt)
-        output: MultiCategoryMatchOutput = result.output
+        cache_key = self._cache_key(SINGLE_MESSAGE_INSTRUCTIONS, MultiCategoryMatchOutput, prompt)
+        cached = self._cached_output(cache_key, MultiCategoryMatchOutput)
+        if cached is None:
+            output: MultiCategoryMatchOutput = self._run_agent(self._agent, prompt)
+            self._cache_output(cache_key, output)
+        else:
+            output = cached
 
         return self._process_llm_output(output, categories, top_n, threshold)
 
@@ -258,11 +392,112 @@ class LLMClassificationStrategy(ClassificationStrategy):
         prompt = self._build_multi_category_prompt(message_text, categories)
 
         # Call the LLM agent once with all categories (async version)
-        result = await self._agent.run(prompt)
-        output: MultiCategoryMatchOutput = result.output
+        cache_key = self._cache_key(SINGLE_MESSAGE_INSTRUCTIONS, MultiCategoryMatchOutput, prompt)
+        cached = self._cached_output(cache_key, MultiCategoryMatchOutput)
+        if cached is None:
+            output: MultiCategoryMatchOutput = await self._run_agent_async(self._agent, prompt)
+            self._cache_output(cache_key, output)
+        else:
+            output = cached
 
         return self._process_llm_output(output, categories, top_n, threshold)
 
+    async def classify_batch_async(
+        self, messages: list[Message], categories: list[Category], top_n: int, threshold: float
+    ) -> list[list[ClassificationMatch]]:
+        """
+        Classify several messages in a single LLM request.
+
+        All messages and categories go into one indexed prompt, and the LLM returns one
+        result per message index. This amortizes per-request latency and rate limits
+        across the batch.
+
+        Args:
+            messages: Messages to classify (don't require embeddings)
+            categories: List of categories to match against
+            top_n: Maximum number of matches to return per message
+            threshold: Minimum confidence score (0-1) to include a match
+
+        Returns:
+            One list of ClassificationMatch objects per message, in input order.
+            Messages the LLM didn't return a result for get an empty list.
+        """
+        if not categories or not messages:
+            return [[] for _ in messages]
+
+        if len(messages) == 1:
+            return [await self.classify_async(messages[0], categories, top_n, threshold)]
+
+        prompt = self._build_batch_prompt(messages, categories)
+
+        # Call the LLM agent once for the whole batch
+        cache_key = self._cache_key(BATCH_INSTRUCTIONS, BatchCategoryMatchOutput, prompt)
+        cached = self._cached_output(cache_key, BatchCategoryMatchOutput)
+        if cached is None:
+            output: BatchCategoryMatchOutput = await self._run_agent_async(
+                self._batch_agent, prompt
+            )
+            self._cache_output(cache_key, output)
+        else:
+            output = cached
+
+        matches_by_index = {
+            message_output.message_index: message_output.matches
+            for message_output in output.results
+        }
+        return [
+            self._process_llm_output(
+                MultiCategoryMatchOutput(matches=matches_by_index.get(index, [])),
+                categories,
+                top_n,
+                threshold,
+            )
+            for index in range(len(messages))
+        ]
+
+    def _run_agent(self, agent: Agent, prompt: str):
+        """Run an agent synchronously, retrying transient provider errors."""
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                return agent.run_sync(prompt).output
+            except ModelHTTPError as e:
+                if attempt == LLM_MAX_RETRIES or not _is_retryable(e):
+                    raise
+                time.sleep(_retry_delay(e, attempt))
+
+    async def _run_agent_async(self, agent: Agent, prompt: str):
+        """Run an agent, retrying transient provider errors without blocking the event loop."""
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                return (await agent.run(prompt)).output
+            except ModelHTTPError as e:
+                if attempt == LLM_MAX_RETRIES or not _is_retryable(e):
+                    raise
+                await asyncio.sleep(_retry_delay(e, attempt))
+
+    def _cache_key(self, instructions: str, output_type: type[BaseModel], prompt: str) -> str:
+        """Hash the full LLM request for the response cache."""
+        return LLMResponseCache.make_key(
+            {
+                "model": self.model,
+                "instructions": instructions,
+                "output_schema": _output_schema(output_type),
+                "prompt": prompt,
+            }
+        )
+
+    def _cached_output[T: BaseModel](self, key: str, output_type: type[T]) -> T | None:
+        """Return the cached output for a request, if a response cache is configured."""
+        if self.response_cache is None:
+            return None
+        cached = self.response_cache.get(key)
+        return output_type.model_validate(cached) if cached is not None else None
+
+    def _cache_output(self, key: str, output: BaseModel) -> None:
+        """Store an LLM output in the response cache, if one is configured."""
+        if self.response_cache is not None:
+            self.response_cache.set(key, output.model_dump())
+
     def _process_llm_output(
         self,
         output: MultiCategoryMatchOutput,
@@ -355,13 +590,7 @@ class LLMClassificationStrategy(ClassificationStrategy):
         Returns:
             Prompt string for the LLM
         """
-        # Build the categories list with 0-based indices
-        categories_text = []
-        for i, category in enumerate(categories):
-            categories_text.append(f"[{i}] {category.name}")
-            categories_text.append(f"    Description: {category.description}")
-
-        categories_str = "\n".join(categories_text)
+        categories_str = self._build_categories_text(categories)
 
         return f"""
 I need you to determine which of the following categories this email belongs to.
@@ -382,3 +611,74 @@ For each category, determine:
 IMPORTANT: Use the numeric index (0, 1, 2, etc.) for category_index, NOT the category name.
 Evaluate ALL {len(categories)} categories listed above.
 """
+
+    def _build_batch_prompt(self, messages: list[Message], categories: list[Category]) -> str:
+        """
+        Build the prompt for classifying several messages against multiple categories.
+
+        Args:
+            messages: Messages to evaluate
+            categories: List of categories to evaluate
+
+        Returns:
+            Prompt string for the LLM
+        """
+        categories_str = self._build_categories_text(categories)
+        messages_str = "\n\n".join(
+            f"--- Email [{i}] ---\n{self._build_message_text(message)}"
+            for i, message in enumerate(messages)
+        )
+
+        return f"""
+I need you to determine which of the following categories each email belongs to.
+Evaluate EACH email against EACH category and provide a match result for ALL of them.
+
+Categories (with 0-based indices):
+{categories_str}
+
+Emails (with 0-based indices):
+{messages_str}
+
+For each email, return a result with:
+1. The message_index (0-based index of the email from the list above)
+2. A match result for every category, each with:
+   - The category_index (0-based index from the category list above)
+   - Whether the email belongs in that category (is_in_category: true/false)
+   - Your confidence in that determination (confidence: 0.0 to 1.0)
+   - A brief explanation of your reasoning
+
+IMPORTANT: Use the numeric indexes for message_index and category_index, NOT names.
+Return results for ALL {len(messages)} emails, each evaluating ALL {len(categories)} categories.
+"""
+
+    def _build_categories_text(self, categories: list[Category]) -> str:
+        """
+        Build the indexed category list shared by the single and batch prompts.
+
+        Args:
+            categories: List of categories to evaluate
+
+        Returns:
+            Categories formatted with 0-based indices and descriptions
+        """
+        categories_text = []
+        for i, category in enumerate(categories):
+            categories_text.append(f"[{i}] {category.name}")
+            categories_text.append(f"    Description: {category.description}")
+
+        return "\n".join(categories_text)
+
+
+def _is_retryable(error: ModelHTTPError) -> bool:
+    """Rate limits (429) and server errors (5xx) are worth retrying."""
+    return error.status_code == 429 or error.status_code >= 500
+
+
+def _retry_delay(error: ModelHTTPError, attempt: int) -> float:
+    """Exponential backoff delay before the next attempt, logged for visibility."""
+    delay = LLM_RETRY_BASE_DELAY * 2**attempt
+    logger.warning(
+        f"LLM request failed with status {error.status_code}; "
+        f"retrying in {delay:.0f}s (attempt {attempt + 1}/{LLM_MAX_RETRIES})"
+    )
+    return delay
@@ -0,0 +1,55 @@
+"""
+Persistent cache for category embeddings.
+
+Category text rarely changes, but every bootstrap or re-created category would otherwise
+call the embedding API again. Vectors are stored as float32 bytes keyed by provider,
+model and a SHA-256 hash of the embedded text, so they are reused across CLI invocations.
+"""
+
+import hashlib
+import logging
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.managers.category_embedding_manager import CategoryEmbeddingManager
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryEmbeddingCache:
+    """Content-addressed store of category embeddings."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            session: Database session for reading and writing cache entries
+        """
+        self.session = session
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Hash the exact text sent to the embedding model."""
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, provider: str, model: str, text: str) -> list[float] | None:
+        """Return the cached embedding for a text, or None on a miss."""
+        entry = CategoryEmbeddingManager(self.session).get(provider, model, self.content_hash(text))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"Category embedding cache hit for {entry.content_hash[:12]}")
+        return np.frombuffer(entry.vector, dtype=np.float32).tolist()
+
+    def set(self, provider: str, model: str, text: str, embedding: list[float]) -> None:
+        """Store the embedding for a text (flushed only; persisted with the caller's commit)."""
+        vector = np.asarray(embedding, dtype=np.float32).tobytes()
+        CategoryEmbeddingManager(self.session).upsert(
+            provider, model, self.content_hash(text), vector
+        )
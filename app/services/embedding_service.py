@@ -8,6 +8,7 @@ import time
 from openai import OpenAI
 
 from app.config import config
+from app.services.embedding_cache import CategoryEmbeddingCache
 from models import Category, Message
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,23 @@ logger = logging.getLogger(__name__)
 class EmbeddingService:
     """Service for generating embeddings using OpenAI's API."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    PROVIDER = "openai"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        category_cache: CategoryEmbeddingCache | None = None,
+    ):
         """
         Initialize the embedding service.
 
         Args:
             api_key: OpenAI API key (if None, will use config.OPENAI_API_KEY or OPENAI_API_KEY env var)
             model: Embedding model to use (if None, will use config.EMBEDDING_MODEL)
+            category_cache: Optional persistent cache for category embeddings
         """
+        self.category_cache = category_cache
         # Use provided api_key, or fall back to config, or let OpenAI client use env var
         key = api_key if api_key is not None else config.OPENAI_API_KEY
         self.client = OpenAI(api_key=key) if key else OpenAI()
@@ -68,7 +78,14 @@ class EmbeddingService:
         # Combine name and description for embedding
         text = f"Category: {category.name}\nDescription: {category.description}"
 
-        return self._create_embedding(text)
+        if self.category_cache is None:
+            return self._create_embedding(text)
+
+        embedding = self.category_cache.get(self.PROVIDER, self.model, text)
+        if embedding is None:
+            embedding = self._create_embedding(text)
+            self.category_cache.set(self.PROVIDER, self.model, text, embedding)
+        return embedding
 
     def _create_embedding(self, text: str) -> list[float]:
         """
@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
-from contextlib import suppress
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +16,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.managers.message_manager import MessageManager
 from app.services.embedding_service import EmbeddingService
@@ -32,6 +34,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are decoded across a process pool on import
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Messages parsed, embedded and inserted together during a streaming import
+IMPORT_BATCH_SIZE = 1000
+
+# Number of imported messages returned for preview
+PREVIEW_SIZE = 5
+
 
 @dataclass
 class ClassificationOptions:
@@ -40,6 +51,7 @@ class ClassificationOptions:
     auto_classify: bool = False
     top_n: int = 3
     threshold: float = 0.5
+    max_concurrency: int = 4  # Classification requests in flight at once
 
 
 @dataclass
@@ -69,6 +81,22 @@ class MessageResult:
     message: Message
 
 
+def _message_from_record(data: dict) -> Message:
+    """Build a Message from one JSONL record (module-level so it can run in worker processes)."""
+    # Parse and normalize message body (base64 decode + HTML text extraction)
+    body_content = MessagesService.parse_message_content(data["body"], is_base64_encoded=True)
+
+    return Message(
+        id=data["id"],
+        subject=data["subject"],
+        sender=data["from"],
+        to=data["to"],
+        snippet=data.get("snippet"),
+        body=body_content,
+        date=parse_iso_date(data["date"]),
+    )
+
+
 class MessagesService:
     """Service for orchestrating message import and processing operations."""
 
@@ -129,69 +157,67 @@ class MessagesService:
         # Initialize database
         self.store.init_db(drop_existing=options.drop_existing)
 
-        # Parse messages from file
-        messages = self._parse_jsonl_file(file_path)
+        classify = bool(options.classification and options.classification.auto_classify)
+        total_imported = 0
+        message_ids: list[str] = []  # Only kept when classifying afterwards
+        preview: list[Message] = []
 
-        # Store messages using a new session for the import transaction
-        import_session = self.store.create_session()
-        try:
+        # Stream the file in batches inside a single bulk-load transaction, so only
+        # one batch of messages (plus the preview) is held in memory at a time
+        with self.store.bulk_session() as import_session:
             manager = MessageManager(import_session)
-            manager.bulk_create(messages)
-            import_session.commit()
-
-            # Get preview
-            preview = manager.get_first_n(5)
-
-            # Auto-classify messages if requested
-            if options.classification and options.classification.auto_classify:
-                self._classify_all_messages(
-                    messages,
-                    top_n=options.classification.top_n,
-                    threshold=options.classification.threshold,
-                )
-
-            return ImportResult(total_imported=len(messages), preview_messages=preview)
-        finally:
-            import_session.close()
-
-    def _parse_jsonl_file(self, file_path: Path) -> list[Message]:
-        """Parse JSONL file and convert to Message objects."""
-        from app.utils.jsonl_parser import parse_jsonl
-
-        def parse_message(data: dict) -> Message:
-            # Parse and normalize message body (base64 decode + HTML text extraction)
-            body_content = self.parse_message_content(data["body"], is_base64_encoded=True)
-
-            # Parse date using utility function
-            date_obj = parse_iso_date(data["date"])
-
-            message = Message(
-                id=data["id"],
-                subject=data["subject"],
-                sender=data["from"],
-                to=data["to"],
-                snippet=data.get("snippet"),
-                body=body_content,
-                date=date_obj,
+            for messages in self._iter_message_batches(file_path):
+                manager.bulk_create(messages)
+                total_imported += len(messages)
+                if classify:
+                    message_ids.extend(message.id for message in messages)
+                preview.extend(messages[: PREVIEW_SIZE - len(preview)])
+
+        # Freshly inserted messages have no categories yet, so mark that collection loaded
+        for message in preview:
+            set_committed_value(message, "message_categories", [])
+
+        # Auto-classify messages if requested
+        if classify:
+            self._classify_all_messages(
+                message_ids,
+                top_n=options.classification.top_n,
+                threshold=options.classification.threshold,
+                max_concurrency=options.classification.max_concurrency,
             )
 
-            # Generate embedding for the message
-            message.embedding = self.embedding_service.embed_message(message)
+        return ImportResult(total_imported=total_imported, preview_messages=preview)
 
-            return message
+    def _iter_message_batches(self, file_path: Path) -> Iterator[list[Message]]:
+        """Stream Message objects with embeddings from a JSONL file, one batch at a time."""
+        from app.utils.jsonl_parser import iter_jsonl_batches
 
-        return parse_jsonl(file_path, parse_message)
+        # Decoding is CPU-bound, so spread large files across processes
+        max_workers = None
+        if file_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES:
+            max_workers = max(1, (os.cpu_count() or 1) - 1)
 
-    def _classify_all_messages(self, messages: list[Message], top_n: int, threshold: float) -> None:
+        for messages in iter_jsonl_batches(
+            file_path, _message_from_record, batch_size=IMPORT_BATCH_SIZE, max_workers=max_workers
+        ):
+            # Generate embeddings in this process: the client isn't shared with workers
+            for message in messages:
+                message.embedding = self.embedding_service.embed_message(message)
+            yield messages
+
+    def _classify_all_messages(
+        self, message_ids: list[str], top_n: int, threshold: float, max_concurrency: int = 4
+    ) -> None:
         """
         Classify all messages and assign them to categories.
 
         Requires a classification service to be injected during initialization.
 
         Args:
-            messages: List of messages to classify
+            message_ids: IDs of the messages to classify
             top_n: Maximum number of categories per message
             threshold: Minimum similarity threshold
+            max_concurrency: Maximum number of classification requests in flight at once
 
         Raises:
             ValueError: If no classification service was injected
@@ -203,18 +229,19 @@ class MessagesService:
             )
 
         # Run async classification in a sync context
-        asyncio.run(self._classify_all_messages_async(messages))
+        asyncio.run(self._classify_all_messages_async(message_ids, max_concurrency))
 
-    async def _classify_all_messages_async(self, messages: list[Message]) -> None:
+    async def _classify_all_messages_async(
+        self, message_ids: list[str], max_concurrency: int = 4
+    ) -> None:
         """Async helper for classifying all messages."""
         if self.classification_service is None:
             return
 
-        for message in messages:
-            # Skip messages that can't be classified (e.g., no categories available)
-            with suppress(ValueError):
-                # Classify message (which also assigns categories)
-                await self.classification_service.classify_message_by_id(message.id)
+        # Batches that can't be classified (e.g., no categories available) are skipped
+        await self.classification_service.classify_in_batches(
+            message_ids, max_concurrency=max_concurrency
+        )
 
     def create_message(
         self,
@@ -2,30 +2,105 @@
 SQLite store for database session management and initialization.
 """
 
-from collections.abc import Generator
+import logging
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from models import Base
 
+logger = logging.getLogger(__name__)
+
+# Applied to every new DBAPI connection. WAL lets readers proceed during writes and
+# synchronous=NORMAL only fsyncs at checkpoints, which is safe in WAL mode.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+
+# Connections kept open for reuse, plus extra ones allowed under bursts of concurrency
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+# Server connections older than this are replaced before use (seconds)
+POOL_RECYCLE = 3600
+
+# URLs that open a private in-memory SQLite database per connection
+IN_MEMORY_URLS = ("sqlite://", "sqlite:///:memory:")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _pool_options(db_path: str) -> dict:
+    """
+    Connection pool settings for the engine.
+
+    File-backed and server databases keep a reusable pool of connections, handed out
+    most-recently-used first so a few warm connections serve most checkouts and the
+    rest can time out. In-memory SQLite keeps one connection for the whole engine, since
+    each new connection would open a separate empty database, and a local SQLite file
+    never goes stale, so only server databases pre-ping and recycle connections.
+    """
+    if db_path in IN_MEMORY_URLS:
+        return {"poolclass": StaticPool}
+    options: dict = {
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_use_lifo": True,
+    }
+    if not db_path.startswith("sqlite"):
+        options["pool_pre_ping"] = True
+        options["pool_recycle"] = POOL_RECYCLE
+    return options
+
 
 class SQLiteStore:
     """Handles SQLite database connection and session management."""
 
     def __init__(self, db_path: str = "sqlite:///messages.db", echo: bool = False):
         self.db_path = db_path
+        self.is_sqlite = db_path.startswith("sqlite")
         # For SQLite, allow connections from different threads (needed for FastAPI)
-        connect_args = {"check_same_thread": False} if db_path.startswith("sqlite") else {}
-        self.engine = create_engine(db_path, echo=echo, connect_args=connect_args)
+        connect_args = {"check_same_thread": False} if self.is_sqlite else {}
+        self.engine = create_engine(
+            db_path, echo=echo, connect_args=connect_args, **_pool_options(db_path)
+        )
+        if self.is_sqlite:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def init_db(self, drop_existing: bool = False) -> None:
-        """Initialize database tables."""
+        """
+        Initialize database tables, skipping create_all when the schema already exists.
+
+        Dropping existing data keeps tables marked keep_on_drop (content-addressed caches).
+        """
         if drop_existing:
-            Base.metadata.drop_all(self.engine)
+            tables = [t for t in Base.metadata.sorted_tables if not t.info.get("keep_on_drop")]
+            Base.metadata.drop_all(self.engine, tables=tables)
+        elif self._has_all_tables():
+            return
         Base.metadata.create_all(self.engine)
 
+    def _has_all_tables(self) -> bool:
+        """Check every model table exists with a single table-name lookup."""
+        existing = set(inspect(self.engine).get_table_names())
+        return existing.issuperset(Base.metadata.tables)
+
     def get_session(self) -> Generator[Session, None, None]:
         """Get a database session with automatic cleanup."""
         session = self.SessionLocal()
@@ -37,3 +112,48 @@ class SQLiteStore:
     def create_session(self) -> Session:
         """Create a new database session (caller must close)."""
         return self.SessionLocal()
+
+    @contextmanager
+    def bulk_session(self) -> Iterator[Session]:
+        """
+        Session for bulk loads: one transaction, no fsync until it commits.
+
+        Commits on success and rolls back on error. On file-backed SQLite, synchronous
+        is switched OFF on the session's connection for the duration of the load and
+        restored before the connection goes back to the pool, whether or not the load
+        succeeded. In-memory databases never fsync and share one connection across
+        sessions, so they are left alone. Loaded objects are not expired on commit,
+        so they stay readable afterwards.
+        """
+        toggle_synchronous = self.is_sqlite and self.db_path not in IN_MEMORY_URLS
+        with self.engine.connect() as connection:
+            if toggle_synchronous:
+                connection.exec_driver_sql("PRAGMA synchronous=OFF")
+                connection.commit()
+            session = self.SessionLocal(bind=connection, expire_on_commit=False)
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+                if toggle_synchronous:
+                    self._restore_synchronous(connection)
+
+    @staticmethod
+    def _restore_synchronous(connection: Connection) -> None:
+        """
+        Switch synchronous back to NORMAL after a bulk load.
+
+        If that fails, the connection is invalidated so it is never reused with
+        synchronous=OFF, and the original error (if any) is left to propagate.
+        """
+        try:
+            connection.exec_driver_sql("PRAGMA synchronous=NORMAL")
+            connection.exec_driver_sql("PRAGMA optimize")
+            connection.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not restore synchronous=NORMAL, discarding connection: {e}")
+            connection.invalidate()
@@ -0,0 +1,23 @@
+"""
+Console helpers for batching Rich output.
+"""
+
+from rich.console import Console, Group, RenderableType
+
+
+class BufferedConsole:
+    """Collects renderables and prints them with a single console.print call."""
+
+    def __init__(self, console: Console):
+        self._console = console
+        self._line_buffer: list[RenderableType] = []
+
+    def write(self, renderable: RenderableType = "") -> None:
+        """Queue a line of Rich markup (or any renderable) for the next flush."""
+        self._line_buffer.append(renderable)
+
+    def flush(self) -> None:
+        """Print all queued renderables at once and clear the buffer."""
+        if self._line_buffer:
+            self._console.print(Group(*self._line_buffer))
+            self._line_buffer.clear()
@@ -1,20 +1,33 @@
+from __future__ import annotations
+
 import asyncio
+import functools
 import logging
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
 from app.config import config
-from app.services.bootstrap_service import BootstrapService
-from app.services.categories_service import CategoriesService
-from app.services.classification import ClassificationService, LLMClassificationStrategy
-from app.services.messages_service import ClassificationOptions, ImportOptions, MessagesService
-from app.stores.sqlite_store import SQLiteStore
+from app.utils.console import BufferedConsole
+
+# Services pull in SQLAlchemy, OpenAI and the LLM stack, so they are imported where
+# they are used; `extra --help` and tab completion never need them.
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from app.services.bootstrap_service import BootstrapService
+    from app.services.categories_service import CategoriesService
+    from app.services.classification import ClassificationService, LLMResponseCache
+    from app.services.messages_service import MessagesService
+    from app.stores.sqlite_store import SQLiteStore
+    from models import Message
 
 app = typer.Typer(
     name="extra",
@@ -23,91 +36,219 @@ app = typer.Typer(
 )
 console = Console()
 
-# Configure logging with Rich handler
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(console=console, rich_tracebacks=True, show_path=False)],
-)
+# Markup prefixes are parsed once; values are appended as plain Text so user data
+# (subjects, filenames, error messages) is never interpreted as markup.
+_DONE_PREFIX = Text.from_markup("[bold green]✓[/bold green] ")
+_ERROR_PREFIX = Text.from_markup("[bold red]Error:[/bold red] ")
+
+
+@functools.cache
+def _heading_prefix(label: str) -> Text:
+    """Parse a bold cyan heading label once per distinct label."""
+    return Text.from_markup(f"[bold cyan]{label}[/bold cyan] ")
+
+
+def _heading(label: str, value: object, end: str = "") -> Text:
+    """Build a status heading like "Importing messages from: <value>" on a new line."""
+    return Text.assemble("\n", _heading_prefix(label), str(value), end)
+
+
+def _configure_logging() -> None:
+    """Route logging through Rich; runs once a command is invoked, not for --help."""
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(console=console, rich_tracebacks=True, show_path=False)],
+    )
+
+    # Suppress noisy HTTP request logs from OpenAI/httpx
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    logging.getLogger("openai").setLevel(logging.WARNING)
+
+
+def _dates(messages: list[Message]) -> list[str]:
+    """Table column of message dates."""
+    return [msg.date.strftime("%Y-%m-%d %H:%M") if msg.date else "N/A" for msg in messages]
+
+
+def _category_names(messages: list[Message]) -> list[str]:
+    """Table column of comma-separated category names."""
+    return [msg.categories_str or "-" for msg in messages]
+
+
+def _preview_rows(messages: list[Message]) -> Iterator[tuple[str, ...]]:
+    """
+    Rows of the message preview table (subject, from, date, snippet, categories).
+
+    Columns are built one list comprehension at a time and zipped into rows.
+    """
+    subjects = [msg.subject for msg in messages]
+    senders = [msg.sender for msg in messages]
+    snippets = [msg.snippet or "" for msg in messages]
+    return zip(
+        subjects, senders, _dates(messages), snippets, _category_names(messages), strict=True
+    )
+
+
+class _NullProgress:
+    """Stand-in for rich.progress.Progress that draws nothing."""
+
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+
+    def update(self, task_id: int, **kwargs) -> None:
+        pass
+
+
+def _progress() -> AbstractContextManager:
+    """
+    Spinner for long-running commands, or a no-op when output isn't a terminal.
+
+    Piped or CI output can't show a spinner anyway, so Rich's live display and its
+    refresh thread are only set up (and rich.progress only imported) for a TTY.
+    """
+    if not console.is_terminal:
+        return nullcontext(_NullProgress())
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=2,
+    )
+
 
-# Suppress noisy HTTP request logs from OpenAI/httpx
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
-logging.getLogger("openai").setLevel(logging.WARNING)
+@functools.cache
+def _get_store() -> SQLiteStore:
+    """Create the shared store on first use; every command reuses its engine and pool."""
+    from app.stores.sqlite_store import SQLiteStore
 
+    store = SQLiteStore(db_path=config.DATABASE_URL, echo=config.DATABASE_ECHO)
+    store.init_db(drop_existing=False)  # Initialize tables without dropping
+    return store
 
-# Initialize shared store (lazily)
-_store = SQLiteStore(db_path=config.DATABASE_URL, echo=config.DATABASE_ECHO)
-_store.init_db(drop_existing=False)  # Initialize tables without dropping
 
 # Create command groups
 messages_app = typer.Typer(help="Message management commands")
 category_app = typer.Typer(help="Category management commands")
 
 
-# Helper functions to create service instances with fresh sessions
-def _create_messages_service(with_classification: bool = False):
-    """Create a MessagesService with a fresh session.
+@contextmanager
+def _cli_session() -> Iterator[Session]:
+    """One session per CLI command: committed on success, rolled back on error, then closed."""
+    session = _get_store().create_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+# Helper functions to create service instances on the command's session
+def _create_llm_cache(session: Session) -> LLMResponseCache:
+    """Create the exact-match LLM response cache backed by the given session."""
+    from app.services.classification import LLMResponseCache
+
+    return LLMResponseCache(session, ttl_seconds=config.LLM_CACHE_TTL_SECONDS)
+
+
+def _create_messages_service(
+    session: Session, with_classification: bool = False
+) -> MessagesService:
+    """Create a MessagesService on the given session.
 
     Args:
+        session: The command's database session
         with_classification: Whether to inject a classification service
+    """
+    from app.services.messages_service import MessagesService
 
-    Returns:
-        Tuple of (MessagesService, list of sessions to close)
-    """
-    session = _store.create_session()
-    sessions = [session]
-
-    classification_service = None
-    if with_classification:
-        # Create a separate session for classification service with LLM strategy
-        class_session = _store.create_session()
-        sessions.append(class_session)
-        llm_strategy = LLMClassificationStrategy(model="openai:gpt-4o-mini")
-        classification_service = ClassificationService(
-            class_session,
-            strategy=llm_strategy,
-            top_n=config.CLASSIFICATION_TOP_N,
-            threshold=config.CLASSIFICATION_THRESHOLD,
-        )
-
+    classification_service = (
+        _create_classification_service(session) if with_classification else None
+    )
     return MessagesService(
-        session, classification_service=classification_service, store=_store
-    ), sessions
+        session, classification_service=classification_service, store=_get_store()
+    )
+
+
+def _create_categories_service(session: Session) -> CategoriesService:
+    """Create a CategoriesService on the given session."""
+    from app.services.categories_service import CategoriesService
 
+    return CategoriesService(session)
 
-def _create_categories_service():
-    """Create a CategoriesService with a fresh session."""
-    session = _store.create_session()
-    return CategoriesService(session), session
 
+def _create_classification_service(
+    session: Session,
+    top_n: int | None = None,
+    threshold: float | None = None,
+    use_cache: bool = True,
+    cache_threshold: float | None = None,
+) -> ClassificationService:
+    """Create a ClassificationService on the given session using LLM strategy.
+
+    Args:
+        session: The command's database session
+        top_n: Maximum number of categories per message
+        threshold: Minimum confidence score
+        use_cache: Whether to reuse cached LLM responses and classifications of
+            semantically similar messages
+        cache_threshold: Minimum embedding similarity for a cache hit
+    """
+    from app.services.classification import (
+        ClassificationService,
+        ClassificationStrategy,
+        LLMClassificationStrategy,
+        SemanticCacheStrategy,
+    )
 
-def _create_classification_service(top_n: int | None = None, threshold: float | None = None):
-    """Create a ClassificationService with a fresh session using LLM strategy."""
-    session = _store.create_session()
-    llm_strategy = LLMClassificationStrategy(model="openai:gpt-4o-mini")
-    return (
-        ClassificationService(
+    strategy: ClassificationStrategy = LLMClassificationStrategy(
+        response_cache=_create_llm_cache(session) if use_cache else None
+    )
+    if use_cache:
+        strategy = SemanticCacheStrategy(
+            strategy,
             session,
-            strategy=llm_strategy,
-            top_n=top_n if top_n is not None else config.CLASSIFICATION_TOP_N,
-            threshold=threshold if threshold is not None else config.CLASSIFICATION_THRESHOLD,
-        ),
+            similarity_threshold=(
+                cache_threshold if cache_threshold is not None else config.SEMANTIC_CACHE_THRESHOLD
+            ),
+        )
+    return ClassificationService(
         session,
+        strategy=strategy,
+        top_n=top_n if top_n is not None else config.CLASSIFICATION_TOP_N,
+        threshold=threshold if threshold is not None else config.CLASSIFICATION_THRESHOLD,
     )
 
 
-def _create_bootstrap_service():
-    """Create a BootstrapService with fresh sessions for its dependencies."""
-    # Bootstrap needs classification support for auto-classify
-    messages_service, msg_sessions = _create_messages_service(with_classification=True)
-    categories_service, cat_session = _create_categories_service()
-
-    # Combine all sessions for cleanup
-    all_sessions = [*msg_sessions, cat_session]
+def _create_bootstrap_service(
+    session: Session, classification_service: ClassificationService | None = None
+) -> BootstrapService:
+    """Create a BootstrapService whose dependencies share the given session.
 
-    return BootstrapService(_store, messages_service, categories_service), all_sessions
+    Args:
+        session: The command's database session
+        classification_service: Classification service for auto-classify, if enabled
+    """
+    from app.services.bootstrap_service import BootstrapService
+
+    messages_service = _create_messages_service(session)
+    categories_service = _create_categories_service(session)
+    return BootstrapService(
+        _get_store(),
+        messages_service,
+        categories_service,
+        classification_service=classification_service,
+    )
 
 
 # Register command groups
@@ -120,7 +261,7 @@ def callback():
     """
     Gmail-style message classification system CLI
     """
-    pass
+    _configure_logging()
 
 
 # ===== Bootstrap Command =====
@@ -160,6 +301,11 @@ def bootstrap_system(
     classification_threshold: float = typer.Option(
         0.5, "--threshold", "-t", help="Minimum similarity threshold for classification (0-1)"
     ),
+    concurrency: int = typer.Option(
+        config.CLASSIFICATION_CONCURRENCY,
+        "--concurrency",
+        help="Maximum number of classification requests in flight at once",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose debug logging"),
 ):
     """
@@ -176,123 +322,164 @@ def bootstrap_system(
         extra bootstrap --messages custom.jsonl --categories custom-cats.jsonl
         extra bootstrap --no-classify  # Skip auto-classification
         extra bootstrap --verbose  # Show detailed logging
+        extra bootstrap --concurrency 8  # More LLM requests in flight
     """
+    status = BufferedConsole(console)
+
     # Set logging level based on verbose flag
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
-        console.print("[dim]Debug logging enabled[/dim]\n")
+        status.write("[dim]Debug logging enabled[/dim]\n")
 
-    console.print("\n[bold cyan]Bootstrapping system...[/bold cyan]")
+    status.write("\n[bold cyan]Bootstrapping system...[/bold cyan]")
 
     if drop_existing:
-        console.print("[yellow]Dropping existing tables...[/yellow]")
+        status.write("[yellow]Dropping existing tables...[/yellow]")
 
     if auto_classify:
-        console.print(
+        status.write(
             f"[cyan]Auto-classification enabled (top_n={classification_top_n}, threshold={classification_threshold})[/cyan]\n"
         )
+    status.flush()
 
-    bootstrap_service, sessions = _create_bootstrap_service()
+    from app.services.messages_service import ClassificationOptions
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Loading data...", total=None)
-
-        try:
-            classification_opts = ClassificationOptions(
-                auto_classify=auto_classify,
-                top_n=classification_top_n,
-                threshold=classification_threshold,
+    with _cli_session() as session:
+        # Auto-classify uses the same cached strategy stack as `messages classify`
+        classification_service = (
+            _create_classification_service(
+                session, top_n=classification_top_n, threshold=classification_threshold
             )
-            result = bootstrap_service.bootstrap(
-                messages_file=messages_file,
-                categories_file=categories_file,
-                drop_existing=drop_existing,
-                classification_options=classification_opts,
+            if auto_classify
+            else None
+        )
+        bootstrap_service = _create_bootstrap_service(session, classification_service)
+
+        with _progress() as progress:
+            task = progress.add_task("Loading data...", total=None)
+
+            try:
+                classification_opts = ClassificationOptions(
+                    auto_classify=auto_classify,
+                    top_n=classification_top_n,
+                    threshold=classification_threshold,
+                    max_concurrency=concurrency,
+                )
+                result = bootstrap_service.bootstrap(
+                    messages_file=messages_file,
+                    categories_file=categories_file,
+                    drop_existing=drop_existing,
+                    classification_options=classification_opts,
+                )
+                progress.update(task, description="Complete!")
+            except Exception as e:
+                console.print(_ERROR_PREFIX + str(e))
+                raise typer.Exit(code=1) from e
+
+        status.write(Text.assemble("\n", _DONE_PREFIX, "Successfully bootstrapped system"))
+        status.write(f"  • Categories: {result.total_categories}")
+        status.write(f"  • Messages: {result.total_messages}")
+        if auto_classify and result.total_classified > 0:
+            status.write(f"  • Classified: {result.total_classified}\n")
+        else:
+            status.write()
+
+        # Display category preview
+        if result.preview_categories:
+            status.write(Panel.fit("[bold]Category Preview[/bold]", border_style="cyan"))
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan", justify="right")
+            table.add_column("Name", style="green")
+            table.add_column(
+                "Description", style="white", no_wrap=True, overflow="ellipsis", max_width=60
             )
-            progress.update(task, description="Complete!")
-        except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {e}")
-            # Clean up sessions on error
-            for session in sessions:
-                session.close()
-            raise typer.Exit(code=1) from e
-
-    console.print("\n[bold green]✓[/bold green] Successfully bootstrapped system")
-    console.print(f"  • Categories: {result.total_categories}")
-    console.print(f"  • Messages: {result.total_messages}")
-    if auto_classify and result.total_classified > 0:
-        console.print(f"  • Classified: {result.total_classified}\n")
-    else:
-        console.print()
-
-    # Display category preview
-    if result.preview_categories:
-        console.print(Panel.fit("[bold]Category Preview[/bold]", border_style="cyan"))
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan", justify="right")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white", no_wrap=False)
+            for cat in result.preview_categories:
+                table.add_row(str(cat.id), cat.name, cat.description)
 
-        for cat in result.preview_categories:
-            table.add_row(
-                str(cat.id),
-                cat.name,
-                cat.description[:60] + "..." if len(cat.description) > 60 else cat.description,
+            status.write(table)
+            status.write()
+
+        # Display message preview
+        if result.preview_messages:
+            status.write(Panel.fit("[bold]Message Preview[/bold]", border_style="cyan"))
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column(
+                "Subject", style="cyan", no_wrap=True, overflow="ellipsis", max_width=50
+            )
+            table.add_column("From", style="green")
+            table.add_column("Date", style="yellow")
+            table.add_column(
+                "Snippet", style="white", no_wrap=True, overflow="ellipsis", max_width=40
+            )
+            table.add_column(
+                "Categories", style="magenta", no_wrap=True, overflow="ellipsis", max_width=25
             )
 
-        console.print(table)
-        console.print()
+            for row in _preview_rows(result.preview_messages):
+                table.add_row(*row)
+
+            status.write(table)
+            status.write()
+
+            # Show classification details if auto-classify was enabled
+            if auto_classify and result.preview_messages:
+                status.write(Panel.fit("[bold]Classification Details[/bold]", border_style="cyan"))
+
+                # Show classification details from the message_categories association table
+                for msg in result.preview_messages[:3]:  # Show details for first 3 messages
+                    if msg.message_categories:
+                        status.write(_heading("Message:", msg.subject[:60]))
+                        # Access the association objects directly to get score and explanation
+                        for mc in msg.message_categories:
+                            status.write(
+                                f"  [green]✓[/green] Category: [magenta]{mc.category.name}[/magenta] "
+                                f"(score: {mc.score:.4f})"
+                            )
+                            status.write(f"    [dim]{mc.explanation}[/dim]")
+                        status.write()
 
-    # Display message preview
-    if result.preview_messages:
-        console.print(Panel.fit("[bold]Message Preview[/bold]", border_style="cyan"))
+        status.flush()
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Subject", style="cyan", no_wrap=False)
-        table.add_column("From", style="green")
-        table.add_column("Date", style="yellow")
-        table.add_column("Snippet", style="white", no_wrap=False, max_width=40)
-        table.add_column("Categories", style="magenta", no_wrap=False, max_width=25)
 
-        for msg in result.preview_messages:
-            table.add_row(
-                msg.subject[:50] + "..." if len(msg.subject) > 50 else msg.subject,
-                msg.sender,
-                msg.date.strftime("%Y-%m-%d %H:%M") if msg.date else "N/A",
-                msg.snippet[:40] + "..."
-                if msg.snippet and len(msg.snippet) > 40
-                else msg.snippet or "",
-                ", ".join([cat.name for cat in msg.categories])[:25] if msg.categories else "-",
-            )
+# ===== Doctor Command =====
 
-        console.print(table)
-        console.print()
 
-        # Show classification details if auto-classify was enabled
-        if auto_classify and result.preview_messages:
-            console.print(Panel.fit("[bold]Classification Details[/bold]", border_style="cyan"))
+@app.command(name="doctor")
+def doctor():
+    """
+    Show configuration and cache health.
 
-            # Show classification details from the message_categories association table
-            for msg in result.preview_messages[:3]:  # Show details for first 3 messages
-                if msg.message_categories:
-                    console.print(f"\n[bold cyan]Message:[/bold cyan] {msg.subject[:60]}")
-                    # Access the association objects directly to get score and explanation
-                    for mc in msg.message_categories:
-                        console.print(
-                            f"  [green]✓[/green] Category: [magenta]{mc.category.name}[/magenta] "
-                            f"(score: {mc.score:.4f})"
-                        )
-                        console.print(f"    [dim]{mc.explanation}[/dim]")
-                    console.print()
+    Reports the LLM response cache size, how many entries have expired, and how many
+    LLM calls it has saved.
 
-    # Clean up sessions after all printing is done
-    for session in sessions:
-        session.close()
+    Examples:
+        extra doctor
+    """
+    status = BufferedConsole(console)
+    status.write(_heading("Database:", config.DATABASE_URL, end="\n"))
+
+    try:
+        with _cli_session() as session:
+            total, expired, hits = _create_llm_cache(session).stats()
+
+            table = Table(show_header=True, header_style="bold magenta", title="LLM Response Cache")
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", style="green", justify="right")
+            table.add_row("Entries", str(total))
+            table.add_row("Expired", str(expired))
+            table.add_row("Hits (LLM calls saved)", str(hits))
+            table.add_row("TTL (seconds)", str(config.LLM_CACHE_TTL_SECONDS))
+
+            status.write(table)
+            status.write()
+    except Exception as e:
+        status.write(_ERROR_PREFIX + str(e))
+        raise typer.Exit(code=1) from e
+    finally:
+        status.flush()
 
 
 # ===== Messages Commands =====
@@ -322,6 +509,11 @@ def import_messages(
     classification_threshold: float = typer.Option(
         0.5, "--threshold", "-t", help="Minimum similarity threshold for classification (0-1)"
     ),
+    concurrency: int = typer.Option(
+        config.CLASSIFICATION_CONCURRENCY,
+        "--concurrency",
+        help="Maximum number of classification requests in flight (when using --classify)",
+    ),
 ):
     """
     Import messages from a JSONL file into the SQLite database.
@@ -339,83 +531,80 @@ def import_messages(
         extra messages import sample.jsonl
         extra messages import sample.jsonl --classify --top-n 5 --threshold 0.7
     """
-    console.print(f"\n[bold cyan]Importing messages from:[/bold cyan] {filename}")
+    status = BufferedConsole(console)
+    status.write(_heading("Importing messages from:", filename))
 
     if drop_existing:
-        console.print("[yellow]Dropping existing tables...[/yellow]")
+        status.write("[yellow]Dropping existing tables...[/yellow]")
 
     if auto_classify:
-        console.print(
+        status.write(
             f"[cyan]Auto-classification enabled (top_n={classification_top_n}, threshold={classification_threshold})[/cyan]"
         )
+    status.flush()
 
-    # Create messages service with classification support if auto_classify is enabled
-    messages_service, sessions = _create_messages_service(with_classification=auto_classify)
+    from app.services.messages_service import ClassificationOptions, ImportOptions
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing messages...", total=None)
-
-        try:
-            # Use service to handle the import
-            classification_opts = ClassificationOptions(
-                auto_classify=auto_classify,
-                top_n=classification_top_n,
-                threshold=classification_threshold,
+    # Create messages service with classification support if auto_classify is enabled
+    with _cli_session() as session:
+        messages_service = _create_messages_service(session, with_classification=auto_classify)
+
+        with _progress() as progress:
+            task = progress.add_task("Processing messages...", total=None)
+
+            try:
+                # Use service to handle the import
+                classification_opts = ClassificationOptions(
+                    auto_classify=auto_classify,
+                    top_n=classification_top_n,
+                    threshold=classification_threshold,
+                    max_concurrency=concurrency,
+                )
+                options = ImportOptions(
+                    drop_existing=drop_existing, classification=classification_opts
+                )
+                result = messages_service.import_from_jsonl(file_path=filename, options=options)
+                progress.update(task, description=f"Loaded {result.total_imported} messages")
+            except Exception as e:
+                console.print(_ERROR_PREFIX + str(e))
+                raise typer.Exit(code=1) from e
+
+        status.write(
+            Text.assemble(
+                "\n", _DONE_PREFIX, f"Successfully imported {result.total_imported} messages"
             )
-            options = ImportOptions(drop_existing=drop_existing, classification=classification_opts)
-            result = messages_service.import_from_jsonl(file_path=filename, options=options)
-            progress.update(task, description=f"Loaded {result.total_imported} messages")
-        except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {e}")
-            for session in sessions:
-                session.close()
-            raise typer.Exit(code=1) from e
-
-    console.print(
-        f"\n[bold green]✓[/bold green] Successfully imported {result.total_imported} messages"
-    )
-    if auto_classify:
-        console.print("[bold green]✓[/bold green] Messages have been classified into categories\n")
-    else:
-        console.print()
-
-    # Display preview
-    console.print(Panel.fit("[bold]Preview: First 5 messages[/bold]", border_style="cyan"))
-
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Subject", style="cyan", no_wrap=False)
-    table.add_column("From", style="green")
-    table.add_column("Date", style="yellow")
-    table.add_column("Snippet", style="white", no_wrap=False, max_width=40)
-    table.add_column("Categories", style="magenta", no_wrap=False, max_width=25)
-
-    for msg in result.preview_messages:
-        table.add_row(
-            msg.subject[:50] + "..." if len(msg.subject) > 50 else msg.subject,
-            msg.sender,
-            msg.date.strftime("%Y-%m-%d %H:%M") if msg.date else "N/A",
-            msg.snippet[:40] + "..."
-            if msg.snippet and len(msg.snippet) > 40
-            else msg.snippet or "",
-            ", ".join([cat.name for cat in msg.categories])[:25] if msg.categories else "-",
         )
+        if auto_classify:
+            status.write(_DONE_PREFIX + "Messages have been classified into categories\n")
+        else:
+            status.write()
 
-    console.print(table)
-    console.print()
+        # Display preview
+        status.write(Panel.fit("[bold]Preview: First 5 messages[/bold]", border_style="cyan"))
 
-    # Show classification details if auto-classify was enabled
-    if auto_classify and result.preview_messages:
-        console.print(Panel.fit("[bold]Classification Details[/bold]", border_style="cyan"))
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Subject", style="cyan", no_wrap=True, overflow="ellipsis", max_width=50)
+        table.add_column("From", style="green")
+        table.add_column("Date", style="yellow")
+        table.add_column("Snippet", style="white", no_wrap=True, overflow="ellipsis", max_width=40)
+        table.add_column(
+            "Categories", style="magenta", no_wrap=True, overflow="ellipsis", max_width=25
+        )
+
+        for row in _preview_rows(result.preview_messages):
+            table.add_row(*row)
 
-        classification_service, class_session = _create_classification_service()
-        try:
+        status.write(table)
+        status.write()
+
+        # Show classification details if auto-classify was enabled
+        if auto_classify and result.preview_messages:
+            status.write(Panel.fit("[bold]Classification Details[/bold]", border_style="cyan"))
+
+            classification_service = _create_classification_service(session)
             for msg in result.preview_messages[:3]:  # Show details for first 3 messages
                 if msg.categories:
-                    console.print(f"\n[bold cyan]Message:[/bold cyan] {msg.subject[:60]}")
+                    status.write(_heading("Message:", msg.subject[:60]))
                     # Get classification details with explanations
                     try:
                         classification = asyncio.run(
@@ -427,24 +616,20 @@ def import_messages(
                             classification.explanations,
                             strict=True,
                         ):
-                            console.print(
+                            status.write(
                                 f"  [green]✓[/green] Category: [magenta]{cat.name}[/magenta] "
                                 f"(score: {score:.4f})"
                             )
-                            console.print(f"    [dim]{explanation}[/dim]")
+                            status.write(f"    [dim]{explanation}[/dim]")
                     except Exception:
                         # Fallback to simple category listing if classification fails
                         for cat in msg.categories:
-                            console.print(
+                            status.write(
                                 f"  [green]✓[/green] Category: [magenta]{cat.name}[/magenta]"
                             )
-                    console.print()
-        finally:
-            class_session.close()
+                    status.write()
 
-    # Clean up sessions after all printing is done
-    for session in sessions:
-        session.close()
+        status.flush()
 
 
 @messages_app.command(name="list")
@@ -455,40 +640,44 @@ def list_messages(
     """
     List messages from the database.
     """
-    console.print(f"\n[bold cyan]Messages (limit={limit}, offset={offset}):[/bold cyan]\n")
+    status = BufferedConsole(console)
+    status.write(f"\n[bold cyan]Messages (limit={limit}, offset={offset}):[/bold cyan]\n")
 
-    messages_service, sessions = _create_messages_service(with_classification=False)
     try:
-        messages = messages_service.list_messages(limit=limit, offset=offset)
-
-        if not messages:
-            console.print("[yellow]No messages found.[/yellow]\n")
-            return
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan", max_width=15)
-        table.add_column("Subject", style="green", no_wrap=False, max_width=30)
-        table.add_column("From", style="yellow", max_width=25)
-        table.add_column("Date", style="white")
-        table.add_column("Categories", style="magenta", no_wrap=False, max_width=30)
-
-        for msg in messages:
-            table.add_row(
-                msg.id[:15] + "..." if len(msg.id) > 15 else msg.id,
-                msg.subject[:30] + "..." if len(msg.subject) > 30 else msg.subject,
-                msg.sender[:25] + "..." if len(msg.sender) > 25 else msg.sender,
-                msg.date.strftime("%Y-%m-%d %H:%M") if msg.date else "N/A",
-                ", ".join([cat.name for cat in msg.categories]) if msg.categories else "-",
+        with _cli_session() as session:
+            messages_service = _create_messages_service(session, with_classification=False)
+            messages = messages_service.list_messages(limit=limit, offset=offset)
+
+            if not messages:
+                status.write("[yellow]No messages found.[/yellow]\n")
+                return
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan", no_wrap=True, overflow="ellipsis", max_width=15)
+            table.add_column(
+                "Subject", style="green", no_wrap=True, overflow="ellipsis", max_width=30
             )
-
-        console.print(table)
-        console.print()
+            table.add_column(
+                "From", style="yellow", no_wrap=True, overflow="ellipsis", max_width=25
+            )
+            table.add_column("Date", style="white")
+            table.add_column("Categories", style="magenta", no_wrap=False, max_width=30)
+
+            ids = [msg.id for msg in messages]
+            subjects = [msg.subject for msg in messages]
+            senders = [msg.sender for msg in messages]
+            for row in zip(
+                ids, subjects, senders, _dates(messages), _category_names(messages), strict=True
+            ):
+                table.add_row(*row)
+
+            status.write(table)
+            status.write()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        for session in sessions:
-            session.close()
+        status.flush()
 
 
 @messages_app.command(name="get")
@@ -496,39 +685,40 @@ def get_message(message_id: str = typer.Argument(..., help="Message ID")):
     """
     Get a message by ID and display its details.
     """
-    console.print(f"\n[bold cyan]Getting message ID:[/bold cyan] {message_id}\n")
+    status = BufferedConsole(console)
+    status.write(_heading("Getting message ID:", message_id, end="\n"))
 
-    messages_service, sessions = _create_messages_service(with_classification=False)
     try:
-        result = messages_service.get_message(message_id)
-
-        if not result:
-            console.print(f"[yellow]Message with ID {message_id} not found.[/yellow]\n")
-            raise typer.Exit(code=1)
-
-        msg = result.message
-
-        # Display message details
-        console.print(
-            Panel.fit(
-                f"[bold]Subject:[/bold] {msg.subject}\n"
-                f"[bold]From:[/bold] {msg.sender}\n"
-                f"[bold]To:[/bold] {', '.join(msg.to)}\n"
-                f"[bold]Date:[/bold] {msg.date.strftime('%Y-%m-%d %H:%M:%S') if msg.date else 'N/A'}\n"
-                f"[bold]Snippet:[/bold] {msg.snippet or 'N/A'}\n\n"
-                f"[bold]Categories:[/bold] {', '.join([cat.name for cat in msg.categories]) if msg.categories else 'None'}\n\n"
-                f"[bold]Body:[/bold]\n{msg.body[:500] + '...' if msg.body and len(msg.body) > 500 else msg.body or 'N/A'}",
-                title=f"Message {msg.id}",
-                border_style="cyan",
+        with _cli_session() as session:
+            messages_service = _create_messages_service(session, with_classification=False)
+            result = messages_service.get_message(message_id)
+
+            if not result:
+                status.write(f"[yellow]Message with ID {message_id} not found.[/yellow]\n")
+                raise typer.Exit(code=1)
+
+            msg = result.message
+
+            # Display message details
+            status.write(
+                Panel.fit(
+                    f"[bold]Subject:[/bold] {msg.subject}\n"
+                    f"[bold]From:[/bold] {msg.sender}\n"
+                    f"[bold]To:[/bold] {', '.join(msg.to)}\n"
+                    f"[bold]Date:[/bold] {msg.date.strftime('%Y-%m-%d %H:%M:%S') if msg.date else 'N/A'}\n"
+                    f"[bold]Snippet:[/bold] {msg.snippet or 'N/A'}\n\n"
+                    f"[bold]Categories:[/bold] {', '.join([cat.name for cat in msg.categories]) if msg.categories else 'None'}\n\n"
+                    f"[bold]Body:[/bold]\n{msg.body[:500] + '...' if msg.body and len(msg.body) > 500 else msg.body or 'N/A'}",
+                    title=f"Message {msg.id}",
+                    border_style="cyan",
+                )
             )
-        )
-        console.print()
+            status.write()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        for session in sessions:
-            session.close()
+        status.flush()
 
 
 @messages_app.command(name="delete")
@@ -548,23 +738,24 @@ def delete_message(
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
 
-    console.print(f"\n[bold cyan]Deleting message ID:[/bold cyan] {message_id}")
+    status = BufferedConsole(console)
+    status.write(_heading("Deleting message ID:", message_id))
 
-    messages_service, sessions = _create_messages_service(with_classification=False)
     try:
-        success = messages_service.delete_message(message_id)
+        with _cli_session() as session:
+            messages_service = _create_messages_service(session, with_classification=False)
+            success = messages_service.delete_message(message_id)
 
-        if not success:
-            console.print(f"[yellow]Message with ID {message_id} not found.[/yellow]\n")
-            raise typer.Exit(code=1)
+            if not success:
+                status.write(f"[yellow]Message with ID {message_id} not found.[/yellow]\n")
+                raise typer.Exit(code=1)
 
-        console.print("[bold green]✓[/bold green] Successfully deleted message\n")
+            status.write(_DONE_PREFIX + "Successfully deleted message\n")
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        for session in sessions:
-            session.close()
+        status.flush()
 
 
 @messages_app.command(name="classify")
@@ -574,6 +765,14 @@ def classify_message(
     threshold: float = typer.Option(
         0.5, "--threshold", "-t", help="Minimum similarity score (0-1)"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM instead of reusing similar classifications"
+    ),
+    cache_threshold: float = typer.Option(
+        config.SEMANTIC_CACHE_THRESHOLD,
+        "--cache-threshold",
+        help="Minimum embedding similarity to reuse a cached classification (0-1)",
+    ),
 ):
     """
     Classify a message into categories using LLM-based semantic analysis.
@@ -584,60 +783,67 @@ def classify_message(
     Examples:
         extra messages classify msg123
         extra messages classify msg123 --top-n 5 --threshold 0.7
+        extra messages classify msg123 --no-cache
     """
-    console.print(f"\n[bold cyan]Classifying message ID:[/bold cyan] {message_id}")
-    console.print(f"[dim]Parameters: top_n={top_n}, threshold={threshold}[/dim]\n")
+    status = BufferedConsole(console)
+    status.write(_heading("Classifying message ID:", message_id))
+    status.write(f"[dim]Parameters: top_n={top_n}, threshold={threshold}[/dim]\n")
 
-    classification_service, session = _create_classification_service(
-        top_n=top_n, threshold=threshold
-    )
     try:
-        result = asyncio.run(classification_service.classify_message_by_id(message_id))
-
-        if not result.matched_categories:
-            console.print("[yellow]No categories matched above the threshold.[/yellow]\n")
-            return
-
-        console.print("[bold green]✓[/bold green] Classification complete\n")
-
-        # Display message info
-        console.print(
-            Panel.fit(
-                f"[bold]Subject:[/bold] {result.message.subject}\n"
-                f"[bold]From:[/bold] {result.message.sender}",
-                title=f"Message {result.message.id}",
-                border_style="cyan",
+        with _cli_session() as session:
+            classification_service = _create_classification_service(
+                session,
+                top_n=top_n,
+                threshold=threshold,
+                use_cache=not no_cache,
+                cache_threshold=cache_threshold,
             )
-        )
-        console.print()
-
-        # Display matched categories
-        table = Table(show_header=True, header_style="bold magenta", title="Matched Categories")
-        table.add_column("Category", style="green")
-        table.add_column("Score", style="yellow", justify="right")
-        table.add_column("In Category", style="cyan", justify="center")
-        table.add_column("Explanation", style="white", no_wrap=False)
-
-        for cat, score, explanation in zip(
-            result.matched_categories, result.scores, result.explanations, strict=True
-        ):
-            table.add_row(
-                cat.name,
-                f"{score:.4f}",
-                "✓",
-                explanation,
+            result = asyncio.run(classification_service.classify_message_by_id(message_id))
+
+            if not result.matched_categories:
+                status.write("[yellow]No categories matched above the threshold.[/yellow]\n")
+                return
+
+            status.write(_DONE_PREFIX + "Classification complete\n")
+
+            # Display message info
+            status.write(
+                Panel.fit(
+                    f"[bold]Subject:[/bold] {result.message.subject}\n"
+                    f"[bold]From:[/bold] {result.message.sender}",
+                    title=f"Message {result.message.id}",
+                    border_style="cyan",
+                )
             )
-
-        console.print(table)
-        console.print()
+            status.write()
+
+            # Display matched categories
+            table = Table(show_header=True, header_style="bold magenta", title="Matched Categories")
+            table.add_column("Category", style="green")
+            table.add_column("Score", style="yellow", justify="right")
+            table.add_column("In Category", style="cyan", justify="center")
+            table.add_column("Explanation", style="white", no_wrap=False)
+
+            for cat, score, explanation in zip(
+                result.matched_categories, result.scores, result.explanations, strict=True
+            ):
+                table.add_row(
+                    cat.name,
+                    f"{score:.4f}",
+                    "✓",
+                    explanation,
+                )
+
+            status.write(table)
+            status.write()
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 # ===== Category Commands =====
@@ -654,31 +860,35 @@ def create_category(
     Example:
         extra category create "Work Travel" "Work-related travel receipts from airlines"
     """
-    console.print(f"\n[bold cyan]Creating category:[/bold cyan] {name}")
+    status = BufferedConsole(console)
+    status.write(_heading("Creating category:", name))
 
-    categories_service, session = _create_categories_service()
     try:
-        result = categories_service.create_category(name, description)
+        with _cli_session() as session:
+            categories_service = _create_categories_service(session)
+            result = categories_service.create_category(name, description)
 
-        console.print("[bold green]✓[/bold green] Successfully created category\n")
+            status.write(_DONE_PREFIX + "Successfully created category\n")
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white")
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Description", style="white")
 
-        table.add_row(str(result.category.id), result.category.name, result.category.description)
+            table.add_row(
+                str(result.category.id), result.category.name, result.category.description
+            )
 
-        console.print(table)
-        console.print()
+            status.write(table)
+            status.write()
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 @category_app.command(name="list")
@@ -686,31 +896,33 @@ def list_categories():
     """
     List all categories.
     """
-    console.print("\n[bold cyan]Categories:[/bold cyan]\n")
+    status = BufferedConsole(console)
+    status.write("\n[bold cyan]Categories:[/bold cyan]\n")
 
-    categories_service, session = _create_categories_service()
     try:
-        categories = categories_service.list_categories()
+        with _cli_session() as session:
+            categories_service = _create_categories_service(session)
+            categories = categories_service.list_categories()
 
-        if not categories:
-            console.print("[yellow]No categories found.[/yellow]\n")
-            return
+            if not categories:
+                status.write("[yellow]No categories found.[/yellow]\n")
+                return
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white", no_wrap=False)
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Description", style="white", no_wrap=False)
 
-        for cat in categories:
-            table.add_row(str(cat.id), cat.name, cat.description)
+            for cat in categories:
+                table.add_row(str(cat.id), cat.name, cat.description)
 
-        console.print(table)
-        console.print()
+            status.write(table)
+            status.write()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 @category_app.command(name="get")
@@ -718,30 +930,34 @@ def get_category(category_id: int = typer.Argument(..., help="Category ID")):
     """
     Get a category by ID.
     """
-    console.print(f"\n[bold cyan]Getting category ID:[/bold cyan] {category_id}\n")
+    status = BufferedConsole(console)
+    status.write(_heading("Getting category ID:", category_id, end="\n"))
 
-    categories_service, session = _create_categories_service()
     try:
-        result = categories_service.get_category(category_id)
+        with _cli_session() as session:
+            categories_service = _create_categories_service(session)
+            result = categories_service.get_category(category_id)
 
-        if not result:
-            console.print(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
-            raise typer.Exit(code=1)
+            if not result:
+                status.write(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
+                raise typer.Exit(code=1)
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white", no_wrap=False)
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Description", style="white", no_wrap=False)
 
-        table.add_row(str(result.category.id), result.category.name, result.category.description)
+            table.add_row(
+                str(result.category.id), result.category.name, result.category.description
+            )
 
-        console.print(table)
-        console.print()
+            status.write(table)
+            status.write()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 @category_app.command(name="update")
@@ -762,35 +978,41 @@ def update_category(
         )
         raise typer.Exit(code=1)
 
-    console.print(f"\n[bold cyan]Updating category ID:[/bold cyan] {category_id}")
+    status = BufferedConsole(console)
+    status.write(_heading("Updating category ID:", category_id))
 
-    categories_service, session = _create_categories_service()
     try:
-        result = categories_service.update_category(category_id, name=name, description=description)
+        with _cli_session() as session:
+            categories_service = _create_categories_service(session)
+            result = categories_service.update_category(
+                category_id, name=name, description=description
+            )
 
-        if not result:
-            console.print(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
-            raise typer.Exit(code=1)
+            if not result:
+                status.write(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
+                raise typer.Exit(code=1)
 
-        console.print("[bold green]✓[/bold green] Successfully updated category\n")
+            status.write(_DONE_PREFIX + "Successfully updated category\n")
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white", no_wrap=False)
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Description", style="white", no_wrap=False)
 
-        table.add_row(str(result.category.id), result.category.name, result.category.description)
+            table.add_row(
+                str(result.category.id), result.category.name, result.category.description
+            )
 
-        console.print(table)
-        console.print()
+            status.write(table)
+            status.write()
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 @category_app.command(name="delete")
@@ -810,22 +1032,24 @@ def delete_category(
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(code=0)
 
-    console.print(f"\n[bold cyan]Deleting category ID:[/bold cyan] {category_id}")
+    status = BufferedConsole(console)
+    status.write(_heading("Deleting category ID:", category_id))
 
-    categories_service, session = _create_categories_service()
     try:
-        success = categories_service.delete_category(category_id)
+        with _cli_session() as session:
+            categories_service = _create_categories_service(session)
+            success = categories_service.delete_category(category_id)
 
-        if not success:
-            console.print(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
-            raise typer.Exit(code=1)
+            if not success:
+                status.write(f"[yellow]Category with ID {category_id} not found.[/yellow]\n")
+                raise typer.Exit(code=1)
 
-        console.print("[bold green]✓[/bold green] Successfully deleted category\n")
+            status.write(_DONE_PREFIX + "Successfully deleted category\n")
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        status.write(_ERROR_PREFIX + str(e))
         raise typer.Exit(code=1) from e
     finally:
-        session.close()
+        status.flush()
 
 
 if __name__ == "__main__":
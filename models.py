@@ -1,7 +1,45 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+import numpy as np
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.types import TypeDecorator
+
+# Flattens line breaks in repr previews in a single pass
+_REPR_WHITESPACE = str.maketrans({"\n": " ", "\r": None})
+
+
+class Float32Vector(TypeDecorator):
+    """
+    Embedding stored as raw float32 bytes (4 bytes per dimension) instead of JSON text.
+
+    Values are bound from and loaded as list[float], so callers are unaffected; loading
+    is a single buffer copy rather than a JSON parse.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return np.asarray(value, dtype=np.float32).tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=np.float32).tolist()
 
 
 class Base(DeclarativeBase):
@@ -19,6 +57,9 @@ class MessageCategory(Base):
     """
 
     __tablename__ = "message_categories"
+    # The primary key indexes (message_id, category_id); this covers lookups by category,
+    # e.g. the cascade when a category is deleted
+    __table_args__ = (Index("ix_message_categories_category_message", "category_id", "message_id"),)
 
     message_id = Column(String, ForeignKey("messages.id", ondelete="CASCADE"), primary_key=True)
     category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
@@ -28,7 +69,8 @@ class MessageCategory(Base):
 
     # Relationships to parent objects
     message = relationship("Message", back_populates="message_categories")
-    category = relationship("Category", back_populates="category_messages")
+    # Few categories, so joining them onto each association row is cheap
+    category = relationship("Category", back_populates="category_messages", lazy="joined")
 
 
 class Message(Base):
@@ -44,12 +86,13 @@ class Message(Base):
     to = Column(JSON, nullable=False)
     snippet = Column(String, nullable=True)
     body = Column(Text, nullable=True)
-    date = Column(DateTime, nullable=True)
-    embedding = Column(JSON, nullable=True)  # List[float] stored as JSON
+    date = Column(DateTime, nullable=True, index=True)  # Orders the message list
+    embedding = Column(Float32Vector, nullable=True)
 
-    # Relationship to association objects
+    # Relationship to association objects, loaded for all messages of a query in one
+    # extra SELECT (managers may still choose a different loader per query)
     message_categories = relationship(
-        "MessageCategory", back_populates="message", cascade="all, delete-orphan"
+        "MessageCategory", back_populates="message", cascade="all, delete-orphan", lazy="selectin"
     )
 
     # Convenience property for accessing categories directly
@@ -58,10 +101,15 @@ class Message(Base):
         """Get list of categories for this message."""
         return [mc.category for mc in self.message_categories]
 
+    @property
+    def categories_str(self) -> str:
+        """Comma-separated category names, for display."""
+        return ", ".join(mc.category.name for mc in self.message_categories)
+
     def __repr__(self):
         body_preview = ""
         if self.body is not None:
-            body_preview = self.body[:100].replace("\n", " ").replace("\r", "") + "..."
+            body_preview = self.body[:100].translate(_REPR_WHITESPACE) + "..."
         return (
             f"<Message(id={self.id}, subject='{self.subject}', sender='{self.sender}', "
             f"to={self.to}, date='{self.date}', body_preview='{body_preview}')>"
@@ -78,7 +126,7 @@ class Category(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False, unique=True)
     description = Column(Text, nullable=False)
-    embedding = Column(JSON, nullable=True)  # List[float] stored as JSON
+    embedding = Column(Float32Vector, nullable=True)
 
     # Relationship to association objects
     category_messages = relationship(
@@ -94,7 +142,62 @@ class Category(Base):
     def __repr__(self):
         desc_preview = ""
         if self.description is not None:
-            desc_preview = self.description[:100].replace("\n", " ").replace("\r", "")
+            desc_preview = self.description[:100].translate(_REPR_WHITESPACE)
             if len(self.description) > 100:
                 desc_preview += "..."
         return f"<Category(id={self.id}, name='{self.name}', description='{desc_preview}')>"
+
+
+class ClassificationCacheEntry(Base):
+    """
+    ORM model for a cached classification, reused for semantically similar messages.
+
+    Entries are only valid for the category set and settings they were computed with,
+    which is captured by the signature.
+    """
+
+    __tablename__ = "classification_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    signature = Column(String, nullable=False, index=True)  # Hash of categories + settings
+    embedding = Column(Float32Vector, nullable=False)  # Embedding of the classified message
+    matches = Column(JSON, nullable=False)  # List of [category_id, score, explanation]
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self):
+        return f"<ClassificationCacheEntry(id={self.id}, signature='{self.signature[:12]}')>"
+
+
+class LLMCacheEntry(Base):
+    """
+    ORM model for a cached LLM response, keyed by a hash of the exact request.
+    """
+
+    __tablename__ = "llm_cache"
+
+    key = Column(String, primary_key=True)  # SHA-256 of model, instructions and prompt
+    response = Column(JSON, nullable=False)  # Structured output as returned by the model
+    hits = Column(Integer, nullable=False, default=0)  # Times this response was reused
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self):
+        return f"<LLMCacheEntry(key='{self.key[:12]}', hits={self.hits})>"
+
+
+class CategoryEmbeddingEntry(Base):
+    """
+    ORM model for a cached category embedding, keyed by the exact text that was embedded.
+
+    Entries depend only on content, so the table is kept when existing data is dropped.
+    """
+
+    __tablename__ = "category_embeddings"
+    __table_args__ = ({"info": {"keep_on_drop": True}},)
+
+    provider = Column(String, primary_key=True)
+    model = Column(String, primary_key=True)
+    content_hash = Column(String, primary_key=True)  # SHA-256 of the embedded text
+    vector = Column(LargeBinary, nullable=False)  # float32 array bytes
+
+    def __repr__(self):
+        return f"<CategoryEmbeddingEntry(model='{self.model}', hash='{self.content_hash[:12]}')>"
@@ -3,34 +3,55 @@ Pytest configuration and shared fixtures.
 """
 
 import base64
+import functools
 import hashlib
 import json
-import tempfile
 from datetime import datetime
-from pathlib import Path
 
+import numpy as np
 import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
 
+from app.controllers.messages_controller import MessagesController
+from app.managers.message_manager import MessageManager
 from app.services.embedding_service import EmbeddingService
 from app.stores.sqlite_store import SQLiteStore
 from models import Category, Message
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary test database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = f"sqlite:///{tmp.name}"
-        yield db_path
-        # Cleanup
-        Path(tmp.name).unlink(missing_ok=True)
+def temp_db(tmp_path):
+    """Create a temporary test database (pytest removes it, with any WAL files)."""
+    return f"sqlite:///{tmp_path / 'test.db'}"
 
 
-@pytest.fixture
-def sqlite_store(temp_db):
-    """Create a SQLiteStore instance with a temporary database."""
-    store = SQLiteStore(db_path=temp_db, echo=False)
+@pytest.fixture(scope="session")
+def schema_template():
+    """Create the schema once, in an in-memory database that tests copy from."""
+    store = SQLiteStore(db_path="sqlite://", echo=False)
     store.init_db(drop_existing=True)
+    connection = store.engine.raw_connection()
+    yield connection.driver_connection
+    connection.close()
+
+
+@pytest.fixture
+def sqlite_store(schema_template):
+    """
+    Create a SQLiteStore instance with a private in-memory database.
+
+    The empty schema is copied in with SQLite's backup API, which takes a fraction of
+    the time of running the DDL for every test.
+    """
+    store = SQLiteStore(db_path="sqlite://", echo=False)
+    connection = store.engine.raw_connection()
+    try:
+        schema_template.backup(connection.driver_connection)
+    finally:
+        connection.close()
     yield store
 
 
@@ -42,6 +63,49 @@ def db_session(sqlite_store):
     session.close()
 
 
+@pytest.fixture
+def strict_session(sqlite_store):
+    """
+    Database session that raises instead of lazy loading a relationship.
+
+    Every top-level ORM query gets raiseload("*"), so touching a relationship the query
+    didn't eager-load fails the test rather than quietly issuing one SELECT per row.
+    """
+    session = sqlite_store.create_session()
+
+    @event.listens_for(session, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state):
+        if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def api_client_factory():
+    """
+    Build a TestClient for an app serving one router.
+
+    Overrides are installed as the app's dependency_overrides; tests that swap them
+    per test can reach the app through client.app.
+    """
+
+    def make_client(router: APIRouter, overrides: dict | None = None) -> TestClient:
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides.update(overrides or {})
+        return TestClient(app)
+
+    return make_client
+
+
+@pytest.fixture(scope="session")
+def messages_controller():
+    """Build the MessagesController, and register its routes, once for the session."""
+    return MessagesController()
+
+
 @pytest.fixture
 def sample_message_data():
     """Sample message data for testing."""
@@ -91,12 +155,16 @@ def sample_messages_data():
 
 
 @pytest.fixture
-def sample_jsonl_file(tmp_path, sample_messages_data):
+def sample_jsonl_bytes(sample_messages_data):
+    """Sample messages encoded as JSONL, for uploads that don't need a file on disk."""
+    return "".join(f"{json.dumps(msg)}\n" for msg in sample_messages_data).encode()
+
+
+@pytest.fixture
+def sample_jsonl_file(tmp_path, sample_jsonl_bytes):
     """Create a temporary JSONL file with sample messages."""
     file_path = tmp_path / "test_messages.jsonl"
-    with open(file_path, "w") as f:
-        for msg in sample_messages_data:
-            f.write(json.dumps(msg) + "\n")
+    file_path.write_bytes(sample_jsonl_bytes)
     return file_path
 
 
@@ -114,14 +182,18 @@ def sample_message():
     )
 
 
+@functools.cache
+def _draw_vector(seed: int) -> tuple[float, ...]:
+    """Draw a mock embedding in one NumPy call (shared by every test in the session)."""
+    return tuple(np.random.default_rng(seed).uniform(0.0, 1.0, 1536).tolist())
+
+
 class MockEmbeddingService(EmbeddingService):
     """Mock embedding service for testing that doesn't make API calls."""
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         # Don't call parent __init__ to avoid creating OpenAI client
-        import random
-
-        self.rng = random.Random(42)  # Use a fixed seed for reproducibility
+        pass
 
     def _hash_string(self, text: str) -> int:
         """Create a platform-independent hash from a string."""
@@ -129,19 +201,26 @@ class MockEmbeddingService(EmbeddingService):
         hash_bytes = hashlib.md5(text.encode("utf-8")).digest()
         return int.from_bytes(hash_bytes[:4], byteorder="big")
 
+    @staticmethod
+    def _random_vector(seed: int) -> list[float]:
+        """
+        Return a reproducible 1536-dimension vector, drawn once per seed per test run.
+
+        Components are non-negative, so any two mock embeddings have positive cosine
+        similarity and a threshold of 0 always matches, whatever the seeds. Callers get
+        their own copy, so the memoized vector can't be mutated between tests.
+        """
+        return list(_draw_vector(seed))
+
     def embed_message(self, message: Message) -> list[float]:
         """Return a deterministic random embedding vector based on message content."""
         # Generate deterministic embeddings based on message ID
-        seed = self._hash_string(message.id) if message.id else 42
-        rng = self.rng.__class__(seed)
-        return [rng.uniform(-1.0, 1.0) for _ in range(1536)]
+        return self._random_vector(self._hash_string(message.id) if message.id else 42)
 
     def embed_category(self, category: Category) -> list[float]:
         """Return a deterministic random embedding vector based on category name."""
         # Generate deterministic embeddings based on category name
-        seed = self._hash_string(category.name) if category.name else 43
-        rng = self.rng.__class__(seed)
-        return [rng.uniform(-1.0, 1.0) for _ in range(1536)]
+        return self._random_vector(self._hash_string(category.name) if category.name else 43)
 
 
 @pytest.fixture
@@ -150,6 +229,33 @@ def mock_embedding_service():
     return MockEmbeddingService()
 
 
+@pytest.fixture
+def seed_messages(db_session, mock_embedding_service):
+    """
+    Insert messages msg0..msg{count-1}, with mock embeddings, in one bulk INSERT.
+
+    For tests that only need rows to exist; it skips the per-message commit of
+    MessagesService.create_message.
+    """
+
+    def seed(count: int) -> None:
+        messages = [
+            Message(
+                id=f"msg{i}",
+                subject=f"Subject {i}",
+                sender="sender@example.com",
+                to=["recipient@example.com"],
+            )
+            for i in range(count)
+        ]
+        for message in messages:
+            message.embedding = mock_embedding_service.embed_message(message)
+        MessageManager(db_session).bulk_create(messages)
+        db_session.commit()
+
+    return seed
+
+
 @pytest.fixture(autouse=True)
 def patch_embedding_service(monkeypatch):
     """
@@ -1,13 +1,10 @@
 """
-Tests for app/controllers/categories_controller.py and CategoriesService.
+Tests for app/controllers/categories_controller.py
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from app.controllers.categories_controller import CategoriesController
 from app.deps import get_categories_service
@@ -15,115 +12,66 @@ from app.services.categories_service import CategoriesService
 from app.stores.sqlite_store import SQLiteStore
 
 
-@pytest.fixture
-def service():
-    """Create a CategoriesService with temporary database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = f"sqlite:///{tmp.name}"
-        store = SQLiteStore(db_path=db_path, echo=False)
-        store.init_db(drop_existing=True)
-
-        session = store.create_session()
-        service = CategoriesService(session)
-        yield service
-
-        # Cleanup
-        session.close()
-        Path(tmp.name).unlink(missing_ok=True)
-
-
-class TestCategoriesService:
-    """Test CategoriesService business logic."""
-
-    def test_create_category(self, service):
-        """Test creating a category through service."""
-        result = service.create_category(
-            name="Work Travel", description="Work-related travel receipts from airlines"
-        )
-
-        assert result.category.id is not None
-        assert result.category.name == "Work Travel"
-        assert result.category.description == "Work-related travel receipts from airlines"
-
-    def test_get_category(self, service):
-        """Test retrieving a category."""
-        created = service.create_category(name="Test", description="Test category")
-
-        result = service.get_category(created.category.id)
-        assert result is not None
-        assert result.category.name == "Test"
-
-    def test_get_category_by_name(self, service):
-        """Test retrieving a category by name."""
-        service.create_category(name="FindMe", description="Test")
+@pytest.fixture(scope="module")
+def store():
+    """Create one in-memory store, and its schema, for the whole module."""
+    store = SQLiteStore(db_path="sqlite://", echo=False)
 
-        result = service.get_category_by_name("FindMe")
-        assert result is not None
-        assert result.category.name == "FindMe"
+    # pysqlite defers BEGIN until the first write, which breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself so per-test rollbacks undo everything
+    @event.listens_for(store.engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    def test_list_categories(self, service):
-        """Test listing all categories."""
-        service.create_category(name="Cat1", description="First")
-        service.create_category(name="Cat2", description="Second")
-        service.create_category(name="Cat3", description="Third")
+    @event.listens_for(store.engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
-        categories = service.list_categories()
-        assert len(categories) == 3
+    store.init_db(drop_existing=True)
+    return store
 
-    def test_update_category(self, service):
-        """Test updating a category."""
-        created = service.create_category(name="OldName", description="Old description")
 
-        result = service.update_category(
-            created.category.id, name="NewName", description="New description"
-        )
+@pytest.fixture
+def session(store):
+    """
+    Create a session whose work is undone after the test.
 
-        assert result is not None
-        assert result.category.name == "NewName"
-        assert result.category.description == "New description"
+    The session joins an outer transaction on its own connection; service commits
+    only release savepoints, and the outer transaction is rolled back at teardown.
+    """
+    connection = store.engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
 
-    def test_delete_category(self, service):
-        """Test deleting a category."""
-        created = service.create_category(name="ToDelete", description="Will be deleted")
+    # Cleanup
+    session.close()
+    transaction.rollback()
+    connection.close()
 
-        success = service.delete_category(created.category.id)
-        assert success is True
 
-        # Verify deleted
-        result = service.get_category(created.category.id)
-        assert result is None
+@pytest.fixture
+def service(session, mock_embedding_service):
+    """Create a CategoriesService on a rolled-back test session."""
+    return CategoriesService(session, mock_embedding_service)
 
 
 class TestCategoriesControllerAPI:
     """Test CategoriesController API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client with dependency overrides."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = f"sqlite:///{tmp.name}"
-            store = SQLiteStore(db_path=db_path, echo=False)
-            store.init_db(drop_existing=True)
-
-            # Create a session for the test service
-            session = store.create_session()
-            test_service = CategoriesService(session)
-
-            # Override the dependency
-            def override_get_categories_service():
-                return test_service
+    @pytest.fixture(scope="module")
+    def shared_client(self, api_client_factory):
+        """Build the app and its test client once for the module."""
+        return api_client_factory(CategoriesController().router)
 
-            controller = CategoriesController()
-            app = FastAPI()
-            app.include_router(controller.router)
-            app.dependency_overrides[get_categories_service] = override_get_categories_service
-
-            client = TestClient(app)
-            yield client
+    @pytest.fixture
+    def client(self, shared_client, service):
+        """Point the shared app at this test's service for the duration of the test."""
+        shared_client.app.dependency_overrides[get_categories_service] = lambda: service
+        yield shared_client
 
-            # Cleanup
-            session.close()
-            Path(tmp.name).unlink(missing_ok=True)
+        # Cleanup
+        shared_client.app.dependency_overrides.clear()
 
     def test_create_category_api(self, client):
         """Test creating a category via API."""
@@ -197,13 +145,10 @@ class TestCategoriesControllerAPI:
         )
         assert response.status_code == 404
 
-    def test_update_category_api_duplicate_name(self, client):
+    def test_update_category_api_duplicate_name(self, client, service):
         """Test updating to duplicate name fails."""
-        client.post("/categories/", json={"name": "First", "description": "Desc1"})
-        create_response = client.post(
-            "/categories/", json={"name": "Second", "description": "Desc2"}
-        )
-        category_id = create_response.json()["id"]
+        _, second = service.create_categories([("First", "Desc1"), ("Second", "Desc2")])
+        category_id = second.id
 
         response = client.put(
             f"/categories/{category_id}",
@@ -3,77 +3,47 @@ Tests for message classification API endpoint.
 """
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from pydantic_ai import ModelResponse, TextPart
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 
-from app.controllers.messages_controller import MessagesController
+from app.controllers.messages_controller import CategoryClassification, ClassifyResponse
 from app.deps import get_db_session, get_messages_service
 from app.services.categories_service import CategoriesService
 from app.services.classification import ClassificationService, LLMClassificationStrategy
 from app.services.classification.strategies import EmbeddingSimilarityStrategy
 from app.services.messages_service import MessagesService
 from app.stores.sqlite_store import SQLiteStore
+from models import Category, Message
+from tests.conftest import MockEmbeddingService
 
 
-class TestMessageClassificationAPI:
-    """Test classification API endpoint."""
-
-    @pytest.fixture
-    def client(self, mock_embedding_service, monkeypatch):
-        """Create a test client with dependency overrides."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = f"sqlite:///{tmp.name}"
-            store = SQLiteStore(db_path=db_path, echo=False)
-            store.init_db(drop_existing=True)
-
-            session = store.create_session()
-            messages_service = MessagesService(session, mock_embedding_service, store=store)
-            categories_service = CategoriesService(session, mock_embedding_service)
-
-            # Monkeypatch ClassificationService.__init__ to use EmbeddingSimilarityStrategy
-            original_init = ClassificationService.__init__
-
-            def patched_init(self, db_session, strategy=None, top_n=3, threshold=0.5):
-                # Always use EmbeddingSimilarityStrategy for tests
-                original_init(
-                    self,
-                    db_session,
-                    strategy=EmbeddingSimilarityStrategy(),
-                    top_n=top_n,
-                    threshold=threshold,
-                )
+def inject_response(strategy: LLMClassificationStrategy, payload: dict) -> None:
+    """Point the strategy's agent at a FunctionModel that always returns payload."""
+    # Serialize once; the model function just hands back the same response
+    response = ModelResponse(parts=[TextPart(content=json.dumps(payload))])
 
-            monkeypatch.setattr(ClassificationService, "__init__", patched_init)
-
-            def override_get_messages_service():
-                return messages_service
+    def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
+        return response
 
-            def override_get_db_session():
-                yield session
+    strategy._agent._model = FunctionModel(mock_model_func)
 
-            controller = MessagesController()
-            app = FastAPI()
-            app.include_router(controller.router)
-            app.dependency_overrides[get_messages_service] = override_get_messages_service
-            app.dependency_overrides[get_db_session] = override_get_db_session
 
-            client = TestClient(app)
-            yield client, messages_service, categories_service
+class TestMessageClassificationAPI:
+    """Test classification API endpoint."""
 
-            session.close()
-            Path(tmp.name).unlink(missing_ok=True)
+    @pytest.fixture(scope="module")
+    def populated_client(self, api_client_factory, messages_controller):
+        """Create a test client over one message and two categories, shared by the module."""
+        store = SQLiteStore(db_path="sqlite://", echo=False)
+        store.init_db(drop_existing=True)
 
-    def test_classify_message_api_response_format(self, client):
-        """Test that classification API returns the expected JSON format."""
-        client_obj, messages_service, categories_service = client
+        session = store.create_session()
+        embedding_service = MockEmbeddingService()
+        messages_service = MessagesService(session, embedding_service, store=store)
+        categories_service = CategoriesService(session, embedding_service)
 
-        # Create a message
         messages_service.create_message(
             id="msg123",
             subject="Flight confirmation for business trip",
@@ -82,151 +52,114 @@ class TestMessageClassificationAPI:
             snippet="Your flight to NYC is confirmed",
             body="Thank you for booking with us. Your flight details...",
         )
-
-        # Create categories
-        categories_service.create_category(
-            name="Work Travel", description="Work-related travel receipts and bookings"
-        )
-        categories_service.create_category(
-            name="Personal", description="Personal emails from friends and family"
+        categories_service.create_categories(
+            [
+                ("Work Travel", "Work-related travel receipts and bookings"),
+                ("Personal", "Personal emails from friends and family"),
+            ]
         )
 
-        # Classify via API
-        response = client_obj.post("/messages/msg123/classify?top_n=2&threshold=0.0")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Verify response structure
-        assert "message_id" in data
-        assert "classifications" in data
-        assert data["message_id"] == "msg123"
-        assert isinstance(data["classifications"], list)
-        assert len(data["classifications"]) > 0
-
-        # Verify each classification entry has the required fields
-        for classification in data["classifications"]:
-            assert "category_id" in classification
-            assert "category_name" in classification
-            assert "score" in classification
-            assert "is_in_category" in classification
-            assert "explanation" in classification
-
-            # Verify field types and values
-            assert isinstance(classification["category_id"], int)
-            assert isinstance(classification["category_name"], str)
-            assert isinstance(classification["score"], int | float)
-            assert 0.0 <= classification["score"] <= 1.0
-            assert classification["is_in_category"] is True
-            assert isinstance(classification["explanation"], str)
-            assert len(classification["explanation"]) > 0
-
-            # Verify explanation format
-            assert "msg123" in classification["explanation"]
-            assert "similarity" in classification["explanation"].lower()
-            assert classification["category_name"] in classification["explanation"]
-
-    def test_classify_message_api_json_serialization(self, client):
-        """Test that the response can be serialized to JSON with expected structure."""
-        client_obj, messages_service, categories_service = client
-
-        # Create a message
-        messages_service.create_message(
-            id="test_msg",
-            subject="Test email",
-            sender="sender@example.com",
-            to=["recipient@example.com"],
+        # Monkeypatch ClassificationService.__init__ to use EmbeddingSimilarityStrategy
+        original_init = ClassificationService.__init__
+
+        def patched_init(self, db_session, strategy=None, top_n=3, threshold=0.5):
+            # Always use EmbeddingSimilarityStrategy for tests
+            original_init(
+                self,
+                db_session,
+                strategy=EmbeddingSimilarityStrategy(),
+                top_n=top_n,
+                threshold=threshold,
+            )
+
+        def override_get_messages_service():
+            return messages_service
+
+        def override_get_db_session():
+            yield session
+
+        client = api_client_factory(
+            messages_controller.router,
+            {
+                get_messages_service: override_get_messages_service,
+                get_db_session: override_get_db_session,
+            },
         )
 
-        # Create a category
-        categories_service.create_category(name="Test", description="Test category")
-
-        # Classify via API
-        response = client_obj.post("/messages/test_msg/classify?top_n=1&threshold=0.0")
-
-        assert response.status_code == 200
-        response_dict = response.json()
-
-        # Verify structure matches requirements
-        assert "message_id" in response_dict
-        assert "classifications" in response_dict
-        assert isinstance(response_dict["classifications"], list)
-
-        if response_dict["classifications"]:
-            classification = response_dict["classifications"][0]
-            assert "category_id" in classification
-            assert "category_name" in classification
-            assert "score" in classification
-            assert "is_in_category" in classification
-            assert "explanation" in classification
-            assert classification["is_in_category"] is True
-            assert isinstance(classification["score"], int | float)
-            assert 0.0 <= classification["score"] <= 1.0
-
-    def test_classify_message_api_no_matches(self, client):
-        """Test classification API when no categories match above threshold."""
-        client_obj, messages_service, categories_service = client
-
-        # Create a message
-        messages_service.create_message(
-            id="msg_no_match",
-            subject="Test",
-            sender="test@example.com",
-            to=["recipient@example.com"],
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(ClassificationService, "__init__", patched_init)
+            yield client
+
+        session.close()
+
+    @pytest.mark.parametrize(
+        "top_n,threshold,min_results",
+        [
+            (2, 0.0, 1),
+            (1, 0.0, 1),
+            (10, 0.99, 0),  # Very high threshold, so no matches are required
+        ],
+    )
+    def test_classify_message_api_response(self, populated_client, top_n, threshold, min_results):
+        """Test that classification API returns the expected JSON format."""
+        response = populated_client.post(
+            f"/messages/msg123/classify?top_n={top_n}&threshold={threshold}"
         )
 
-        # Create a category
-        categories_service.create_category(name="Test", description="Test category")
+        assert response.status_code == 200
 
-        # Classify with very high threshold (no matches expected)
-        response = client_obj.post("/messages/msg_no_match/classify?top_n=10&threshold=0.99")
+        # Strict validation checks every field's presence and JSON type in one pass
+        result = ClassifyResponse.model_validate_json(response.content, strict=True)
+        assert result.message_id == "msg123"
+        assert min_results <= len(result.classifications) <= top_n
+        # is_in_category has a default, so also require every field in the raw payload
+        for classification in response.json()["classifications"]:
+            assert classification.keys() == CategoryClassification.model_fields.keys()
 
-        assert response.status_code == 200
-        data = response.json()
+        for classification in result.classifications:
+            assert threshold <= classification.score <= 1.0
+            assert classification.is_in_category is True
 
-        # Should return empty classifications list
-        assert data["message_id"] == "msg_no_match"
-        assert isinstance(data["classifications"], list)
-        # Note: May be empty if threshold is too high
-        assert len(data["classifications"]) >= 0
+            # Verify explanation format
+            assert "msg123" in classification.explanation
+            assert "similarity" in classification.explanation.lower()
+            assert classification.category_name in classification.explanation
 
 
 class TestLLMClassificationIntegration:
     """Test LLM classification strategy integration at the service layer."""
 
-    def test_llm_classification_with_test_model(self, db_session):
+    @pytest.fixture(scope="module")
+    def llm_strategy(self):
+        """Build the LLM strategy, and its agents, once for the module."""
+        # Module-scoped fixtures run before the autouse fake OPENAI_API_KEY is set
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("OPENAI_API_KEY", "sk-fake-test-key-for-testing-only")
+            return LLMClassificationStrategy()
+
+    def test_llm_classification_with_test_model(self, llm_strategy, db_session):
         """Test LLM classification with FunctionModel (no real API calls)."""
 
-        # Create mock function that returns responses
-        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            # Return multi-category response with indices
-            response = {
-                "matches": [
-                    {
-                        "category_index": 0,
-                        "is_in_category": True,
-                        "explanation": "This email is about work travel based on the subject and sender",
-                        "confidence": 0.95,
-                    },
-                    {
-                        "category_index": 1,
-                        "is_in_category": False,
-                        "explanation": "This email is not related to personal matters",
-                        "confidence": 0.1,
-                    },
-                ]
-            }
-            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
-
-        function_model = FunctionModel(mock_model_func)
-
-        # Create LLM strategy with function model
-        strategy = LLMClassificationStrategy()
-        strategy._agent._model = function_model
+        # Create mock function that returns a multi-category response with indices
+        payload = {
+            "matches": [
+                {
+                    "category_index": 0,
+                    "is_in_category": True,
+                    "explanation": "This email is about work travel based on the subject and sender",
+                    "confidence": 0.95,
+                },
+                {
+                    "category_index": 1,
+                    "is_in_category": False,
+                    "explanation": "This email is not related to personal matters",
+                    "confidence": 0.1,
+                },
+            ]
+        }
+        inject_response(llm_strategy, payload)
 
         # Create message
-        from models import Message
-
         message = Message(
             id="msg1",
             subject="Flight confirmation for business trip",
@@ -236,8 +169,6 @@ class TestLLMClassificationIntegration:
         )
 
         # Create categories
-        from models import Category
-
         work_travel = Category(
             id=1, name="Work Travel", description="Work-related travel receipts and bookings"
         )
@@ -246,7 +177,7 @@ class TestLLMClassificationIntegration:
         )
 
         # Run classification
-        matches = strategy.classify(
+        matches = llm_strategy.classify(
             message=message, categories=[work_travel, personal], top_n=10, threshold=0.5
         )
 
@@ -256,32 +187,23 @@ class TestLLMClassificationIntegration:
         assert matches[0].score == 0.95
         assert "work travel" in matches[0].explanation.lower()
 
-    def test_llm_classification_service_integration(self, db_session):
+    def test_llm_classification_service_integration(self, llm_strategy, db_session):
         """Test LLM classification through strategy directly."""
 
         # Create function model
-        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            response = {
-                "matches": [
-                    {
-                        "category_index": 0,
-                        "is_in_category": True,
-                        "explanation": "Flight receipt matches work travel category",
-                        "confidence": 0.92,
-                    }
-                ]
-            }
-            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
-
-        function_model = FunctionModel(mock_model_func)
-
-        # Create strategy with function model
-        strategy = LLMClassificationStrategy()
-        strategy._agent._model = function_model
+        payload = {
+            "matches": [
+                {
+                    "category_index": 0,
+                    "is_in_category": True,
+                    "explanation": "Flight receipt matches work travel category",
+                    "confidence": 0.92,
+                }
+            ]
+        }
+        inject_response(llm_strategy, payload)
 
         # Create message (no database needed for strategy test)
-        from models import Category, Message
-
         message = Message(
             id="test_msg",
             subject="Flight receipt",
@@ -294,7 +216,9 @@ class TestLLMClassificationIntegration:
         category = Category(id=1, name="Work Travel", description="Work-related travel expenses")
 
         # Classify using strategy directly
-        matches = strategy.classify(message=message, categories=[category], top_n=3, threshold=0.5)
+        matches = llm_strategy.classify(
+            message=message, categories=[category], top_n=3, threshold=0.5
+        )
 
         # Verify results
         assert len(matches) == 1
@@ -302,44 +226,35 @@ class TestLLMClassificationIntegration:
         assert matches[0].score == 0.92
         assert "Flight receipt" in matches[0].explanation
 
-    def test_llm_classification_multiple_categories(self, db_session):
+    def test_llm_classification_multiple_categories(self, llm_strategy, db_session):
         """Test LLM classification with multiple categories."""
 
         # Create function model with multi-category response
-        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            response = {
-                "matches": [
-                    {
-                        "category_index": 0,
-                        "is_in_category": True,
-                        "explanation": "This is a work travel receipt",
-                        "confidence": 0.93,
-                    },
-                    {
-                        "category_index": 1,
-                        "is_in_category": True,
-                        "explanation": "This is a receipt",
-                        "confidence": 0.88,
-                    },
-                    {
-                        "category_index": 2,
-                        "is_in_category": False,
-                        "explanation": "Not a newsletter",
-                        "confidence": 0.05,
-                    },
-                ]
-            }
-            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
-
-        function_model = FunctionModel(mock_model_func)
-
-        # Create strategy
-        strategy = LLMClassificationStrategy()
-        strategy._agent._model = function_model
+        payload = {
+            "matches": [
+                {
+                    "category_index": 0,
+                    "is_in_category": True,
+                    "explanation": "This is a work travel receipt",
+                    "confidence": 0.93,
+                },
+                {
+                    "category_index": 1,
+                    "is_in_category": True,
+                    "explanation": "This is a receipt",
+                    "confidence": 0.88,
+                },
+                {
+                    "category_index": 2,
+                    "is_in_category": False,
+                    "explanation": "Not a newsletter",
+                    "confidence": 0.05,
+                },
+            ]
+        }
+        inject_response(llm_strategy, payload)
 
         # Create message
-        from models import Category, Message
-
         message = Message(
             id="receipt_msg",
             subject="Flight Receipt - NYC Trip",
@@ -356,7 +271,9 @@ class TestLLMClassificationIntegration:
         ]
 
         # Classify
-        matches = strategy.classify(message=message, categories=categories, top_n=10, threshold=0.5)
+        matches = llm_strategy.classify(
+            message=message, categories=categories, top_n=10, threshold=0.5
+        )
 
         # Verify results - should be sorted by confidence descending
         assert len(matches) == 2
@@ -365,33 +282,24 @@ class TestLLMClassificationIntegration:
         assert matches[1].category.name == "Receipts"
         assert matches[1].score == 0.88
 
-    def test_llm_classification_respects_top_n(self, db_session):
+    def test_llm_classification_respects_top_n(self, llm_strategy, db_session):
         """Test that LLM classification respects top_n parameter."""
 
         # Create function model that matches all categories
-        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            response = {
-                "matches": [
-                    {
-                        "category_index": i,
-                        "is_in_category": True,
-                        "explanation": f"Match {i}",
-                        "confidence": 0.9 - (i * 0.1),
-                    }
-                    for i in range(5)
-                ]
-            }
-            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
-
-        function_model = FunctionModel(mock_model_func)
-
-        # Create strategy
-        strategy = LLMClassificationStrategy()
-        strategy._agent._model = function_model
+        payload = {
+            "matches": [
+                {
+                    "category_index": i,
+                    "is_in_category": True,
+                    "explanation": f"Match {i}",
+                    "confidence": 0.9 - (i * 0.1),
+                }
+                for i in range(5)
+            ]
+        }
+        inject_response(llm_strategy, payload)
 
         # Create message and categories
-        from models import Category, Message
-
         message = Message(
             id="msg",
             subject="Test",
@@ -404,37 +312,30 @@ class TestLLMClassificationIntegration:
         ]
 
         # Classify with top_n=2
-        matches = strategy.classify(message=message, categories=categories, top_n=2, threshold=0.5)
+        matches = llm_strategy.classify(
+            message=message, categories=categories, top_n=2, threshold=0.5
+        )
 
         # Should only return 2 matches even though all matched
         assert len(matches) == 2
 
-    def test_llm_classification_no_matches(self, db_session):
+    def test_llm_classification_no_matches(self, llm_strategy, db_session):
         """Test LLM classification when no categories match."""
 
         # Create function model that doesn't match
-        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            response = {
-                "matches": [
-                    {
-                        "category_index": 0,
-                        "is_in_category": False,
-                        "explanation": "Does not match this category",
-                        "confidence": 0.1,
-                    }
-                ]
-            }
-            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
-
-        function_model = FunctionModel(mock_model_func)
-
-        # Create strategy
-        strategy = LLMClassificationStrategy()
-        strategy._agent._model = function_model
+        payload = {
+            "matches": [
+                {
+                    "category_index": 0,
+                    "is_in_category": False,
+                    "explanation": "Does not match this category",
+                    "confidence": 0.1,
+                }
+            ]
+        }
+        inject_response(llm_strategy, payload)
 
         # Create message and category
-        from models import Category, Message
-
         message = Message(
             id="msg",
             subject="Personal email",
@@ -445,7 +346,9 @@ class TestLLMClassificationIntegration:
         category = Category(id=1, name="Work", description="Work-related emails")
 
         # Classify
-        matches = strategy.classify(message=message, categories=[category], top_n=10, threshold=0.5)
+        matches = llm_strategy.classify(
+            message=message, categories=[category], top_n=10, threshold=0.5
+        )
 
         # Should have no matches
         assert len(matches) == 0
@@ -2,35 +2,18 @@
 Tests for MessagesController CRUD operations.
 """
 
-import tempfile
 from datetime import datetime
-from pathlib import Path
 
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
-from app.controllers.messages_controller import MessagesController
 from app.deps import get_messages_service
 from app.services.messages_service import MessagesService
-from app.stores.sqlite_store import SQLiteStore
 
 
 @pytest.fixture
-def messages_service():
-    """Create a MessagesService with temporary database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = f"sqlite:///{tmp.name}"
-        store = SQLiteStore(db_path=db_path, echo=False)
-        store.init_db(drop_existing=True)
-
-        session = store.create_session()
-        service = MessagesService(session, store=store)
-        yield service
-
-        # Cleanup
-        session.close()
-        Path(tmp.name).unlink(missing_ok=True)
+def messages_service(sqlite_store, db_session):
+    """Create a MessagesService with an in-memory database."""
+    return MessagesService(db_session, store=sqlite_store)
 
 
 class TestMessagesControllerCRUD:
@@ -77,15 +60,9 @@ class TestMessagesControllerCRUD:
         messages = messages_service.list_messages()
         assert len(messages) == 2
 
-    def test_list_messages_with_pagination(self, messages_service):
+    def test_list_messages_with_pagination(self, messages_service, seed_messages):
         """Test listing messages with pagination."""
-        for i in range(5):
-            messages_service.create_message(
-                id=f"msg{i}",
-                subject=f"Subject {i}",
-                sender="sender@example.com",
-                to=["r@example.com"],
-            )
+        seed_messages(5)
 
         messages = messages_service.list_messages(limit=2, offset=1)
         assert len(messages) == 2
@@ -116,30 +93,19 @@ class TestMessagesControllerCRUD:
 class TestMessagesControllerCRUDAPI:
     """Test MessagesController CRUD API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client with dependency overrides."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = f"sqlite:///{tmp.name}"
-            store = SQLiteStore(db_path=db_path, echo=False)
-            store.init_db(drop_existing=True)
-
-            session = store.create_session()
-            test_service = MessagesService(session, store=store)
+    @pytest.fixture(scope="module")
+    def shared_client(self, api_client_factory, messages_controller):
+        """Build the app and its test client once for the module."""
+        return api_client_factory(messages_controller.router)
 
-            def override_get_messages_service():
-                return test_service
-
-            controller = MessagesController()
-            app = FastAPI()
-            app.include_router(controller.router)
-            app.dependency_overrides[get_messages_service] = override_get_messages_service
-
-            client = TestClient(app)
-            yield client
+    @pytest.fixture
+    def client(self, shared_client, messages_service):
+        """Point the shared app at this test's service for the duration of the test."""
+        shared_client.app.dependency_overrides[get_messages_service] = lambda: messages_service
+        yield shared_client
 
-            session.close()
-            Path(tmp.name).unlink(missing_ok=True)
+        # Cleanup
+        shared_client.app.dependency_overrides.clear()
 
     def test_create_message_api(self, client):
         """Test creating a message via API."""
@@ -198,18 +164,9 @@ class TestMessagesControllerCRUDAPI:
         data = response.json()
         assert len(data) == 2
 
-    def test_list_messages_api_with_pagination(self, client):
+    def test_list_messages_api_with_pagination(self, client, seed_messages):
         """Test listing messages with pagination via API."""
-        for i in range(5):
-            client.post(
-                "/messages/",
-                json={
-                    "id": f"msg{i}",
-                    "subject": f"Subject {i}",
-                    "sender": "sender@example.com",
-                    "to": ["r@example.com"],
-                },
-            )
+        seed_messages(5)
 
         response = client.get("/messages/?limit=2&offset=1")
         assert response.status_code == 200
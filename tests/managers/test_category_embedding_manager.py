@@ -0,0 +1,22 @@
+"""
+Tests for app/managers/category_embedding_manager.py
+"""
+
+from app.managers.category_embedding_manager import CategoryEmbeddingManager
+
+
+class TestCategoryEmbeddingManager:
+    """Test CategoryEmbeddingManager class."""
+
+    def test_get_missing_returns_none(self, db_session):
+        """Test get returns None for an unknown key."""
+        assert CategoryEmbeddingManager(db_session).get("openai", "model", "hash") is None
+
+    def test_upsert_replaces_vector(self, db_session):
+        """Test upsert overwrites the vector for an existing key."""
+        manager = CategoryEmbeddingManager(db_session)
+        manager.upsert("openai", "model", "hash", b"old")
+        manager.upsert("openai", "model", "hash", b"new")
+        db_session.commit()
+
+        assert manager.get("openai", "model", "hash").vector == b"new"
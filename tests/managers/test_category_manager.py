@@ -39,6 +39,21 @@ class TestCategoryManager:
         with pytest.raises(IntegrityError):  # IntegrityError from flush
             manager.create(name="Unique", description="Second")
 
+    def test_bulk_create(self, db_session):
+        """Test bulk_create adds every category in one flush."""
+        manager = CategoryManager(db_session)
+
+        categories = manager.bulk_create(
+            [
+                Category(name="Cat1", description="First"),
+                Category(name="Cat2", description="Second"),
+            ]
+        )
+        db_session.commit()
+
+        assert all(category.id is not None for category in categories)
+        assert manager.count() == 2
+
     def test_get_by_id(self, db_session):
         """Test get_by_id retrieves correct category."""
         manager = CategoryManager(db_session)
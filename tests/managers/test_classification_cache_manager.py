@@ -0,0 +1,33 @@
+"""
+Tests for app/managers/classification_cache_manager.py
+"""
+
+from app.managers.classification_cache_manager import ClassificationCacheManager
+
+
+class TestClassificationCacheManager:
+    """Test ClassificationCacheManager class."""
+
+    def test_create_and_get_by_signature(self, db_session):
+        """Test entries are stored and filtered by signature."""
+        manager = ClassificationCacheManager(db_session)
+        manager.create("sig-a", [0.5, 0.25], [(1, 0.9, "fits")])
+        manager.create("sig-b", [0.3, 0.4], [])
+        db_session.commit()
+
+        entries = manager.get_by_signature("sig-a")
+
+        assert len(entries) == 1
+        assert entries[0].embedding == [0.5, 0.25]
+        assert entries[0].matches == [[1, 0.9, "fits"]]
+        assert entries[0].created_at is not None
+
+    def test_delete_all(self, db_session):
+        """Test delete_all removes every entry."""
+        manager = ClassificationCacheManager(db_session)
+        manager.create("sig-a", [0.1], [])
+        manager.create("sig-b", [0.2], [])
+        db_session.commit()
+
+        assert manager.delete_all() == 2
+        assert manager.get_by_signature("sig-a") == []
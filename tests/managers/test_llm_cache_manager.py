@@ -0,0 +1,27 @@
+"""
+Tests for app/managers/llm_cache_manager.py
+"""
+
+from app.managers.llm_cache_manager import LLMCacheManager
+
+
+class TestLLMCacheManager:
+    """Test LLMCacheManager class."""
+
+    def test_upsert_replaces_response_and_resets_hits(self, db_session):
+        """Test upsert overwrites an existing entry."""
+        manager = LLMCacheManager(db_session)
+        entry = manager.upsert("key", {"v": 1})
+        entry.hits = 3
+        db_session.commit()
+
+        manager.upsert("key", {"v": 2})
+        db_session.commit()
+
+        entry = manager.get("key")
+        assert entry.response == {"v": 2}
+        assert entry.hits == 0
+
+    def test_stats_empty(self, db_session):
+        """Test stats on an empty cache."""
+        assert LLMCacheManager(db_session).stats() == (0, 0, 0)
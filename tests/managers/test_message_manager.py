@@ -2,8 +2,11 @@
 Tests for app/managers/message_manager.py
 """
 
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from app.managers.message_manager import MessageManager
-from models import Message
+from models import Category, Message
 
 
 class TestMessageManager:
@@ -109,3 +112,120 @@ class TestMessageManager:
         db_session.commit()  # Commit is now done by caller (service layer)
 
         assert manager.count() == 7
+
+    def test_bulk_create_round_trips_columns(self, db_session, sample_message):
+        """Test bulk_create stores JSON, date and the 'from' column like the ORM does."""
+        sample_message.embedding = [0.5, 0.25]
+        MessageManager(db_session).bulk_create([sample_message])
+        db_session.commit()
+
+        retrieved = MessageManager(db_session).get_by_id("test123")
+        assert retrieved is not sample_message
+        assert retrieved.sender == sample_message.sender
+        assert retrieved.to == sample_message.to
+        assert retrieved.date == sample_message.date
+        assert retrieved.embedding == [0.5, 0.25]
+
+    def test_bulk_create_empty(self, db_session):
+        """Test bulk_create with no messages is a no-op."""
+        MessageManager(db_session).bulk_create([])
+        db_session.commit()
+
+        assert MessageManager(db_session).count() == 0
+
+    def test_get_by_ids_preserves_order_and_skips_missing(self, db_session):
+        """Test get_by_ids returns found messages in the requested order."""
+        manager = MessageManager(db_session)
+        manager.bulk_create(
+            [
+                Message(id=f"msg{i}", subject=f"Subject {i}", sender="a@example.com", to=[])
+                for i in range(3)
+            ]
+        )
+        db_session.commit()
+
+        messages = manager.get_by_ids(["msg2", "missing", "msg0"])
+
+        assert [message.id for message in messages] == ["msg2", "msg0"]
+
+    def test_replace_categories(self, db_session):
+        """Test replace_categories swaps out every previous assignment of each message."""
+        db_session.add_all(
+            [
+                Category(id=1, name="Work", description="Work"),
+                Category(id=2, name="Travel", description="Travel"),
+            ]
+        )
+        manager = MessageManager(db_session)
+        manager.bulk_create(
+            [
+                Message(id=f"msg{i}", subject=f"Subject {i}", sender="a@example.com", to=[])
+                for i in range(2)
+            ]
+        )
+        db_session.commit()
+
+        msg0, msg1 = manager.get_by_ids(["msg0", "msg1"])
+        manager.replace_categories([(msg0, [(1, 0.9, "work")]), (msg1, [(1, 0.8, "work")])])
+        db_session.commit()
+
+        msg0, msg1 = manager.get_by_ids(["msg0", "msg1"])
+        manager.replace_categories([(msg0, [(2, 0.7, "travel")]), (msg1, [])])
+
+        assert [(mc.category_id, mc.score) for mc in msg0.message_categories] == [(2, 0.7)]
+        assert msg1.message_categories == []
+
+    def test_get_all_limit_applies_to_messages_with_categories(self, strict_session):
+        """Test get_all pages by message even when messages have several categories."""
+        strict_session.add_all(
+            [
+                Category(id=1, name="Work", description="Work"),
+                Category(id=2, name="Travel", description="Travel"),
+            ]
+        )
+        manager = MessageManager(strict_session)
+        manager.bulk_create(
+            [
+                Message(id=f"msg{i}", subject=f"Subject {i}", sender="a@example.com", to=[])
+                for i in range(3)
+            ]
+        )
+        manager.replace_categories(
+            [(message, [(1, 0.9, "work"), (2, 0.8, "travel")]) for message in manager.get_all()]
+        )
+        strict_session.commit()
+        strict_session.expunge_all()
+
+        messages = manager.get_all(limit=2)
+
+        assert len(messages) == 2
+        assert all(message.categories_str == "Work, Travel" for message in messages)
+
+    def test_lookups_eager_load_categories(self, strict_session):
+        """Test single and multi-message lookups don't lazy load categories."""
+        strict_session.add(Category(id=1, name="Work", description="Work"))
+        manager = MessageManager(strict_session)
+        manager.bulk_create(
+            [
+                Message(id=f"msg{i}", subject=f"Subject {i}", sender="a@example.com", to=[])
+                for i in range(2)
+            ]
+        )
+        manager.replace_categories([(manager.get_by_id("msg0"), [(1, 0.9, "work")])])
+        strict_session.commit()
+        strict_session.expunge_all()
+
+        assert manager.get_by_id("msg0").categories_str == "Work"
+        assert [m.categories_str for m in manager.get_by_ids(["msg0", "msg1"])] == ["Work", ""]
+        assert sorted(m.categories_str for m in manager.get_first_n(2)) == ["", "Work"]
+
+    def test_strict_session_rejects_lazy_loads(self, strict_session):
+        """Test the strict_session fixture turns an unplanned lazy load into an error."""
+        strict_session.add(Category(name="Work", description="Work"))
+        strict_session.commit()
+        strict_session.expunge_all()
+
+        category = strict_session.query(Category).one()
+
+        with pytest.raises(InvalidRequestError):
+            _ = category.messages
@@ -6,6 +6,7 @@ import base64
 import json
 from pathlib import Path
 
+import pytest
 from pydantic_ai import ModelResponse, TextPart
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 
@@ -100,7 +101,6 @@ class TestBootstrapService:
         sample_jsonl_file,
         tmp_path,
         mock_embedding_service,
-        monkeypatch,
     ):
         """Test bootstrapping with auto-classification."""
         # Create sample categories file
@@ -111,43 +111,50 @@ class TestBootstrapService:
 
         # Create a mock function that always returns True for classification
         def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
-            # Parse the prompt to determine how many categories there are
-            # Count the number of category indices in the prompt
+            # Parse the prompt to determine how many categories and emails there are
             prompt_content = str(messages[0].parts[0].content) if messages else ""
-            num_categories = (
-                prompt_content.count("[") - 1
-            )  # Subtract 1 for the bracket in the instruction text
+            num_categories = prompt_content.count("Description:")
+            num_emails = prompt_content.count("--- Email [")
 
             # Generate a match for each category
-            response = {
-                "matches": [
-                    {
-                        "category_index": i,
-                        "is_in_category": True,
-                        "explanation": f"This message matches category {i}",
-                        "confidence": 0.9,
-                    }
-                    for i in range(max(1, num_categories))  # Ensure at least 1 category
-                ]
-            }
+            matches = [
+                {
+                    "category_index": i,
+                    "is_in_category": True,
+                    "explanation": f"This message matches category {i}",
+                    "confidence": 0.9,
+                }
+                for i in range(max(1, num_categories))  # Ensure at least 1 category
+            ]
+            if num_emails:
+                # Batch prompt: one result per email
+                response: dict = {
+                    "results": [{"message_index": j, "matches": matches} for j in range(num_emails)]
+                }
+            else:
+                response = {"matches": matches}
             return ModelResponse(parts=[TextPart(content=json.dumps(response))])
 
         function_model = FunctionModel(mock_model_func)
 
-        # Patch LLMClassificationStrategy to use our mock model
+        from app.services.classification import ClassificationService
         from app.services.classification.strategies import LLMClassificationStrategy
 
-        original_init = LLMClassificationStrategy.__init__
-
-        def patched_init(self, model: str = "openai:gpt-4o-mini"):
-            original_init(self, model)
-            self._agent._model = function_model
-
-        monkeypatch.setattr(LLMClassificationStrategy, "__init__", patched_init)
+        strategy = LLMClassificationStrategy()
+        strategy._agent._model = function_model
+        strategy._batch_agent._model = function_model
 
         messages_service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
         categories_service = CategoriesService(db_session, mock_embedding_service)
-        service = BootstrapService(sqlite_store, messages_service, categories_service)
+        classification_service = ClassificationService(
+            db_session, strategy=strategy, top_n=2, threshold=0.0
+        )
+        service = BootstrapService(
+            sqlite_store,
+            messages_service,
+            categories_service,
+            classification_service=classification_service,
+        )
 
         classification_opts = ClassificationOptions(auto_classify=True, top_n=2, threshold=0.0)
 
@@ -177,6 +184,66 @@ class TestBootstrapService:
         finally:
             session.close()
 
+    def test_bootstrap_classifies_on_injected_session(
+        self,
+        db_session,
+        sqlite_store,
+        sample_jsonl_file,
+        tmp_path,
+        mock_embedding_service,
+        monkeypatch,
+    ):
+        """Test classification and the preview refresh reuse the services' session."""
+        from app.services.classification import ClassificationService
+        from app.services.classification.strategies import EmbeddingSimilarityStrategy
+
+        categories_file = tmp_path / "categories.jsonl"
+        categories_file.write_text('{"name": "Work", "description": "Work emails"}\n')
+
+        messages_service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+        categories_service = CategoriesService(db_session, mock_embedding_service)
+        classification_service = ClassificationService(
+            db_session, strategy=EmbeddingSimilarityStrategy(), top_n=1, threshold=-1.0
+        )
+        service = BootstrapService(
+            sqlite_store,
+            messages_service,
+            categories_service,
+            classification_service=classification_service,
+        )
+
+        def no_new_sessions():
+            raise AssertionError("bootstrap should not open its own sessions")
+
+        monkeypatch.setattr(sqlite_store, "create_session", no_new_sessions)
+
+        result = service.bootstrap(
+            messages_file=sample_jsonl_file,
+            categories_file=categories_file,
+            classification_options=ClassificationOptions(auto_classify=True),
+        )
+
+        assert result.total_classified == 3
+        assert all(len(msg.categories) == 1 for msg in result.preview_messages)
+
+    def test_bootstrap_auto_classify_requires_classification_service(
+        self, db_session, sqlite_store, sample_jsonl_file, tmp_path, mock_embedding_service
+    ):
+        """Test auto-classification fails clearly when no classification service is injected."""
+        categories_file = tmp_path / "categories.jsonl"
+        categories_file.write_text('{"name": "Work", "description": "Work emails"}\n')
+
+        messages_service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+        categories_service = CategoriesService(db_session, mock_embedding_service)
+        service = BootstrapService(sqlite_store, messages_service, categories_service)
+
+        with pytest.raises(ValueError, match="Classification service must be injected"):
+            service.bootstrap(
+                messages_file=sample_jsonl_file,
+                categories_file=categories_file,
+                classification_options=ClassificationOptions(auto_classify=True),
+            )
+
     def test_bootstrap_skips_empty_lines(
         self, db_session, sqlite_store, tmp_path, mock_embedding_service
     ):
@@ -34,6 +34,26 @@ class TestCategoriesService:
         with pytest.raises(ValueError):
             service.create_category(name="Unique", description="Second")
 
+    def test_create_categories(self, db_session, mock_embedding_service):
+        """Test creating several categories in one call."""
+        service = CategoriesService(db_session, mock_embedding_service)
+
+        categories = service.create_categories([("Cat1", "First"), ("Cat2", "Second")])
+
+        assert [cat.name for cat in categories] == ["Cat1", "Cat2"]
+        assert all(cat.id is not None for cat in categories)
+        assert all(len(cat.embedding) == 1536 for cat in categories)
+
+    def test_create_categories_duplicate_creates_none(self, db_session, mock_embedding_service):
+        """Test a duplicate name rolls back the whole batch."""
+        service = CategoriesService(db_session, mock_embedding_service)
+        service.create_category(name="Existing", description="First")
+
+        with pytest.raises(ValueError):
+            service.create_categories([("New", "Second"), ("Existing", "Third")])
+
+        assert [cat.name for cat in service.list_categories()] == ["Existing"]
+
     def test_get_category(self, db_session, mock_embedding_service):
         """Test retrieving category by ID."""
         service = CategoriesService(db_session, mock_embedding_service)
@@ -72,9 +92,7 @@ class TestCategoriesService:
         """Test listing all categories."""
         service = CategoriesService(db_session, mock_embedding_service)
 
-        service.create_category(name="Cat1", description="First")
-        service.create_category(name="Cat2", description="Second")
-        service.create_category(name="Cat3", description="Third")
+        service.create_categories([("Cat1", "First"), ("Cat2", "Second"), ("Cat3", "Third")])
 
         categories = service.list_categories()
         assert len(categories) == 3
@@ -10,7 +10,7 @@ from app.services.categories_service import CategoriesService
 from app.services.classification import ClassificationResult, ClassificationService
 from app.services.classification.strategies import EmbeddingSimilarityStrategy
 from app.services.messages_service import MessagesService
-from models import Category, Message
+from models import Category, Message, MessageCategory
 
 
 class TestClassificationResult:
@@ -400,6 +400,100 @@ class TestClassificationService:
         finally:
             session.close()
 
+    async def test_classify_messages_by_ids(
+        self, sqlite_store, mock_embedding_service, db_session, seed_messages
+    ):
+        """Test batch classification returns results in order and persists assignments."""
+        seed_messages(3)
+        categories_service = CategoriesService(db_session, mock_embedding_service)
+        categories_service.create_category(name="Work", description="Work emails")
+
+        strategy = EmbeddingSimilarityStrategy()
+        service = ClassificationService(db_session, strategy=strategy, top_n=1, threshold=-1.0)
+        results = await service.classify_messages_by_ids(["msg2", "missing", "msg0"])
+
+        assert [result.message.id for result in results] == ["msg2", "msg0"]
+        assert all(len(result.matched_categories) == 1 for result in results)
+
+        from app.managers.message_manager import MessageManager
+
+        session = sqlite_store.create_session()
+        try:
+            manager = MessageManager(session)
+            assert len(manager.get_by_id("msg0").categories) == 1
+            assert len(manager.get_by_id("msg1").categories) == 0
+        finally:
+            session.close()
+
+    async def test_classify_messages_by_ids_no_categories(self, db_session, mock_embedding_service):
+        """Test batch classification raises when no categories exist."""
+        MessagesService(db_session, mock_embedding_service).create_message(
+            id="msg1", subject="Test", sender="test@example.com", to=["recipient@example.com"]
+        )
+        service = ClassificationService(db_session, strategy=EmbeddingSimilarityStrategy())
+
+        with pytest.raises(ValueError, match="No categories with embeddings found"):
+            await service.classify_messages_by_ids(["msg1"])
+
+    async def test_classify_in_batches(self, db_session, mock_embedding_service, seed_messages):
+        """Test classify_in_batches splits IDs into batches and counts classified messages."""
+        seed_messages(5)
+        CategoriesService(db_session, mock_embedding_service).create_category(
+            name="Work", description="Work emails"
+        )
+
+        strategy = EmbeddingSimilarityStrategy()
+        batch_sizes = []
+        original = strategy.classify_batch_async
+
+        async def recording_classify_batch_async(messages, **kwargs):
+            batch_sizes.append(len(messages))
+            return await original(messages, **kwargs)
+
+        strategy.classify_batch_async = recording_classify_batch_async
+        service = ClassificationService(db_session, strategy=strategy, top_n=1, threshold=-1.0)
+
+        count = await service.classify_in_batches(
+            [f"msg{i}" for i in range(5)], batch_size=2, max_concurrency=2
+        )
+
+        assert count == 5
+        assert sorted(batch_sizes) == [1, 2, 2]
+
+    async def test_classify_in_batches_assigns_after_strategy_calls(
+        self, db_session, mock_embedding_service, seed_messages
+    ):
+        """Test no batch's assignments are written while strategy calls are still running."""
+        seed_messages(4)
+        CategoriesService(db_session, mock_embedding_service).create_category(
+            name="Work", description="Work emails"
+        )
+
+        strategy = EmbeddingSimilarityStrategy()
+        assigned_at_call = []
+        original = strategy.classify_batch_async
+
+        async def recording_classify_batch_async(messages, **kwargs):
+            assigned_at_call.append(db_session.query(MessageCategory).count())
+            return await original(messages, **kwargs)
+
+        strategy.classify_batch_async = recording_classify_batch_async
+        service = ClassificationService(db_session, strategy=strategy, top_n=1, threshold=-1.0)
+
+        count = await service.classify_in_batches(
+            [f"msg{i}" for i in range(4)], batch_size=2, max_concurrency=1
+        )
+
+        assert count == 4
+        assert assigned_at_call == [0, 0]
+        assert db_session.query(MessageCategory).count() == 4
+
+    async def test_classify_in_batches_skips_failed_batches(self, db_session):
+        """Test classify_in_batches counts zero when batches can't be classified."""
+        service = ClassificationService(db_session, strategy=EmbeddingSimilarityStrategy())
+
+        assert await service.classify_in_batches(["msg1", "msg2"]) == 0
+
     def test_compute_similarity_basic(self, sqlite_store):
         """Test strategy compute_similarity with simple vectors."""
         strategy = EmbeddingSimilarityStrategy()
@@ -492,3 +586,48 @@ class TestClassificationService:
         assert matches[0].score >= matches[1].score >= matches[2].score
         # First should be highest (identical vectors)
         assert matches[0].score == pytest.approx(1.0, abs=0.01)
+
+    async def test_batch_matches_single_classification(self):
+        """Test the batched matrix product scores messages like classify does."""
+        strategy = EmbeddingSimilarityStrategy()
+        categories = [
+            Category(id=1, name="Cat1", description="A", embedding=[1.0, 0.0, 0.0]),
+            Category(id=2, name="Cat2", description="B", embedding=[0.5, 0.5, 0.0]),
+        ]
+        messages = [
+            Message(id="m1", subject="S", sender="s", to=[], embedding=[1.0, 0.0, 0.0]),
+            Message(id="m2", subject="S", sender="s", to=[], embedding=[0.0, 2.0, 0.0]),
+        ]
+
+        batched = await strategy.classify_batch_async(messages, categories, top_n=2, threshold=0.0)
+
+        for message, matches in zip(messages, batched, strict=True):
+            single = strategy.classify(message, categories, top_n=2, threshold=0.0)
+            assert [m.category.id for m in matches] == [m.category.id for m in single]
+            assert [m.score for m in matches] == pytest.approx([m.score for m in single])
+
+    def test_category_matrix_rebuilt_when_categories_change(self):
+        """Test the cached category matrix follows category changes."""
+        strategy = EmbeddingSimilarityStrategy()
+        message = Message(id="m1", subject="S", sender="s", to=[], embedding=[1.0, 0.0])
+        category = Category(id=1, name="Cat", description="Old", embedding=[1.0, 0.0])
+
+        assert strategy.classify(message, [category], 1, 0.0)[0].score == pytest.approx(1.0)
+
+        category.description = "New"
+        category.embedding = [0.0, 1.0]
+        assert strategy.classify(message, [category], 1, 0.0)[0].score == pytest.approx(0.0)
+
+    def test_top_n_selection_sorted_and_thresholded(self):
+        """Test partial top-n selection returns the best scores in order above threshold."""
+        strategy = EmbeddingSimilarityStrategy()
+        message = Message(id="m1", subject="S", sender="s", to=[], embedding=[1.0, 0.0])
+        categories = [
+            Category(id=i, name=f"Cat{i}", description="", embedding=[x, (1 - x * x) ** 0.5])
+            for i, x in enumerate([0.1, 0.9, 0.5, 0.7, 0.3])
+        ]
+
+        matches = strategy.classify(message, categories, top_n=3, threshold=0.6)
+
+        assert [m.category.name for m in matches] == ["Cat1", "Cat3"]
+        assert [m.score for m in matches] == pytest.approx([0.9, 0.7], abs=1e-6)
@@ -0,0 +1,68 @@
+"""
+Tests for app/services/embedding_cache.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.embedding_cache import CategoryEmbeddingCache
+from app.services.embedding_service import EmbeddingService
+from models import Category, CategoryEmbeddingEntry
+
+
+class FakeEmbeddingsClient:
+    """Stand-in for the OpenAI client that counts embedding calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model, input, encoding_format):
+        self.calls += 1
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[0.25, -0.5, 1.0])])
+
+
+class TestCategoryEmbeddingCache:
+    """Test CategoryEmbeddingCache class."""
+
+    def test_get_miss_then_hit(self, db_session):
+        """Test a stored embedding round-trips through float32 bytes."""
+        cache = CategoryEmbeddingCache(db_session)
+
+        assert cache.get("openai", "model", "text") is None
+        cache.set("openai", "model", "text", [0.25, -0.5, 1.0])
+
+        assert cache.get("openai", "model", "text") == pytest.approx([0.25, -0.5, 1.0])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_includes_model(self, db_session):
+        """Test embeddings from one model are not served for another."""
+        cache = CategoryEmbeddingCache(db_session)
+        cache.set("openai", "model-a", "text", [1.0])
+
+        assert cache.get("openai", "model-b", "text") is None
+
+    def test_set_leaves_commit_to_caller(self, db_session):
+        """Test a stored embedding joins the caller's transaction instead of committing."""
+        cache = CategoryEmbeddingCache(db_session)
+        cache.set("openai", "model", "text", [1.0])
+        db_session.rollback()
+
+        assert cache.get("openai", "model", "text") is None
+
+    def test_embed_category_uses_cache(self, db_session):
+        """Test EmbeddingService only calls the API once for identical category text."""
+        # The autouse fixture patches the module attribute, not this imported class
+        service = EmbeddingService(
+            api_key="sk-test", model="model", category_cache=CategoryEmbeddingCache(db_session)
+        )
+        service.client = FakeEmbeddingsClient()
+        category = Category(name="Work", description="Work email")
+
+        first = service.embed_category(category)
+        second = service.embed_category(category)
+
+        assert service.client.calls == 1
+        assert second == pytest.approx(first)
+        assert db_session.query(CategoryEmbeddingEntry).count() == 1
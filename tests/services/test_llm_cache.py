@@ -0,0 +1,59 @@
+"""
+Tests for app/services/classification/llm_cache.py
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from app.services.classification import LLMResponseCache
+from models import LLMCacheEntry
+
+
+class TestLLMResponseCache:
+    """Test LLMResponseCache class."""
+
+    def test_make_key_is_order_independent(self):
+        """Test the key depends on payload content, not dict ordering."""
+        key1 = LLMResponseCache.make_key({"model": "m", "prompt": "p"})
+        key2 = LLMResponseCache.make_key({"prompt": "p", "model": "m"})
+
+        assert key1 == key2
+        assert len(key1) == 64
+        assert key1 != LLMResponseCache.make_key({"model": "m", "prompt": "other"})
+
+    def test_get_miss_then_hit(self, db_session):
+        """Test a stored response is returned and hits are counted."""
+        cache = LLMResponseCache(db_session)
+
+        assert cache.get("key") is None
+        cache.set("key", {"matches": []})
+
+        assert cache.get("key") == {"matches": []}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert db_session.get(LLMCacheEntry, "key").hits == 1
+
+    def test_hit_count_is_committed_by_the_caller(self, db_session):
+        """Test a cache hit doesn't commit the session on its own."""
+        cache = LLMResponseCache(db_session)
+        cache.set("key", {"matches": []})
+
+        cache.get("key")
+        db_session.rollback()
+        assert db_session.get(LLMCacheEntry, "key").hits == 0
+
+        cache.get("key")
+        db_session.commit()
+        assert db_session.get(LLMCacheEntry, "key").hits == 1
+
+    def test_expired_entry_is_ignored_and_replaced(self, db_session):
+        """Test entries older than the TTL miss and are overwritten by set."""
+        cache = LLMResponseCache(db_session, ttl_seconds=60)
+        cache.set("key", {"old": True})
+        db_session.get(LLMCacheEntry, "key").created_at = datetime.now(UTC) - timedelta(hours=1)
+        db_session.commit()
+
+        assert cache.get("key") is None
+        assert cache.stats() == (1, 1, 0)
+
+        cache.set("key", {"old": False})
+        assert cache.get("key") == {"old": False}
+        assert cache.stats() == (1, 0, 1)
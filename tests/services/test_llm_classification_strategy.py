@@ -5,6 +5,7 @@ Tests for LLMClassificationStrategy using pydantic-ai.
 import pytest
 from pydantic import ValidationError
 from pydantic_ai import ModelResponse, TextPart
+from pydantic_ai.exceptions import ModelHTTPError
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 
 from app.services.classification.strategies import (
@@ -30,6 +31,14 @@ class TestLLMClassificationStrategy:
         assert strategy.model == "openai:gpt-4o"
         assert strategy._agent is not None
 
+    def test_strategies_share_resolved_model(self):
+        """Test strategies for the same model reuse one resolved model and client."""
+        first = LLMClassificationStrategy()
+        second = LLMClassificationStrategy()
+
+        assert first._agent.model is second._agent.model
+        assert first._batch_agent.model is first._agent.model
+
     def test_build_message_text_full(self):
         """Test building message text with all fields."""
         strategy = LLMClassificationStrategy()
@@ -418,6 +427,162 @@ class TestLLMClassificationStrategy:
         assert match.score == 0.93
         assert "work-related keywords" in match.explanation.lower()
 
+    def test_build_batch_prompt(self):
+        """Test building the batch prompt with indexed emails and categories."""
+        strategy = LLMClassificationStrategy()
+        messages = [
+            Message(id="msg1", subject="Standup", sender="a@company.com", to=["b@company.com"]),
+            Message(id="msg2", subject="Dinner?", sender="friend@mail.com", to=["b@mail.com"]),
+        ]
+        categories = [Category(id=1, name="Work", description="Work emails")]
+
+        prompt = strategy._build_batch_prompt(messages, categories)
+
+        assert "--- Email [0] ---\nSubject: Standup" in prompt
+        assert "--- Email [1] ---\nSubject: Dinner?" in prompt
+        assert "[0] Work" in prompt
+        assert "message_index" in prompt
+        assert "category_index" in prompt
+
+    async def test_classify_batch_async(self):
+        """Test batch classification makes one call and maps results by message index."""
+        import json
+
+        calls = []
+
+        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
+            calls.append(messages)
+            response = {
+                "results": [
+                    {
+                        "message_index": 1,
+                        "matches": [
+                            {
+                                "category_index": 0,
+                                "is_in_category": True,
+                                "explanation": "Personal invitation",
+                                "confidence": 0.8,
+                            }
+                        ],
+                    },
+                    {
+                        "message_index": 0,
+                        "matches": [
+                            {
+                                "category_index": 0,
+                                "is_in_category": False,
+                                "explanation": "Work meeting",
+                                "confidence": 0.9,
+                            }
+                        ],
+                    },
+                ]
+            }
+            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
+
+        strategy = LLMClassificationStrategy()
+        strategy._batch_agent._model = FunctionModel(mock_model_func)
+
+        messages = [
+            Message(id="msg1", subject="Standup", sender="a@company.com", to=["b@company.com"]),
+            Message(id="msg2", subject="Dinner?", sender="friend@mail.com", to=["b@mail.com"]),
+            Message(id="msg3", subject="Hello", sender="c@mail.com", to=["b@mail.com"]),
+        ]
+        category = Category(id=1, name="Personal", description="Personal emails")
+
+        results = await strategy.classify_batch_async(messages, [category], top_n=3, threshold=0.5)
+
+        assert len(calls) == 1
+        assert len(results) == 3
+        assert results[0] == []
+        assert results[1][0].category == category
+        assert results[1][0].score == 0.8
+        assert results[2] == []  # No result returned for this message
+
+    def test_classify_reuses_cached_response(self, db_session):
+        """Test an identical request is answered from the response cache."""
+        import json
+
+        from app.services.classification import LLMResponseCache
+
+        calls = []
+
+        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
+            calls.append(messages)
+            response = {
+                "matches": [
+                    {
+                        "category_index": 0,
+                        "is_in_category": True,
+                        "explanation": "Work email",
+                        "confidence": 0.9,
+                    }
+                ]
+            }
+            return ModelResponse(parts=[TextPart(content=json.dumps(response))])
+
+        strategy = LLMClassificationStrategy(response_cache=LLMResponseCache(db_session))
+        strategy._agent._model = FunctionModel(mock_model_func)
+        message = Message(id="msg1", subject="Q4", sender="a@company.com", to=["b@company.com"])
+        category = Category(id=1, name="Work", description="Work emails")
+
+        first = strategy.classify(message, [category], top_n=3, threshold=0.5)
+        second = strategy.classify(message, [category], top_n=3, threshold=0.5)
+
+        assert len(calls) == 1
+        assert second == first
+
+    async def test_classify_batch_async_no_categories(self):
+        """Test batch classification with no categories returns empty matches per message."""
+        strategy = LLMClassificationStrategy()
+        messages = [
+            Message(id="msg1", subject="Test", sender="a@example.com", to=["b@example.com"]),
+            Message(id="msg2", subject="Test", sender="a@example.com", to=["b@example.com"]),
+        ]
+
+        results = await strategy.classify_batch_async(messages, [], top_n=3, threshold=0.5)
+
+        assert results == [[], []]
+
+    async def test_classify_async_retries_rate_limit(self, monkeypatch):
+        """Test 429 responses are retried with backoff before succeeding."""
+        monkeypatch.setattr("app.services.classification.strategies.LLM_RETRY_BASE_DELAY", 0)
+        attempts = []
+
+        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
+            attempts.append(messages)
+            if len(attempts) < 3:
+                raise ModelHTTPError(status_code=429, model_name="test")
+            return ModelResponse(parts=[TextPart(content='{"matches": []}')])
+
+        strategy = LLMClassificationStrategy()
+        strategy._agent._model = FunctionModel(mock_model_func)
+        message = Message(id="msg1", subject="Q4", sender="a@company.com", to=["b@company.com"])
+        category = Category(id=1, name="Work", description="Work emails")
+
+        matches = await strategy.classify_async(message, [category], top_n=3, threshold=0.5)
+
+        assert matches == []
+        assert len(attempts) == 3
+
+    async def test_classify_async_does_not_retry_client_errors(self, monkeypatch):
+        """Test non-transient errors (e.g., 400) are raised immediately."""
+        monkeypatch.setattr("app.services.classification.strategies.LLM_RETRY_BASE_DELAY", 0)
+        attempts = []
+
+        def mock_model_func(messages, info: AgentInfo) -> ModelResponse:
+            attempts.append(messages)
+            raise ModelHTTPError(status_code=400, model_name="test")
+
+        strategy = LLMClassificationStrategy()
+        strategy._agent._model = FunctionModel(mock_model_func)
+        message = Message(id="msg1", subject="Q4", sender="a@company.com", to=["b@company.com"])
+        category = Category(id=1, name="Work", description="Work emails")
+
+        with pytest.raises(ModelHTTPError):
+            await strategy.classify_async(message, [category], top_n=3, threshold=0.5)
+        assert len(attempts) == 1
+
 
 class TestCategoryMatchOutput:
     """Test CategoryMatchOutput Pydantic model."""
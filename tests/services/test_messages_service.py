@@ -4,7 +4,15 @@ Tests for app/services/messages_service.py
 
 import json
 
-from app.services.messages_service import ImportOptions, ImportResult, MessagesService
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.messages_service import (
+    ClassificationOptions,
+    ImportOptions,
+    ImportResult,
+    MessagesService,
+)
 from models import Message
 
 
@@ -68,6 +76,44 @@ class TestMessagesService:
         msg = result.preview_messages[0]
         assert msg.body == "First email body"
 
+    def test_import_parses_in_worker_processes(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service, monkeypatch
+    ):
+        """Test import through the process-pool parse path used for large files."""
+        monkeypatch.setattr("app.services.messages_service.PARALLEL_PARSE_MIN_BYTES", 0)
+        service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+
+        result = service.import_from_jsonl(sample_jsonl_file, ImportOptions(drop_existing=True))
+
+        assert result.total_imported == 3
+        assert result.preview_messages[0].body == "First email body"
+        assert len(result.preview_messages[0].embedding) == 1536
+
+    def test_import_streams_in_batches(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service, monkeypatch
+    ):
+        """Test batched import stores every message but only keeps the preview."""
+        monkeypatch.setattr("app.services.messages_service.IMPORT_BATCH_SIZE", 2)
+        monkeypatch.setattr("app.services.messages_service.PREVIEW_SIZE", 2)
+        service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+
+        result = service.import_from_jsonl(sample_jsonl_file, ImportOptions(drop_existing=True))
+
+        assert result.total_imported == 3
+        assert [msg.id for msg in result.preview_messages] == ["msg1", "msg2"]
+        assert db_session.query(Message).count() == 3
+
+    def test_import_preview_readable_after_commit(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service
+    ):
+        """Test that preview messages stay readable once the import session is closed."""
+        service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+
+        result = service.import_from_jsonl(sample_jsonl_file, ImportOptions(drop_existing=True))
+
+        assert [msg.id for msg in result.preview_messages] == ["msg1", "msg2", "msg3"]
+        assert all(msg.categories == [] for msg in result.preview_messages)
+
     def test_import_with_drop_existing(
         self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service
     ):
@@ -139,3 +185,81 @@ class TestMessagesService:
         count = session.query(Message).count()
         assert count == 2
         session.close()
+
+    def test_import_duplicates_without_drop_existing_raises(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service
+    ):
+        """Test re-importing the same messages without dropping fails and keeps the first."""
+        service = MessagesService(db_session, mock_embedding_service, store=sqlite_store)
+        service.import_from_jsonl(sample_jsonl_file, ImportOptions(drop_existing=True))
+
+        with pytest.raises(IntegrityError):
+            service.import_from_jsonl(sample_jsonl_file, ImportOptions(drop_existing=False))
+
+        assert db_session.query(Message).count() == 3
+
+    def test_import_with_auto_classify(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service
+    ):
+        """Test import classifies every imported message when auto_classify is set."""
+        from app.services.categories_service import CategoriesService
+        from app.services.classification import (
+            ClassificationService,
+            EmbeddingSimilarityStrategy,
+        )
+        from models import MessageCategory
+
+        CategoriesService(db_session, mock_embedding_service).create_category(
+            name="Everything", description="Matches all messages"
+        )
+
+        class_session = sqlite_store.create_session()
+        classification_service = ClassificationService(
+            class_session, strategy=EmbeddingSimilarityStrategy(), top_n=1, threshold=-1.0
+        )
+        service = MessagesService(
+            db_session,
+            mock_embedding_service,
+            classification_service=classification_service,
+            store=sqlite_store,
+        )
+        options = ImportOptions(
+            drop_existing=False,
+            classification=ClassificationOptions(auto_classify=True, top_n=1, threshold=-1.0),
+        )
+
+        result = service.import_from_jsonl(sample_jsonl_file, options)
+        class_session.close()
+
+        assert result.total_imported == 3
+        session = sqlite_store.create_session()
+        assert session.query(MessageCategory).count() == 3
+        session.close()
+
+    def test_import_passes_classification_concurrency(
+        self, db_session, sqlite_store, sample_jsonl_file, mock_embedding_service
+    ):
+        """Test the configured concurrency reaches the batch classifier."""
+
+        class RecordingClassificationService:
+            def __init__(self):
+                self.calls = []
+
+            async def classify_in_batches(self, message_ids, max_concurrency=4):
+                self.calls.append((message_ids, max_concurrency))
+                return len(message_ids)
+
+        classification_service = RecordingClassificationService()
+        service = MessagesService(
+            db_session,
+            mock_embedding_service,
+            classification_service=classification_service,
+            store=sqlite_store,
+        )
+        options = ImportOptions(
+            classification=ClassificationOptions(auto_classify=True, max_concurrency=8)
+        )
+
+        service.import_from_jsonl(sample_jsonl_file, options)
+
+        assert classification_service.calls == [(["msg1", "msg2", "msg3"], 8)]
@@ -77,47 +77,29 @@ class TestMessagesServiceCRUD:
         result = service.get_message("nonexistent")
         assert result is None
 
-    def test_list_messages(self, db_session, sqlite_store, mock_embedding_service):
+    def test_list_messages(self, db_session, mock_embedding_service, seed_messages):
         """Test listing all messages."""
         service = MessagesService(db_session, mock_embedding_service)
 
-        for i in range(5):
-            service.create_message(
-                id=f"msg{i}",
-                subject=f"Subject {i}",
-                sender="sender@example.com",
-                to=["recipient@example.com"],
-            )
+        seed_messages(5)
 
         messages = service.list_messages()
         assert len(messages) == 5
 
-    def test_list_messages_with_limit(self, db_session, sqlite_store, mock_embedding_service):
+    def test_list_messages_with_limit(self, db_session, mock_embedding_service, seed_messages):
         """Test listing messages with limit."""
         service = MessagesService(db_session, mock_embedding_service)
 
-        for i in range(10):
-            service.create_message(
-                id=f"msg{i}",
-                subject=f"Subject {i}",
-                sender="sender@example.com",
-                to=["recipient@example.com"],
-            )
+        seed_messages(10)
 
         messages = service.list_messages(limit=3)
         assert len(messages) == 3
 
-    def test_list_messages_with_offset(self, db_session, sqlite_store, mock_embedding_service):
+    def test_list_messages_with_offset(self, db_session, mock_embedding_service, seed_messages):
         """Test listing messages with offset."""
         service = MessagesService(db_session, mock_embedding_service)
 
-        for i in range(10):
-            service.create_message(
-                id=f"msg{i}",
-                subject=f"Subject {i}",
-                sender="sender@example.com",
-                to=["recipient@example.com"],
-            )
+        seed_messages(10)
 
         messages = service.list_messages(offset=5)
         assert len(messages) == 5
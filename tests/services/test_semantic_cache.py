@@ -0,0 +1,119 @@
+"""
+Tests for app/services/classification/semantic_cache.py
+"""
+
+from app.services.classification import SemanticCacheStrategy
+from app.services.classification.strategies import ClassificationMatch, ClassificationStrategy
+from models import Category, Message
+
+
+class CountingStrategy(ClassificationStrategy):
+    """Strategy that matches every category and records which messages it saw."""
+
+    def __init__(self):
+        self.seen: list[str] = []
+
+    def classify(self, message, categories, top_n, threshold):
+        self.seen.append(message.id)
+        return [
+            ClassificationMatch(category=cat, score=0.9, explanation=f"{message.id} fits")
+            for cat in categories[:top_n]
+        ]
+
+
+def _message(message_id: str, embedding: list[float]) -> Message:
+    return Message(
+        id=message_id, subject="Subject", sender="a@example.com", to=[], embedding=embedding
+    )
+
+
+def _categories(db_session) -> list[Category]:
+    categories = [
+        Category(name="Work", description="Work emails", embedding=[1.0, 0.0]),
+        Category(name="Personal", description="Personal emails", embedding=[0.0, 1.0]),
+    ]
+    db_session.add_all(categories)
+    db_session.commit()
+    return categories
+
+
+class TestSemanticCacheStrategy:
+    """Test SemanticCacheStrategy class."""
+
+    def test_similar_message_is_served_from_cache(self, db_session):
+        """Test a near-identical embedding reuses the first classification."""
+        categories = _categories(db_session)
+        inner = CountingStrategy()
+        cache = SemanticCacheStrategy(inner, db_session, similarity_threshold=0.9)
+
+        first = cache.classify(_message("msg1", [1.0, 0.0, 0.1]), categories, 2, 0.5)
+        second = cache.classify(_message("msg2", [1.0, 0.0, 0.11]), categories, 2, 0.5)
+
+        assert inner.seen == ["msg1"]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert [m.category.name for m in second] == [m.category.name for m in first]
+        assert second[0].explanation == "msg1 fits"
+
+    def test_dissimilar_message_misses(self, db_session):
+        """Test an embedding below the similarity threshold calls the wrapped strategy."""
+        categories = _categories(db_session)
+        inner = CountingStrategy()
+        cache = SemanticCacheStrategy(inner, db_session, similarity_threshold=0.9)
+
+        cache.classify(_message("msg1", [1.0, 0.0, 0.0]), categories, 2, 0.5)
+        cache.classify(_message("msg2", [0.0, 1.0, 0.0]), categories, 2, 0.5)
+
+        assert inner.seen == ["msg1", "msg2"]
+
+    def test_changed_settings_miss(self, db_session):
+        """Test cached entries are only reused for the same categories and settings."""
+        categories = _categories(db_session)
+        inner = CountingStrategy()
+        cache = SemanticCacheStrategy(inner, db_session)
+
+        cache.classify(_message("msg1", [1.0, 0.0]), categories, 2, 0.5)
+        cache.classify(_message("msg2", [1.0, 0.0]), categories, 1, 0.5)
+        cache.classify(_message("msg3", [1.0, 0.0]), categories[:1], 2, 0.5)
+
+        assert inner.seen == ["msg1", "msg2", "msg3"]
+
+    def test_entries_persist_across_instances(self, db_session):
+        """Test a new cache instance reads earlier entries from the database."""
+        categories = _categories(db_session)
+        SemanticCacheStrategy(CountingStrategy(), db_session).classify(
+            _message("msg1", [1.0, 0.0]), categories, 2, 0.5
+        )
+
+        inner = CountingStrategy()
+        matches = SemanticCacheStrategy(inner, db_session).classify(
+            _message("msg2", [1.0, 0.0]), categories, 2, 0.5
+        )
+
+        assert inner.seen == []
+        assert len(matches) == 2
+
+    def test_message_without_embedding_bypasses_cache(self, db_session):
+        """Test messages without embeddings always go to the wrapped strategy."""
+        categories = _categories(db_session)
+        inner = CountingStrategy()
+        cache = SemanticCacheStrategy(inner, db_session)
+
+        cache.classify(_message("msg1", None), categories, 2, 0.5)
+        cache.classify(_message("msg2", None), categories, 2, 0.5)
+
+        assert inner.seen == ["msg1", "msg2"]
+
+    async def test_batch_sends_only_misses(self, db_session):
+        """Test batch classification forwards only cache misses, keeping input order."""
+        categories = _categories(db_session)
+        inner = CountingStrategy()
+        cache = SemanticCacheStrategy(inner, db_session)
+        await cache.classify_async(_message("msg1", [1.0, 0.0]), categories, 2, 0.5)
+
+        results = await cache.classify_batch_async(
+            [_message("msg2", [0.0, 1.0]), _message("msg3", [1.0, 0.0])], categories, 2, 0.5
+        )
+
+        assert inner.seen == ["msg1", "msg2"]
+        assert results[0][0].explanation == "msg2 fits"
+        assert results[1][0].explanation == "msg1 fits"
@@ -2,12 +2,19 @@
 Tests for app/stores/sqlite_store.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 
 from sqlalchemy.orm import Session
 
-from app.stores.sqlite_store import SQLiteStore
-from models import Message
+from app.stores.sqlite_store import (
+    POOL_MAX_OVERFLOW,
+    POOL_RECYCLE,
+    POOL_SIZE,
+    SQLiteStore,
+    _pool_options,
+)
+from models import CategoryEmbeddingEntry, Message
 
 
 class TestSQLiteStore:
@@ -19,6 +26,53 @@ class TestSQLiteStore:
         assert store.db_path == temp_db
         assert store.engine is not None
 
+    def test_file_database_uses_sized_pool(self, temp_db):
+        """Test file-backed databases keep a reusable pool of connections."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        assert store.engine.pool.size() == POOL_SIZE
+        assert store.engine.pool._max_overflow == POOL_MAX_OVERFLOW
+
+    def test_pool_reuses_most_recently_returned_connection(self, temp_db):
+        """Test the pool hands out the warmest connection first."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        first, second = store.engine.connect(), store.engine.connect()
+        second_dbapi = second.connection.dbapi_connection
+        first.close()
+        second.close()
+
+        with store.engine.connect() as connection:
+            assert connection.connection.dbapi_connection is second_dbapi
+
+    def test_server_database_pre_pings_and_recycles(self):
+        """Test server databases check and recycle pooled connections; SQLite doesn't."""
+        server = _pool_options("postgresql://localhost/extra")
+        assert server["pool_pre_ping"] is True
+        assert server["pool_recycle"] == POOL_RECYCLE
+        assert "pool_pre_ping" not in _pool_options("sqlite:///messages.db")
+
+    def test_in_memory_database_skips_pool_sizing(self):
+        """Test in-memory SQLite can be created without pool sizing options."""
+        store = SQLiteStore(db_path="sqlite://", echo=False)
+        store.init_db()
+        assert store.engine is not None
+
+    def test_in_memory_database_is_shared_across_threads(self, sample_message):
+        """Test every session of an in-memory store sees the same database."""
+        store = SQLiteStore(db_path="sqlite://", echo=False)
+        store.init_db()
+        with store.bulk_session() as session:
+            session.add(sample_message)
+
+        def count_messages() -> int:
+            session = store.create_session()
+            try:
+                return session.query(Message).count()
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(count_messages).result() == 1
+
     def test_init_db_creates_tables(self, temp_db):
         """Test init_db creates database tables."""
         store = SQLiteStore(db_path=temp_db, echo=False)
@@ -54,6 +108,41 @@ class TestSQLiteStore:
         assert count == 0
         session.close()
 
+    def test_init_db_drop_keeps_content_addressed_caches(self, temp_db):
+        """Test dropping existing data keeps the category embedding cache."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        store.init_db(drop_existing=False)
+
+        session = store.create_session()
+        session.add(
+            CategoryEmbeddingEntry(provider="p", model="m", content_hash="h", vector=b"\x00" * 4)
+        )
+        session.commit()
+        session.close()
+
+        store.init_db(drop_existing=True)
+
+        session = store.create_session()
+        assert session.query(CategoryEmbeddingEntry).count() == 1
+        session.close()
+
+    def test_init_db_skips_create_all_when_schema_exists(self, temp_db, monkeypatch):
+        """Test init_db only runs create_all when a table is missing."""
+        from models import Base
+
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        store.init_db(drop_existing=False)
+
+        calls = []
+        monkeypatch.setattr(Base.metadata, "create_all", lambda *args, **kw: calls.append(args))
+        store.init_db(drop_existing=False)
+        assert calls == []
+
+        with store.engine.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE message_categories")
+        store.init_db(drop_existing=False)
+        assert len(calls) == 1
+
     def test_create_session(self, sqlite_store):
         """Test create_session returns a valid session."""
         session = sqlite_store.create_session()
@@ -69,3 +158,55 @@ class TestSQLiteStore:
         # Generator should close session automatically
         with suppress(StopIteration):
             next(gen)
+
+    def test_connections_use_wal_journal(self, temp_db):
+        """Test file-backed connections are opened with the configured PRAGMAs."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        with store.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            # synchronous=NORMAL is reported as 1
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+    def test_bulk_session_commits(self, sqlite_store, sample_message):
+        """Test bulk_session commits its transaction on exit."""
+        with sqlite_store.bulk_session() as session:
+            session.add(sample_message)
+
+        session = sqlite_store.create_session()
+        assert session.query(Message).count() == 1
+        session.close()
+
+    def test_bulk_session_rolls_back_on_error(self, sqlite_store, sample_message):
+        """Test bulk_session rolls back when the block raises."""
+        with suppress(RuntimeError), sqlite_store.bulk_session() as session:
+            session.add(sample_message)
+            session.flush()
+            raise RuntimeError("boom")
+
+        session = sqlite_store.create_session()
+        assert session.query(Message).count() == 0
+        session.close()
+
+    def test_bulk_session_restores_synchronous(self, temp_db):
+        """Test bulk_session only disables synchronous for the duration of the load."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        with store.bulk_session() as session:
+            # synchronous=OFF is reported as 0
+            assert session.connection().exec_driver_sql("PRAGMA synchronous").scalar() == 0
+
+        with store.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+    def test_bulk_session_restores_synchronous_on_error(self, temp_db):
+        """Test a failed load doesn't return a synchronous=OFF connection to the pool."""
+        store = SQLiteStore(db_path=temp_db, echo=False)
+        with suppress(RuntimeError), store.bulk_session():
+            raise RuntimeError("boom")
+
+        with store.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+    def test_bulk_session_leaves_in_memory_synchronous_alone(self, sqlite_store):
+        """Test the shared in-memory connection is never switched to synchronous=OFF."""
+        with sqlite_store.bulk_session() as session:
+            assert session.connection().exec_driver_sql("PRAGMA synchronous").scalar() == 1
@@ -4,7 +4,10 @@ Tests for models.py
 
 from datetime import datetime
 
-from models import Message
+import numpy as np
+from sqlalchemy import event, text
+
+from models import Category, Message, MessageCategory
 
 
 class TestMessage:
@@ -47,6 +50,11 @@ class TestMessage:
         repr_str = repr(msg)
         assert "test" in repr_str
 
+    def test_message_repr_flattens_line_breaks(self):
+        """Test the body preview in repr stays on one line."""
+        msg = Message(id="test", subject="Test", sender="a@example.com", to=[], body="a\r\nb\nc")
+        assert "body_preview='a b c...'" in repr(msg)
+
     def test_message_database_fields(self, db_session, sample_message):
         """Test Message can be persisted to database."""
         db_session.add(sample_message)
@@ -56,3 +64,73 @@ class TestMessage:
         assert retrieved is not None
         assert retrieved.subject == "Test Subject"
         assert retrieved.sender == "Test Sender <test@example.com>"
+
+    def test_message_categories_str(self):
+        """Test categories_str joins category names and is empty without categories."""
+        msg = Message(id="test", subject="Test", sender="test@example.com", to=[])
+        assert msg.categories_str == ""
+
+        msg.message_categories = [
+            MessageCategory(category=Category(name="Work"), score=0.9, explanation="work"),
+            MessageCategory(category=Category(name="Travel"), score=0.8, explanation="travel"),
+        ]
+        assert msg.categories_str == "Work, Travel"
+
+    def test_message_embedding_stored_as_float32_bytes(self, db_session, sample_message):
+        """Test embeddings are stored as float32 bytes and load back as a list of floats."""
+        sample_message.embedding = [0.5, -0.25, 1.0]
+        db_session.add(sample_message)
+        db_session.commit()
+
+        raw = db_session.execute(text("SELECT embedding FROM messages")).scalar_one()
+        assert raw == np.array([0.5, -0.25, 1.0], dtype=np.float32).tobytes()
+
+        db_session.expire_all()
+        assert db_session.get(Message, "test123").embedding == [0.5, -0.25, 1.0]
+
+    def test_message_categories_load_without_n_plus_one(self, db_session):
+        """Test a plain message query loads every message's categories in one extra SELECT."""
+        category = Category(name="Work", description="Work")
+        for i in range(3):
+            db_session.add(
+                Message(
+                    id=f"msg{i}",
+                    subject=f"Subject {i}",
+                    sender="a@example.com",
+                    to=[],
+                    message_categories=[
+                        MessageCategory(category=category, score=0.9, explanation="work")
+                    ],
+                )
+            )
+        db_session.commit()
+        db_session.expunge_all()
+
+        statements = []
+        event.listen(
+            db_session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        messages = db_session.query(Message).all()
+
+        assert [message.categories_str for message in messages] == ["Work"] * 3
+        assert len(statements) == 2
+
+    def test_message_date_is_indexed(self, db_session):
+        """Test the message list can page by date without sorting the whole table."""
+        plan = db_session.execute(
+            text("EXPLAIN QUERY PLAN SELECT id FROM messages ORDER BY date DESC LIMIT 5")
+        ).all()
+
+        assert any("USING INDEX ix_messages_date" in row[-1] for row in plan)
+
+    def test_message_categories_indexed_by_category(self, db_session):
+        """Test finding a category's assignments probes an index instead of scanning."""
+        plan = db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT message_id FROM message_categories WHERE category_id = 1"
+            )
+        ).all()
+
+        assert any("ix_message_categories_category_message" in row[-1] for row in plan)
@@ -0,0 +1,65 @@
+"""
+Tests for app/utils/console.py
+"""
+
+from io import StringIO
+
+from rich.console import Console
+from rich.table import Table
+
+from app.utils.console import BufferedConsole
+
+
+def _make_console() -> tuple[Console, StringIO]:
+    output = StringIO()
+    return Console(file=output, force_terminal=False, width=80), output
+
+
+class TestBufferedConsole:
+    """Tests for BufferedConsole."""
+
+    def test_write_does_not_print(self):
+        """Test writes are buffered until flush."""
+        console, output = _make_console()
+        buffered = BufferedConsole(console)
+
+        buffered.write("[bold]first[/bold]")
+        buffered.write("second")
+
+        assert output.getvalue() == ""
+
+    def test_flush_prints_once_and_clears(self, monkeypatch):
+        """Test flush issues a single print and empties the buffer."""
+        console, output = _make_console()
+        calls = []
+        original_print = console.print
+        monkeypatch.setattr(
+            console, "print", lambda *args, **kwargs: calls.append(args) or original_print(*args)
+        )
+        buffered = BufferedConsole(console)
+
+        buffered.write("[bold]first[/bold]")
+        buffered.write()
+        buffered.write("second")
+        buffered.flush()
+
+        assert len(calls) == 1
+        assert output.getvalue() == "first\n\nsecond\n"
+
+        # Buffer is cleared, so a second flush prints nothing
+        buffered.flush()
+        assert len(calls) == 1
+
+    def test_write_accepts_renderables(self):
+        """Test tables and other renderables can be buffered alongside markup."""
+        console, output = _make_console()
+        buffered = BufferedConsole(console)
+        table = Table("Name")
+        table.add_row("Work Travel")
+
+        buffered.write("Categories:")
+        buffered.write(table)
+        buffered.flush()
+
+        assert "Categories:" in output.getvalue()
+        assert "Work Travel" in output.getvalue()
@@ -3,12 +3,15 @@ Tests for JSONL parsing utilities.
 """
 
 import base64
+from datetime import timedelta
 
 from app.utils.jsonl_parser import (
     decode_base64_body,
     extract_text_from_html,
     is_html,
+    iter_jsonl_batches,
     parse_iso_date,
+    parse_jsonl,
 )
 
 
@@ -34,6 +37,17 @@ class TestDecodeBase64Body:
         result = decode_base64_body(encoded)
         assert result == html
 
+    def test_decode_base64_body_ignores_line_breaks(self):
+        """Test MIME-style wrapped base64 decodes the same as unwrapped input."""
+        encoded = base64.encodebytes(b"A longer body " * 10).decode("ascii")
+        assert "\n" in encoded
+        assert decode_base64_body(encoded) == "A longer body " * 10
+
+    def test_decode_base64_body_replaces_invalid_utf8(self):
+        """Test invalid UTF-8 bytes are replaced rather than raising."""
+        encoded = base64.b64encode(b"ok \xff").decode("ascii")
+        assert decode_base64_body(encoded) == "ok \ufffd"
+
 
 class TestIsHtml:
     """Tests for HTML detection."""
@@ -236,3 +250,83 @@ class TestParseIsoDate:
         result = parse_iso_date(date_str)
         assert result.year == 2024
         assert result.microsecond == 123456
+
+    def test_parse_iso_date_z_suffix_is_utc(self):
+        """Test the Z suffix yields the same aware datetime as an explicit UTC offset."""
+        assert parse_iso_date("2024-01-15T10:30:00Z") == parse_iso_date("2024-01-15T10:30:00+00:00")
+        assert parse_iso_date("2024-01-15T10:30:00Z").utcoffset() == timedelta(0)
+
+
+class TestParseJsonl:
+    """Tests for JSONL file parsing."""
+
+    def test_parse_jsonl_applies_parser(self, tmp_path):
+        """Test each line is decoded and passed through the parser."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text('{"name": "a"}\n{"name": "b"}\n')
+
+        result = parse_jsonl(file_path, lambda data: data["name"])
+
+        assert result == ["a", "b"]
+
+    def test_parse_jsonl_skips_blank_lines(self, tmp_path):
+        """Test blank and whitespace-only lines are ignored."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text('{"name": "a"}\n\n   \n{"name": "b"}')
+
+        result = parse_jsonl(file_path, lambda data: data["name"])
+
+        assert result == ["a", "b"]
+
+    def test_parse_jsonl_decodes_utf8(self, tmp_path):
+        """Test non-ASCII content is decoded from the raw bytes."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_bytes('{"name": "Hello, 世界!"}\n'.encode())
+
+        result = parse_jsonl(file_path, lambda data: data["name"])
+
+        assert result == ["Hello, 世界!"]
+
+    def test_parse_jsonl_with_workers_preserves_order(self, tmp_path):
+        """Test parsing across worker processes returns results in file order."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text("".join(f'{{"n": {i}}}\n\n' for i in range(50)))
+
+        result = parse_jsonl(file_path, dict, max_workers=2)
+
+        assert result == [{"n": i} for i in range(50)]
+
+    def test_parse_jsonl_empty_file(self, tmp_path):
+        """Test an empty file yields no results."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_bytes(b"")
+
+        assert parse_jsonl(file_path, dict) == []
+
+    def test_parse_jsonl_crlf_and_no_trailing_newline(self, tmp_path):
+        """Test CRLF line endings and a final line without a newline."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_bytes(b'{"name": "a"}\r\n{"name": "b"}')
+
+        result = parse_jsonl(file_path, lambda data: data["name"])
+
+        assert result == ["a", "b"]
+
+    def test_iter_jsonl_batches_bounds_batch_size(self, tmp_path):
+        """Test streaming yields batches of at most batch_size, in file order."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text("".join(f'{{"n": {i}}}\n' for i in range(5)))
+
+        batches = list(iter_jsonl_batches(file_path, lambda data: data["n"], batch_size=2))
+
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_iter_jsonl_batches_with_workers(self, tmp_path):
+        """Test streaming across worker processes keeps batches in file order."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text("".join(f'{{"n": {i}}}\n' for i in range(25)))
+
+        batches = list(iter_jsonl_batches(file_path, dict, batch_size=10, max_workers=2))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [item for batch in batches for item in batch] == [{"n": i} for i in range(25)]